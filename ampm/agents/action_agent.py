@@ -16,7 +16,7 @@ from datetime import datetime, timedelta
 
 from cerebras.cloud.sdk import Cerebras
 
-from ..models import ActionItem, ActionStatus, Blocker
+from ..models import ActionItem, ActionStatus, Blocker, person_id_for
 from ..core.graph import MeetingGraph
 
 
@@ -70,7 +70,7 @@ class ActionAgent:
 
     def get_actions_for_person(self, person_name: str) -> list[ActionItem]:
         """Get all action items assigned to a person."""
-        person_id = person_name.lower().replace(" ", "_")
+        person_id = person_id_for(person_name)
         return self.graph.get_action_items_by_person(person_id)
 
     def get_actions_due_soon(self, days: int = 7) -> list[ActionItem]:
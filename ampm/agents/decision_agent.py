@@ -16,7 +16,7 @@ from datetime import datetime
 
 from cerebras.cloud.sdk import Cerebras
 
-from ..models import Decision, DecisionStatus
+from ..models import Decision, DecisionStatus, person_id_for
 from ..core.graph import MeetingGraph
 
 
@@ -131,12 +131,9 @@ If they conflict, explain briefly. If not, say NO_CONFLICT."""
         old_decision.status = DecisionStatus.SUPERSEDED
         old_decision.superseded_by = new_decision.id
 
-        # Add relationship to graph
-        self.graph.graph.add_edge(
-            new_decision.id,
-            old_decision_id,
-            relation="supersedes"
-        )
+        # Add relationship to graph (also tells its listeners about the
+        # status change above)
+        self.graph.add_supersedes(new_decision.id, old_decision_id)
 
         return True
 
@@ -162,7 +159,7 @@ If they conflict, explain briefly. If not, say NO_CONFLICT."""
 
     def get_decisions_by_person(self, person_name: str) -> list[Decision]:
         """Get all decisions made by a person."""
-        person_id = person_name.lower().replace(" ", "_")
+        person_id = person_id_for(person_name)
         return self.graph.get_decisions_by_person(person_id)
 
     def summarize_decisions(self, topic: str) -> str:
@@ -17,7 +17,7 @@ from datetime import datetime
 
 from ..models import (
     Meeting, Decision, ActionItem, Blocker, Update, Learning,
-    Person, MeetingType, DecisionStatus, ActionStatus
+    Person, MeetingType, DecisionStatus, ActionStatus, person_id_for
 )
 from ..core.graph import MeetingGraph
 from ..core.embeddings import EmbeddingStore
@@ -59,10 +59,45 @@ class MeetingAgent:
             except ImportError:
                 pass
 
-    def process_meeting_data(self, data: dict) -> Meeting:
+    def prepare_meeting_data(self, data: dict) -> dict:
+        """
+        Fill in structured data for a transcript-only meeting (uses LLM).
+
+        Does not touch the graph, so it is safe to run for several
+        meetings in parallel before process_meeting_data().
+
+        Returns:
+            The meeting data, merged with anything extracted
+        """
+        transcript = data.get("transcript")
+        has_structured_data = any([
+            data.get("decisions"),
+            data.get("action_items"),
+            data.get("blockers")
+        ])
+
+        # Auto-extract from transcript if needed (can be slow - uses LLM)
+        if transcript and not has_structured_data and not getattr(self, 'skip_extraction', False):
+            print(f"  Extracting entities from transcript for {data.get('title', 'meeting')}...")
+            try:
+                extracted = self.extract_from_transcript(transcript, data.get("title", "Meeting"))
+                # Merge extracted data
+                data = {**data, **extracted}
+            except Exception as e:
+                print(f"  Warning: Could not extract from transcript: {e}")
+
+        return data
+
+    def process_meeting_data(self, data: dict, defer_indexing: bool = False,
+                             prepared: bool = False) -> Meeting:
         """
         Process a meeting from JSON data format.
 
+        With defer_indexing=True, search documents are queued on the
+        embedding store instead of indexed one by one; call
+        embeddings.flush() to index them in bulk. Pass prepared=True if
+        prepare_meeting_data() already ran on the data.
+
         Expected format:
         {
             "id": "meeting_001",
@@ -96,23 +131,10 @@ class MeetingAgent:
         except ValueError:
             date = datetime.now()
 
-        # Check if we have transcript but no structured data
+        # Extract structured data from a bare transcript if needed
+        if not prepared:
+            data = self.prepare_meeting_data(data)
         transcript = data.get("transcript")
-        has_structured_data = any([
-            data.get("decisions"),
-            data.get("action_items"),
-            data.get("blockers")
-        ])
-        
-        # Auto-extract from transcript if needed (can be slow - uses LLM)
-        if transcript and not has_structured_data and not getattr(self, 'skip_extraction', False):
-            print(f"  Extracting entities from transcript for {data.get('title', 'meeting')}...")
-            try:
-                extracted = self.extract_from_transcript(transcript, data.get("title", "Meeting"))
-                # Merge extracted data
-                data = {**data, **extracted}
-            except Exception as e:
-                print(f"  Warning: Could not extract from transcript: {e}")
 
         # Create meeting
         meeting = Meeting(
@@ -136,7 +158,7 @@ class MeetingAgent:
 
         # Process decisions
         for dec_data in data.get("decisions", []):
-            decision = self._process_decision(dec_data, meeting_id)
+            decision = self._process_decision(dec_data, meeting_id, defer_indexing)
             meeting.decisions.append(decision.id)
 
         # Process action items
@@ -164,7 +186,7 @@ class MeetingAgent:
 
         # Index for search
         if self.embeddings:
-            self._index_meeting(meeting)
+            self._index_meeting(meeting, defer_indexing)
 
         return meeting
 
@@ -192,7 +214,7 @@ class MeetingAgent:
     def _get_or_create_person(self, name: str) -> Person:
         """Get existing person or create new one."""
         # Simple ID from name
-        person_id = name.lower().replace(" ", "_")
+        person_id = person_id_for(name)
 
         existing = self.graph.get_person(person_id)
         if existing:
@@ -202,7 +224,8 @@ class MeetingAgent:
         self.graph.add_person(person)
         return person
 
-    def _process_decision(self, data: dict, meeting_id: str) -> Decision:
+    def _process_decision(self, data: dict, meeting_id: str,
+                          defer_indexing: bool = False) -> Decision:
         """Process a decision from meeting data."""
         decision_id = data.get("id", f"decision_{datetime.now().timestamp()}")
 
@@ -240,7 +263,8 @@ class MeetingAgent:
                 content=decision.content,
                 rationale=decision.rationale or "",
                 meeting_id=meeting_id,
-                topic=decision.topic or ""
+                topic=decision.topic or "",
+                defer=defer_indexing
             )
 
         return decision
@@ -339,7 +363,7 @@ class MeetingAgent:
 
         return learning
 
-    def _index_meeting(self, meeting: Meeting) -> None:
+    def _index_meeting(self, meeting: Meeting, defer: bool = False) -> None:
         """Index meeting content for semantic search."""
         if not self.embeddings:
             return
@@ -360,7 +384,8 @@ class MeetingAgent:
             meeting_id=meeting.id,
             title=meeting.title,
             content=content,
-            date=str(meeting.date)
+            date=str(meeting.date),
+            defer=defer
         )
 
     def extract_from_transcript(self, transcript: str, meeting_title: str) -> dict:
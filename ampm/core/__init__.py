@@ -8,6 +8,8 @@ Components:
 - embeddings: Vector embeddings for semantic search
 - query: Context retrieval ("Why did we decide X?")
 - ripple: Change impact detection
+- cache: LRU/TTL cache for query results
+- http: Shared HTTP connection pool for LLM clients
 """
 
 from .graph import MeetingGraph
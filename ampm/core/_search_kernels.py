@@ -0,0 +1,63 @@
+"""
+Search Kernels
+==============
+Compiled inner loops for local embedding search.
+
+Requires numba. Without it NUMBA_AVAILABLE is False and callers keep
+their NumPy path.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def topk_cosine_int8(rows, scales, query, k):
+        """
+        Indices of the k rows scoring highest against an int8 query.
+
+        Args:
+            rows: (N, d) int8 quantized, row-normalized embeddings
+            scales: (N,) float32 per-row dequantization scales
+            query: (d,) int8 quantized query
+            k: Number of indices to return
+
+        Returns:
+            int64 array of up to k row indices, best first
+        """
+        n, d = rows.shape
+        scores = np.empty(n, dtype=np.float32)
+        for i in prange(n):
+            acc = 0
+            for j in range(d):
+                acc += np.int32(rows[i, j]) * np.int32(query[j])
+            scores[i] = acc * scales[i]
+
+        # Bounded selection: keep the k best, replacing the current minimum
+        k = min(k, n)
+        top_idx = np.empty(k, dtype=np.int64)
+        top_val = np.empty(k, dtype=np.float32)
+        min_pos = 0
+        for i in range(n):
+            score = scores[i]
+            if i < k:
+                top_idx[i] = i
+                top_val[i] = score
+                if score < top_val[min_pos]:
+                    min_pos = i
+            elif score > top_val[min_pos]:
+                top_idx[min_pos] = i
+                top_val[min_pos] = score
+                for j in range(k):
+                    if top_val[j] < top_val[min_pos]:
+                        min_pos = j
+
+        order = np.argsort(-top_val)
+        return top_idx[order]
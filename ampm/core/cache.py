@@ -0,0 +1,208 @@
+"""
+Query Result Cache
+==================
+Thread-safe LRU cache with TTL expiry for query results.
+
+Repeated questions ("Why did we choose Stripe?") are common in a meeting
+assistant, and every miss costs a full search + LLM round trip. Entries
+expire after a TTL and the whole cache is cleared when the graph changes.
+
+SemanticCache extends this to rephrased questions by matching on question
+embeddings instead of text.
+"""
+
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+import numpy as np
+
+
+class QueryCache:
+    """
+    LRU cache with per-entry TTL, guarded by a re-entrant lock.
+
+    Tracks hits and misses so callers can report a hit rate.
+    """
+
+    def __init__(self, max_size: int = 512, ttl_seconds: float = 300):
+        """
+        Initialize the cache.
+
+        Args:
+            max_size: Maximum number of entries before LRU eviction
+            ttl_seconds: Seconds an entry stays valid after it is stored
+        """
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.RLock()
+        self._hits = 0
+        self._misses = 0
+
+    @staticmethod
+    def make_key(question: str, top_k: Hashable) -> str:
+        """Build a cache key from a normalized question and top_k."""
+        normalized = question.strip().lower()
+        # NUL-separated, so ("q1", 5) and ("q", 15) stay distinct
+        return hashlib.blake2b(f"{normalized}\x00{top_k}".encode()).hexdigest()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value, or None on a miss or expired entry."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            stored_at, value = entry
+            if time.time() - stored_at > self.ttl_seconds:
+                del self._entries[key]
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the least recently used entry if full."""
+        with self._lock:
+            self._entries[key] = (time.time(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        """Remove a single entry if present."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries (hit/miss counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        """Get hit/miss statistics."""
+        with self._lock:
+            total = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / total if total else 0.0,
+                "size": len(self._entries),
+                "max_size": self.max_size,
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SemanticCache:
+    """
+    Cache keyed on question embeddings, for near-duplicate questions.
+
+    A lookup hits when a stored question's embedding has cosine similarity
+    of at least `threshold` with the new one, so "Why did we choose
+    Stripe?" and "why'd we pick stripe" share an answer. Entries sit in a
+    fixed-size ring (oldest overwritten first); a lookup is one
+    matrix-vector product over at most max_size rows.
+    """
+
+    def __init__(self, threshold: float = 0.95, max_size: int = 256,
+                 ttl_seconds: float = 300):
+        """
+        Initialize the cache.
+
+        Args:
+            threshold: Minimum cosine similarity for a hit
+            max_size: Number of entries kept
+            ttl_seconds: Seconds an entry stays valid after it is stored
+        """
+        self.threshold = threshold
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._vectors: Optional[np.ndarray] = None  # (max_size, dim) unit rows
+        self._entries: list[Optional[tuple[float, Hashable, Any]]] = [None] * max_size
+        self._next = 0
+        self._lock = threading.RLock()
+        self._hits = 0
+        self._misses = 0
+
+    @staticmethod
+    def _unit(embedding) -> Optional[np.ndarray]:
+        """Embedding as a unit float32 vector (None if empty or zero)."""
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = float(np.linalg.norm(vector)) if vector.size else 0.0
+        return vector / norm if norm else None
+
+    def get(self, embedding, scope: Hashable = None) -> Optional[Any]:
+        """
+        Return the value stored for the most similar question, or None.
+
+        Only entries stored with the same scope (e.g. top_k) can match.
+        """
+        with self._lock:
+            vector = self._unit(embedding)
+            if (self._vectors is None or vector is None
+                    or len(vector) != self._vectors.shape[1]):
+                self._misses += 1
+                return None
+
+            scores = self._vectors @ vector
+            now = time.time()
+            for row in np.argsort(-scores):
+                if scores[row] < self.threshold:
+                    break
+                entry = self._entries[row]
+                if entry is None:
+                    continue
+                stored_at, entry_scope, value = entry
+                if entry_scope == scope and now - stored_at <= self.ttl_seconds:
+                    self._hits += 1
+                    return value
+
+            self._misses += 1
+            return None
+
+    def put(self, embedding, value: Any, scope: Hashable = None) -> None:
+        """Store a value under a question embedding, replacing the oldest entry if full."""
+        with self._lock:
+            vector = self._unit(embedding)
+            if vector is None:
+                return
+            if self._vectors is None or len(vector) != self._vectors.shape[1]:
+                # First entry (or a new embedding model): size the ring
+                self._vectors = np.zeros((self.max_size, len(vector)), dtype=np.float32)
+                self._entries = [None] * self.max_size
+                self._next = 0
+
+            self._vectors[self._next] = vector
+            self._entries[self._next] = (time.time(), scope, value)
+            self._next = (self._next + 1) % self.max_size
+
+    def clear(self) -> None:
+        """Remove all entries (hit/miss counters are kept)."""
+        with self._lock:
+            if self._vectors is not None:
+                self._vectors.fill(0.0)
+            self._entries = [None] * self.max_size
+            self._next = 0
+
+    def stats(self) -> dict:
+        """Get hit/miss statistics."""
+        with self._lock:
+            total = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / total if total else 0.0,
+                "size": len(self),
+                "max_size": self.max_size,
+            }
+
+    def __len__(self) -> int:
+        return sum(entry is not None for entry in self._entries)
@@ -14,6 +14,8 @@ Falls back to local OpenAI embeddings for offline use.
 
 import os
 import json
+import hashlib
+from collections import OrderedDict
 from typing import Optional
 from dataclasses import dataclass
 
@@ -24,6 +26,13 @@ try:
 except ImportError:
     REQUESTS_AVAILABLE = False
 
+# Faster JSON (optional)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Local fallback
 try:
     import numpy as np
@@ -32,6 +41,62 @@ try:
 except ImportError:
     LOCAL_AVAILABLE = False
 
+# Approximate nearest-neighbour index for large local stores
+try:
+    import hnswlib
+    HNSWLIB_AVAILABLE = True
+except ImportError:
+    HNSWLIB_AVAILABLE = False
+
+# Compiled scan kernel for the exact search path
+try:
+    from ._search_kernels import NUMBA_AVAILABLE
+    if NUMBA_AVAILABLE:
+        from ._search_kernels import topk_cosine_int8
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Texts per embeddings API call when indexing in bulk
+EMBED_BATCH_SIZE = 256
+
+# Content-hash -> vector entries kept so re-indexed text is not re-embedded
+VECTOR_CACHE_SIZE = 5000
+
+
+def _write_json(filepath: str, data) -> None:
+    """Write JSON, through orjson's C encoder when available (float-heavy payloads)."""
+    if ORJSON_AVAILABLE:
+        with open(filepath, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY))
+    else:
+        with open(filepath, 'w') as f:
+            json.dump(data, f)
+
+
+def _read_json(filepath: str):
+    """Read JSON written by _write_json()."""
+    if ORJSON_AVAILABLE:
+        with open(filepath, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(filepath, 'r') as f:
+        return json.load(f)
+
+
+def _save_matrix(filepath: str, rows) -> None:
+    """
+    Save vectors as one float16 .npy matrix.
+
+    Written to a temp file and swapped in: rows loaded from the old file
+    are still mapped and must not see it truncated.
+    """
+    matrix = np.asarray(rows, dtype=np.float16)
+    if not len(matrix):
+        matrix = np.zeros((0, 0), dtype=np.float16)
+    tmp_path = filepath + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        np.save(f, matrix)
+    os.replace(tmp_path, filepath)
+
 
 @dataclass
 class SearchResult:
@@ -97,7 +162,12 @@ class EmbeddingStore:
 
         # Local fallback
         self._documents: list[dict] = []
-        self._embeddings: list[list[float]] = []
+        self._embeddings = []  # Float lists, or the (N, d) float16 memmap of a loaded .npy
+        self._matrix = None  # Row-normalized np.ndarray of _embeddings, built on demand
+        self._quantized = None  # (int8 rows, per-row scales) for the exact scan, built on demand
+        self._ann_index = None  # hnswlib index over _embeddings, see build_ann_index()
+        self._pending: list[tuple[str, str, dict]] = []  # Deferred adds, see flush()
+        self._vector_cache: OrderedDict[str, list[float]] = OrderedDict()  # SHA-256(content) -> vector (list or row)
         self._openai = None
 
         # Always initialize local OpenAI client as fallback for embeddings
@@ -390,13 +460,85 @@ class EmbeddingStore:
         )
         return response.data[0].embedding
 
+    def _get_embeddings(self, texts: list[str]) -> list[list[float]]:
+        """Get embeddings for several texts in one OpenAI call."""
+        if not LOCAL_AVAILABLE or not self._openai or not texts:
+            return []
+
+        response = self._openai.embeddings.create(
+            model="text-embedding-3-small",
+            input=texts
+        )
+        return [item.embedding for item in sorted(response.data, key=lambda d: d.index)]
+
+    def _embed_documents(self, contents: list[str]) -> list[list[float]]:
+        """
+        Embed document texts, reusing vectors for previously seen content.
+
+        Cache misses are embedded in batches of EMBED_BATCH_SIZE.
+        """
+        keys = [hashlib.sha256(content.encode()).hexdigest() for content in contents]
+        cache = self._vector_cache
+
+        missing = {}
+        for key, content in zip(keys, contents):
+            if key not in cache:
+                missing.setdefault(key, content)
+
+        miss_keys = list(missing)
+        for start in range(0, len(miss_keys), EMBED_BATCH_SIZE):
+            chunk = miss_keys[start:start + EMBED_BATCH_SIZE]
+            for key, vector in zip(chunk, self._get_embeddings([missing[k] for k in chunk])):
+                cache[key] = vector
+
+        vectors = []
+        for key in keys:
+            vector = cache.get(key, [])
+            if len(vector):  # Float list, or a float16 row of a loaded cache
+                cache.move_to_end(key)
+            vectors.append(vector)
+
+        while len(cache) > VECTOR_CACHE_SIZE:
+            cache.popitem(last=False)
+
+        if len(contents) > 1:
+            print(f"EmbeddingStore: embedded {len(contents)} documents "
+                  f"(reused={len(contents) - len(missing)} new={len(missing)})")
+        return vectors
+
+    def _normalized_matrix(self):
+        """Stored embeddings as a row-normalized (N, d) matrix (cached)."""
+        if self._matrix is None or len(self._matrix) != len(self._embeddings):
+            matrix = np.asarray(self._embeddings, dtype=np.float32)
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            norms[norms == 0] = 1.0
+            self._matrix = matrix / norms
+        return self._matrix
+
+    def _quantized_matrix(self):
+        """
+        Row-normalized embeddings scalar-quantized to int8 (cached).
+
+        Returns (rows, scales) with rows[i] * scales[i] ~= normalized row i.
+        """
+        if self._quantized is None or len(self._quantized[0]) != len(self._embeddings):
+            matrix = np.asarray(self._embeddings, dtype=np.float32)
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            norms[norms == 0] = 1.0
+            matrix /= norms
+            scales = (np.abs(matrix).max(axis=1) / 127).astype(np.float32)
+            scales[scales == 0] = 1.0
+            rows = np.round(matrix / scales[:, None]).astype(np.int8)
+            self._quantized = (rows, scales)
+        return self._quantized
+
     def _cosine_similarity(self, a: list[float], b: list[float]) -> float:
         """Compute cosine similarity between two vectors."""
         if not LOCAL_AVAILABLE:
             return 0.0
 
-        a_np = np.array(a)
-        b_np = np.array(b)
+        a_np = np.asarray(a, dtype=np.float64)
+        b_np = np.asarray(b, dtype=np.float64)  # Loaded rows are float16
         return float(np.dot(a_np, b_np) / (np.linalg.norm(a_np) * np.linalg.norm(b_np)))
 
     def add_local(self, doc_id: str, content: str, metadata: dict) -> bool:
@@ -404,29 +546,93 @@ class EmbeddingStore:
         if not LOCAL_AVAILABLE or not self._openai:
             return False
 
-        embedding = self._get_embedding(content)
+        embedding = self._embed_documents([content])[0]
         self._documents.append({
             "id": doc_id,
             "content": content,
             "metadata": metadata
         })
-        self._embeddings.append(embedding)
+        self._append_embeddings([embedding])
+        self._matrix = None
+        self._quantized = None
+        if self._ann_index is not None:
+            self._add_to_ann_index(len(self._embeddings) - 1)
         return True
 
+    def add_local_batch(self, doc_ids: list[str], contents: list[str],
+                        metadatas: list[dict]) -> int:
+        """
+        Add several documents to the local store.
+
+        Embeds in chunks of EMBED_BATCH_SIZE texts per API call instead of
+        one call per document, skipping texts already in the vector cache.
+
+        Returns:
+            Number of documents added
+        """
+        if not LOCAL_AVAILABLE or not self._openai or not doc_ids:
+            return 0
+
+        embeddings = self._embed_documents(contents)
+
+        first_row = len(self._embeddings)
+        self._documents.extend(
+            {"id": doc_id, "content": content, "metadata": metadata}
+            for doc_id, content, metadata in zip(doc_ids, contents, metadatas)
+        )
+        self._append_embeddings(embeddings)
+        self._matrix = None
+        self._quantized = None
+        if self._ann_index is not None:
+            self._add_to_ann_index(first_row)
+        return len(doc_ids)
+
+    def _append_embeddings(self, embeddings: list[list[float]]) -> None:
+        """Append rows to the stored embeddings."""
+        if isinstance(self._embeddings, list):
+            self._embeddings.extend(embeddings)
+        else:
+            # Loaded matrix: copied into memory once per add, not per row
+            self._embeddings = np.vstack(
+                [self._embeddings, np.asarray(embeddings, dtype=np.float32)]
+            )
+
     def search_local(self, query: str, top_k: int = 5) -> list[SearchResult]:
         """Search documents locally."""
         if not LOCAL_AVAILABLE or not self._documents:
             return []
 
         query_embedding = self._get_embedding(query)
+        return self.search_by_vector(query_embedding, top_k)
+
+    def search_by_vector(self, query_embedding: list[float], top_k: int = 5) -> list[SearchResult]:
+        """Search documents locally with a precomputed query embedding."""
+        if not LOCAL_AVAILABLE or not self._documents or not len(query_embedding):
+            return []
+
+        if self._ann_ready():
+            return self._search_ann([query_embedding], top_k)[0]
+
+        # Approximate scores from the int8 matrix (int32 accumulation),
+        # then exact cosine on the best 4 * top_k candidates
+        rows, scales = self._quantized_matrix()
+        query = np.asarray(query_embedding, dtype=np.float32)
+        q_scale = 127 / max(float(np.abs(query).max()), 1e-12)
+        q_i8 = np.round(query * q_scale).astype(np.int8)
 
-        # Compute similarities
-        similarities = []
-        for i, doc_embedding in enumerate(self._embeddings):
-            score = self._cosine_similarity(query_embedding, doc_embedding)
-            similarities.append((i, score))
+        n_candidates = min(4 * top_k, len(rows))
+        if n_candidates <= 0:
+            return []
+        if NUMBA_AVAILABLE:
+            candidates = topk_cosine_int8(rows, scales, q_i8, n_candidates)
+        else:
+            approx = np.einsum("ij,j->i", rows, q_i8, dtype=np.int32) * scales
+            candidates = np.argpartition(-approx, n_candidates - 1)[:n_candidates]
 
-        # Sort by score
+        similarities = [
+            (int(i), self._cosine_similarity(query_embedding, self._embeddings[i]))
+            for i in candidates
+        ]
         similarities.sort(key=lambda x: x[1], reverse=True)
 
         # Return top_k
@@ -443,9 +649,125 @@ class EmbeddingStore:
 
         return results
 
+    def batch_search_by_vector(self, query_embeddings: list[list[float]],
+                               top_k: int = 5) -> list[list[SearchResult]]:
+        """
+        Search documents locally for several query embeddings at once.
+
+        Scores every query against every document with one (B, d) x (d, N)
+        matmul, then takes each row's top_k with argpartition.
+        """
+        if not LOCAL_AVAILABLE or not self._documents or not len(query_embeddings):
+            return [[] for _ in query_embeddings]
+
+        if self._ann_ready():
+            return self._search_ann(query_embeddings, top_k)
+
+        queries = np.asarray(query_embeddings, dtype=np.float32)
+        norms = np.linalg.norm(queries, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        scores = (queries / norms) @ self._normalized_matrix().T
+
+        k = min(top_k, scores.shape[1])
+        if k <= 0:
+            return [[] for _ in query_embeddings]
+        top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+
+        batch_results = []
+        for row, candidates in zip(scores, top):
+            ranked = candidates[np.argsort(-row[candidates])]
+            results = []
+            for i in ranked:
+                doc = self._documents[i]
+                results.append(SearchResult(
+                    id=doc["id"],
+                    content=doc["content"],
+                    score=float(row[i]),
+                    metadata=doc["metadata"],
+                    source=doc["metadata"].get("source", "unknown")
+                ))
+            batch_results.append(results)
+
+        return batch_results
+
+    # ==================== ANN Index ====================
+
+    def build_ann_index(self, M: int = 16, ef_construction: int = 200) -> bool:
+        """
+        Build an HNSW index over the local embeddings.
+
+        Once built, local searches query the index instead of scoring
+        every stored vector. Documents added later are inserted into it.
+
+        Args:
+            M: Graph connectivity (higher = better recall, more memory)
+            ef_construction: Build-time search width
+
+        Returns:
+            True if the index was built
+        """
+        if not HNSWLIB_AVAILABLE or not LOCAL_AVAILABLE or not len(self._embeddings):
+            return False
+
+        matrix = np.asarray(self._embeddings, dtype=np.float32)
+        index = hnswlib.Index(space="cosine", dim=matrix.shape[1])
+        index.init_index(max_elements=len(matrix), ef_construction=ef_construction, M=M)
+        index.add_items(matrix, np.arange(len(matrix)))
+        index.set_ef(64)
+
+        self._ann_index = index
+        print(f"EmbeddingStore: ANN index built ({len(matrix)} vectors)")
+        return True
+
+    def _add_to_ann_index(self, first_row: int) -> None:
+        """Insert stored embeddings from first_row on into the ANN index, growing it if full."""
+        index = self._ann_index
+        count = len(self._embeddings)
+        if count > index.get_max_elements():
+            index.resize_index(max(2 * index.get_max_elements(), count))
+        index.add_items(
+            np.asarray(self._embeddings[first_row:], dtype=np.float32),
+            np.arange(first_row, count)
+        )
+
+    def _ann_ready(self) -> bool:
+        """Whether the ANN index covers every stored document."""
+        return (
+            self._ann_index is not None
+            and self._ann_index.get_current_count() == len(self._documents)
+        )
+
+    def _search_ann(self, query_embeddings: list[list[float]],
+                    top_k: int) -> list[list[SearchResult]]:
+        """Search the ANN index for one or more query embeddings."""
+        k = min(top_k, len(self._documents))
+        if k <= 0:
+            return [[] for _ in query_embeddings]
+
+        self._ann_index.set_ef(max(64, k))
+        labels, distances = self._ann_index.knn_query(
+            np.asarray(query_embeddings, dtype=np.float32), k=k
+        )
+
+        batch_results = []
+        for row_labels, row_distances in zip(labels, distances):
+            results = []
+            for i, distance in zip(row_labels, row_distances):
+                doc = self._documents[i]
+                results.append(SearchResult(
+                    id=doc["id"],
+                    content=doc["content"],
+                    score=1.0 - float(distance),
+                    metadata=doc["metadata"],
+                    source=doc["metadata"].get("source", "unknown")
+                ))
+            batch_results.append(results)
+
+        return batch_results
+
     # ==================== Public Interface ====================
 
-    def add(self, doc_id: str, content: str, metadata: dict) -> bool:
+    def add(self, doc_id: str, content: str, metadata: dict, defer: bool = False) -> bool:
         """
         Add a document for semantic search.
 
@@ -453,12 +775,58 @@ class EmbeddingStore:
             doc_id: Unique document identifier
             content: Text content to index
             metadata: Additional metadata (source, date, etc.)
+            defer: Queue the document until flush() instead of indexing now
         """
+        if defer:
+            self._pending.append((doc_id, content, metadata))
+            return True
+
         if self.use_backboard and self.backboard_api_key:
             return self.add_to_backboard(doc_id, content, metadata)
         else:
             return self.add_local(doc_id, content, metadata)
 
+    def add_document(self, doc_id: str, content: str, metadata: dict,
+                     defer: bool = False) -> bool:
+        """Add a document for semantic search (alias of add())."""
+        return self.add(doc_id, content, metadata, defer=defer)
+
+    def add_documents(self, doc_ids: list[str], contents: list[str],
+                      metadatas: list[dict]) -> int:
+        """
+        Add several documents for semantic search.
+
+        Locally, the texts are embedded in batched API calls. Backboard
+        has no batch endpoint, so each document is stored in turn.
+
+        Returns:
+            Number of documents added
+        """
+        if self.use_backboard and self.backboard_api_key:
+            return sum(
+                self.add_to_backboard(doc_id, content, metadata)
+                for doc_id, content, metadata in zip(doc_ids, contents, metadatas)
+            )
+        return self.add_local_batch(doc_ids, contents, metadatas)
+
+    def flush(self) -> int:
+        """
+        Index all documents queued with defer=True.
+
+        Returns:
+            Number of documents added
+        """
+        if not self._pending:
+            return 0
+
+        pending, self._pending = self._pending, []
+        doc_ids, contents, metadatas = (list(column) for column in zip(*pending))
+        return self.add_documents(doc_ids, contents, metadatas)
+
+    def embed_text(self, text: str) -> list[float]:
+        """Embed text with the local embedding model ([] if unavailable)."""
+        return self._get_embedding(text)
+
     def search(self, query: str, top_k: int = 5) -> list[SearchResult]:
         """
         Search for relevant documents.
@@ -479,7 +847,34 @@ class EmbeddingStore:
 
         return self.search_local(query, top_k)
 
-    def index_meeting(self, meeting_id: str, title: str, content: str, date: str) -> bool:
+    def batch_search(self, queries: list[str], top_k: int = 5) -> list[list[SearchResult]]:
+        """
+        Search for several queries at once.
+
+        Locally, all queries are embedded in one API call and scored in
+        one matrix multiply; repeated queries are embedded and scored
+        once. Backboard has no batch endpoint, so each query is searched
+        in turn.
+
+        Returns:
+            One list of SearchResult per query, in input order
+        """
+        if self.use_backboard and self.backboard_api_key:
+            return [self.search(query, top_k) for query in queries]
+
+        if not LOCAL_AVAILABLE or not self._documents:
+            return [[] for _ in queries]
+
+        unique = list(dict.fromkeys(queries))
+        results = self.batch_search_by_vector(self._get_embeddings(unique), top_k)
+        if len(unique) == len(queries):
+            return results
+
+        by_query = dict(zip(unique, results))
+        return [list(by_query.get(query, [])) for query in queries]
+
+    def index_meeting(self, meeting_id: str, title: str, content: str, date: str,
+                      defer: bool = False) -> bool:
         """Index a meeting for search."""
         return self.add(
             doc_id=f"meeting:{meeting_id}",
@@ -489,11 +884,12 @@ class EmbeddingStore:
                 "meeting_id": meeting_id,
                 "title": title,
                 "date": date
-            }
+            },
+            defer=defer
         )
 
     def index_decision(self, decision_id: str, content: str, rationale: str,
-                       meeting_id: str, topic: str) -> bool:
+                       meeting_id: str, topic: str, defer: bool = False) -> bool:
         """Index a decision for search."""
         return self.add(
             doc_id=f"decision:{decision_id}",
@@ -503,7 +899,8 @@ class EmbeddingStore:
                 "decision_id": decision_id,
                 "meeting_id": meeting_id,
                 "topic": topic
-            }
+            },
+            defer=defer
         )
 
     @property
@@ -516,6 +913,9 @@ class EmbeddingStore:
     def save(self, filepath: str) -> None:
         """
         Save the embedding store to a file.
+
+        Documents go to the JSON file; the vectors go next to it as a
+        float16 .npy matrix, which load() memory-maps instead of parsing.
         
         Args:
             filepath: Path to save (JSON format)
@@ -524,14 +924,26 @@ class EmbeddingStore:
         from pathlib import Path
         
         data = {
-            "version": "1.0",
-            "documents": self._documents,
-            "embeddings": self._embeddings
+            "version": "1.1",
+            "documents": self._documents
         }
         
         Path(filepath).parent.mkdir(parents=True, exist_ok=True)
-        with open(filepath, 'w') as f:
-            json.dump(data, f)
+        _write_json(filepath, data)
+
+        _save_matrix(filepath + ".npy", self._embeddings)
+
+        # Content-hash vector cache, so a warm start can skip re-embedding:
+        # the hashes as JSON, the vectors as a matrix like the embeddings
+        _write_json(filepath + ".vectors", list(self._vector_cache))
+        _save_matrix(filepath + ".vectors.npy", list(self._vector_cache.values()))
+
+        # The ANN index is saved next to the embeddings
+        index_path = filepath + ".hnsw"
+        if self._ann_index is not None:
+            self._ann_index.save_index(index_path)
+        elif os.path.exists(index_path):
+            os.remove(index_path)  # Stale index from an earlier save
         
         print(f"Embeddings saved to {filepath} ({len(self._documents)} documents)")
 
@@ -552,11 +964,35 @@ class EmbeddingStore:
             return False
         
         try:
-            with open(filepath, 'r') as f:
-                data = json.load(f)
+            data = _read_json(filepath)
             
             self._documents = data.get("documents", [])
-            self._embeddings = data.get("embeddings", [])
+            matrix_path = filepath + ".npy"
+            if "embeddings" not in data and Path(matrix_path).exists():
+                # One (N, d) memmap; pages are read on first search, not here
+                matrix = np.load(matrix_path, mmap_mode='r')
+                self._embeddings = matrix if len(matrix) else []
+            else:
+                self._embeddings = data.get("embeddings", [])  # Version 1.0 file
+            self._matrix = None
+            self._quantized = None
+            self._ann_index = None
+
+            vectors_path = filepath + ".vectors"
+            if Path(vectors_path).exists():
+                keys = _read_json(vectors_path)
+                if isinstance(keys, dict):
+                    self._vector_cache = OrderedDict(keys)  # Written before the .npy cache
+                elif Path(vectors_path + ".npy").exists():
+                    cached = np.load(vectors_path + ".npy", mmap_mode='r')
+                    self._vector_cache = OrderedDict(zip(keys, cached))
+
+            index_path = filepath + ".hnsw"
+            if HNSWLIB_AVAILABLE and len(self._embeddings) and Path(index_path).exists():
+                index = hnswlib.Index(space="cosine", dim=len(self._embeddings[0]))
+                index.load_index(index_path, max_elements=len(self._embeddings))
+                index.set_ef(64)
+                self._ann_index = index
             
             print(f"Embeddings loaded from {filepath} ({len(self._documents)} documents)")
             return True
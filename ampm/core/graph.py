@@ -11,16 +11,166 @@ The graph connects:
 - Decisions ↔ Decisions (supersedes, contradicts)
 """
 
+import json
+import itertools
 import networkx as nx
-from typing import Optional
+from pathlib import Path
+from typing import Callable, Optional
 from datetime import datetime
 
+# Faster JSON (optional)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from ..models import (
     Meeting, Decision, ActionItem, Person, Topic, Blocker,
-    Update, Learning, Project, RelationType,
+    Project, RelationType,
     MeetingType, DecisionStatus, ActionStatus
 )
 
+# Drops NetworkX's cached backend conversions after a direct adjacency
+# write (no-op before networkx 3.3, which had no such cache)
+_clear_cache = getattr(nx, "_clear_cache", lambda g: None)
+
+# Match json.dump(indent=2, default=str): node "data" dataclasses and
+# datetimes go through default=str rather than orjson's native encoders
+_ORJSON_SAVE_OPTIONS = (
+    (orjson.OPT_INDENT_2 | orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_DATETIME)
+    if ORJSON_AVAILABLE else 0
+)
+
+# Edges store a small-int relation code instead of the RelationType string;
+# the string form is only used when saving/loading
+_REL_NAMES: list[str] = [rel.value for rel in RelationType]
+_REL_CODES: dict[str, int] = {name: code for code, name in enumerate(_REL_NAMES)}
+
+_REL_CONTAINS_DECISION = _REL_CODES[RelationType.CONTAINS_DECISION.value]
+_REL_CONTAINS_ACTION = _REL_CODES[RelationType.CONTAINS_ACTION.value]
+_REL_CONTAINS_BLOCKER = _REL_CODES[RelationType.CONTAINS_BLOCKER.value]
+_REL_MADE_BY = _REL_CODES[RelationType.MADE_BY.value]
+_REL_SUPERSEDES = _REL_CODES[RelationType.SUPERSEDES.value]
+_REL_ASSIGNED_TO = _REL_CODES[RelationType.ASSIGNED_TO.value]
+_REL_FOLLOWS_FROM = _REL_CODES[RelationType.FOLLOWS_FROM.value]
+_REL_REPORTED_BY = _REL_CODES[RelationType.REPORTED_BY.value]
+
+
+def _decision_keywords(content: str) -> set[str]:
+    """Words a question can name a decision by: its first five longer words."""
+    return {kw for kw in content.lower().split()[:5] if len(kw) > 3}
+
+
+def _relation_name(code):
+    """Map an edge relation code back to its RelationType string."""
+    return _REL_NAMES[code] if isinstance(code, int) else code
+
+
+def _action_item_from_dict(action_data: dict) -> ActionItem:
+    """Rebuild an ActionItem from its saved JSON form."""
+    due_date = datetime.fromisoformat(action_data["due_date"]) if action_data.get("due_date") else None
+    created_at = datetime.fromisoformat(action_data["created_at"]) if action_data.get("created_at") else datetime.now()
+    completed_at = datetime.fromisoformat(action_data["completed_at"]) if action_data.get("completed_at") else None
+    status_str = action_data.get("status", "pending")
+    status = ActionStatus(status_str) if status_str else ActionStatus.PENDING
+
+    return ActionItem(
+        id=action_data["id"],
+        task=action_data["task"],
+        assigned_to=action_data.get("assigned_to"),
+        meeting_id=action_data.get("meeting_id"),
+        decision_id=action_data.get("decision_id"),
+        due_date=due_date,
+        status=status,
+        estimated_days=action_data.get("estimated_days"),
+        actual_days=action_data.get("actual_days"),
+        blocker=action_data.get("blocker"),
+        completed_at=completed_at,
+        created_at=created_at
+    )
+
+
+def _blocker_from_dict(blocker_data: dict) -> Blocker:
+    """Rebuild a Blocker from its saved JSON form."""
+    created_at = datetime.fromisoformat(blocker_data["created_at"]) if blocker_data.get("created_at") else datetime.now()
+    resolved_at = datetime.fromisoformat(blocker_data["resolved_at"]) if blocker_data.get("resolved_at") else None
+
+    return Blocker(
+        id=blocker_data["id"],
+        description=blocker_data["description"],
+        reported_by=blocker_data.get("reported_by"),
+        meeting_id=blocker_data.get("meeting_id"),
+        impact=blocker_data.get("impact"),
+        resolution=blocker_data.get("resolution"),
+        resolved=blocker_data.get("resolved", False),
+        resolved_at=resolved_at,
+        created_at=created_at
+    )
+
+
+class _LazyDict(dict):
+    """
+    Dict whose values are parsed from raw JSON on first access.
+
+    The raw mapping is consumed in place: entries are popped from it as
+    they are parsed, so it only ever holds what is still unparsed.
+
+    Single-key lookups (``[]``, ``get``, ``in``) parse just that entry and
+    cache it. Bulk views (iteration, ``keys``/``values``/``items``)
+    materialize the whole section first.
+    """
+
+    def __init__(self, raw: dict, parse: Callable[[dict], object]):
+        super().__init__()
+        self._raw = raw
+        self._parse = parse
+
+    def __missing__(self, key):
+        value = self._parse(self._raw.pop(key))
+        super().__setitem__(key, value)
+        return value
+
+    def __setitem__(self, key, value) -> None:
+        self._raw.pop(key, None)
+        super().__setitem__(key, value)
+
+    def __contains__(self, key) -> bool:
+        return key in self._raw or super().__contains__(key)
+
+    def __len__(self) -> int:
+        return super().__len__() + len(self._raw)
+
+    def __iter__(self):
+        self.materialize()
+        return super().__iter__()
+
+    def get(self, key, default=None):
+        if key in self._raw:
+            return self[key]
+        return super().get(key, default)
+
+    def keys(self):
+        self.materialize()
+        return super().keys()
+
+    def values(self):
+        self.materialize()
+        return super().values()
+
+    def items(self):
+        self.materialize()
+        return super().items()
+
+    def clear(self) -> None:
+        self._raw.clear()
+        super().clear()
+
+    def materialize(self) -> None:
+        """Parse every remaining raw entry."""
+        for key in list(self._raw):
+            self[key]
+
 
 class MeetingGraph:
     """
@@ -33,6 +183,10 @@ class MeetingGraph:
     - "What's the history of this decision?"
     """
 
+    # Records live in process memory. Backends whose lookups do I/O set
+    # this so callers can overlap their batched reads.
+    is_remote = False
+
     def __init__(self):
         """Initialize an empty meeting graph."""
         self.graph = nx.DiGraph()
@@ -44,12 +198,94 @@ class MeetingGraph:
         self._blockers: dict[str, Blocker] = {}
         self._projects: dict[str, Project] = {}
 
+        # Unparsed JSON sections from load(), consumed lazily
+        self._raw_sections: dict[str, dict] = {}
+
+        # Node/edge counts, kept in step with every add so stats is O(1)
+        self._n_nodes = 0
+        self._n_edges = 0
+
+        # Topic -> decision IDs (dict used as an ordered set)
+        self._decisions_by_topic: dict[str, dict[str, None]] = {}
+
+        # Content keyword -> {decision ID: insertion rank}, see find_mentioned_decision
+        self._decisions_by_keyword: dict[str, dict[str, int]] = {}
+        self._decision_rank: dict[str, int] = {}
+
+        # Meetings sorted by date, rebuilt lazily after a meeting is added
+        self._meetings_by_date: Optional[list[Meeting]] = None
+
+        # Callbacks run after every mutation (e.g. to drop query caches)
+        self._change_listeners: list[Callable[[], None]] = []
+
+    # ==================== Change Hooks ====================
+
+    def on_change(self, callback: Callable[[], None]) -> None:
+        """Register a callback to run whenever the graph is mutated."""
+        self._change_listeners.append(callback)
+
+    def _notify_change(self) -> None:
+        """Run all registered change callbacks."""
+        for callback in self._change_listeners:
+            callback()
+
+    # ==================== Graph Primitives ====================
+
+    def _ensure(self, section: str) -> None:
+        """Materialize a lazily loaded section (e.g. "action_items")."""
+        items = getattr(self, f"_{section}")
+        if isinstance(items, _LazyDict):
+            items.materialize()
+
+    def _add_node(self, node_id: str, **attrs) -> None:
+        """Add (or update) a node, tracking the node count."""
+        if node_id not in self.graph:
+            self._n_nodes += 1
+        self.graph.add_node(node_id, **attrs)
+
+    def _add_edge(self, source: str, target: str, relation: int) -> None:
+        """Add (or update) an edge, tracking node and edge counts."""
+        self._add_edges(((source, target, relation),))
+
+    def _add_edges(self, edges) -> None:
+        """
+        Add several (source, target, relation code) edges in one pass.
+
+        Writes straight into the DiGraph adjacency dicts (the same layout
+        nx.DiGraph.add_edge produces) with the dicts bound once, instead
+        of re-resolving them through add_edge for every edge.
+        """
+        g = self.graph
+        succ = g._succ
+        pred = g._pred
+        node = g._node
+
+        for source, target, relation in edges:
+            for n in (source, target):
+                if n not in succ:
+                    succ[n] = g.adjlist_inner_dict_factory()
+                    pred[n] = g.adjlist_inner_dict_factory()
+                    node[n] = g.node_attr_dict_factory()
+                    self._n_nodes += 1
+
+            out = succ[source]
+            datadict = out.get(target)
+            if datadict is None:
+                datadict = g.edge_attr_dict_factory()
+                out[target] = datadict
+                pred[target][source] = datadict
+                self._n_edges += 1
+            datadict["relation"] = relation
+
+        _clear_cache(g)
+
     # ==================== Add Nodes ====================
 
     def add_meeting(self, meeting: Meeting) -> None:
         """Add a meeting to the graph."""
         self._meetings[meeting.id] = meeting
-        self.graph.add_node(
+        self._meetings_by_date = None
+        self._add_node(
             meeting.id,
             type="meeting",
             title=meeting.title,
@@ -57,90 +293,134 @@ class MeetingGraph:
             data=meeting
         )
 
+        self._notify_change()
+
     def add_decision(self, decision: Decision) -> None:
         """Add a decision to the graph."""
+        previous = self._decisions.get(decision.id)
+        if previous is not None and previous.topic != decision.topic:
+            self._decisions_by_topic.get(previous.topic, {}).pop(decision.id, None)
+        if previous is not None:
+            self._unindex_keywords(previous)
         self._decisions[decision.id] = decision
-        self.graph.add_node(
+        if decision.topic:
+            self._decisions_by_topic.setdefault(decision.topic, {})[decision.id] = None
+        self._index_keywords(decision)
+        self._add_node(
             decision.id,
             type="decision",
             content=decision.content,
             data=decision
         )
 
+        edges = []
+
         # Link to meeting
         if decision.meeting_id:
-            self.graph.add_edge(
+            edges.append((
                 decision.meeting_id,
                 decision.id,
-                relation=RelationType.CONTAINS_DECISION.value
-            )
+                _REL_CONTAINS_DECISION
+            ))
 
         # Link to person who made it
         if decision.made_by:
-            self.graph.add_edge(
+            edges.append((
                 decision.id,
                 decision.made_by,
-                relation=RelationType.MADE_BY.value
-            )
+                _REL_MADE_BY
+            ))
+
+        if edges:
+            self._add_edges(edges)
+
+        self._notify_change()
 
     def add_action_item(self, action: ActionItem) -> None:
         """Add an action item to the graph."""
         self._action_items[action.id] = action
-        self.graph.add_node(
+        self._add_node(
             action.id,
             type="action_item",
             task=action.task,
             data=action
         )
 
+        edges = []
+
         # Link to meeting
         if action.meeting_id:
-            self.graph.add_edge(
+            edges.append((
                 action.meeting_id,
                 action.id,
-                relation=RelationType.CONTAINS_ACTION.value
-            )
+                _REL_CONTAINS_ACTION
+            ))
 
         # Link to decision
         if action.decision_id:
-            self.graph.add_edge(
+            edges.append((
                 action.id,
                 action.decision_id,
-                relation=RelationType.FOLLOWS_FROM.value
-            )
+                _REL_FOLLOWS_FROM
+            ))
 
         # Link to assigned person
         if action.assigned_to:
-            self.graph.add_edge(
+            edges.append((
                 action.id,
                 action.assigned_to,
-                relation=RelationType.ASSIGNED_TO.value
-            )
+                _REL_ASSIGNED_TO
+            ))
+
+        if edges:
+            self._add_edges(edges)
+
+        self._notify_change()
 
     def add_person(self, person: Person) -> None:
         """Add a person to the graph."""
         self._people[person.id] = person
-        self.graph.add_node(
+        self._add_node(
             person.id,
             type="person",
             name=person.name,
             data=person
         )
 
+        self._notify_change()
+
+    def add_people(self, people: list[Person]) -> None:
+        """Add several people with a single change notification."""
+        if not people:
+            return
+
+        for person in people:
+            self._people[person.id] = person
+            self._add_node(
+                person.id,
+                type="person",
+                name=person.name,
+                data=person
+            )
+
+        self._notify_change()
+
     def add_topic(self, topic: Topic) -> None:
         """Add a topic to the graph."""
         self._topics[topic.id] = topic
-        self.graph.add_node(
+        self._add_node(
             topic.id,
             type="topic",
             name=topic.name,
             data=topic
         )
 
+        self._notify_change()
+
     def add_blocker(self, blocker: Blocker) -> None:
         """Add a blocker to the graph."""
         self._blockers[blocker.id] = blocker
-        self.graph.add_node(
+        self._add_node(
             blocker.id,
             type="blocker",
             description=blocker.description,
@@ -149,26 +429,46 @@ class MeetingGraph:
 
         # Link to meeting
         if blocker.meeting_id:
-            self.graph.add_edge(
+            self._add_edge(
                 blocker.meeting_id,
                 blocker.id,
-                relation=RelationType.CONTAINS_BLOCKER.value
+                relation=_REL_CONTAINS_BLOCKER
             )
 
         # Link to person who reported it
         if blocker.reported_by:
-            self.graph.add_edge(
+            self._add_edge(
                 blocker.id,
                 blocker.reported_by,
-                relation=RelationType.REPORTED_BY.value
+                relation=_REL_REPORTED_BY
             )
 
+        self._notify_change()
+
+    # ==================== Add Edges ====================
+
+    def add_supersedes(self, new_decision_id: str, old_decision_id: str) -> None:
+        """Record that one decision supersedes another."""
+        self._add_edge(
+            new_decision_id,
+            old_decision_id,
+            relation=_REL_SUPERSEDES
+        )
+
+        self._notify_change()
+
     # ==================== Query Methods ====================
 
     def get_meeting(self, meeting_id: str) -> Optional[Meeting]:
         """Get a meeting by ID."""
         return self._meetings.get(meeting_id)
 
+    def get_meetings_by_date(self) -> list[Meeting]:
+        """Get all meetings, oldest first (a shared list, sorted once per change)."""
+        if self._meetings_by_date is None:
+            self._meetings_by_date = sorted(self._meetings.values(), key=lambda m: m.date)
+        return self._meetings_by_date
+
     def get_decision(self, decision_id: str) -> Optional[Decision]:
         """Get a decision by ID."""
         return self._decisions.get(decision_id)
@@ -181,16 +481,43 @@ class MeetingGraph:
         """Get all decisions made in a meeting."""
         decisions = []
         for _, target, data in self.graph.out_edges(meeting_id, data=True):
-            if data.get("relation") == RelationType.CONTAINS_DECISION.value:
+            if data.get("relation") == _REL_CONTAINS_DECISION:
                 if target in self._decisions:
                     decisions.append(self._decisions[target])
         return decisions
 
+    def get_meetings_batch(self, meeting_ids) -> dict[str, Meeting]:
+        """Get several meetings by ID; unknown IDs are left out."""
+        meetings = self._meetings
+        return {mid: meetings[mid] for mid in meeting_ids if mid in meetings}
+
+    def get_decisions_batch(self, decision_ids) -> dict[str, Decision]:
+        """Get several decisions by ID; unknown IDs are left out."""
+        decisions = self._decisions
+        return {did: decisions[did] for did in decision_ids if did in decisions}
+
+    def get_decisions_by_meeting_batch(self, meeting_ids) -> dict[str, list[Decision]]:
+        """Get the decisions made in each of several meetings."""
+        succ = self.graph._succ
+        decisions = self._decisions
+        result = {}
+        for meeting_id in meeting_ids:
+            result[meeting_id] = [
+                decisions[target]
+                for target, data in succ.get(meeting_id, {}).items()
+                if data.get("relation") == _REL_CONTAINS_DECISION and target in decisions
+            ]
+        return result
+
+    def iter_recent_decisions(self, n: int = 5):
+        """Iterate over the n most recently added decisions, newest first."""
+        return itertools.islice(reversed(self._decisions.values()), n)
+
     def get_decisions_by_person(self, person_id: str) -> list[Decision]:
         """Get all decisions made by a person."""
         decisions = []
         for source, _, data in self.graph.in_edges(person_id, data=True):
-            if data.get("relation") == RelationType.MADE_BY.value:
+            if data.get("relation") == _REL_MADE_BY:
                 if source in self._decisions:
                     decisions.append(self._decisions[source])
         return decisions
@@ -200,11 +527,56 @@ class MeetingGraph:
         return [d for d in self._decisions.values()
                 if d.topic and topic_name.lower() in d.topic.lower()]
 
+    def find_mentioned_decision(self, text: str) -> Optional[Decision]:
+        """
+        First decision (in insertion order) one of whose keywords appears in text.
+
+        Keywords are a decision's first five words longer than three
+        characters, matched as lowercase substrings; each distinct keyword
+        is checked once rather than once per decision.
+        """
+        text = text.lower()
+        best_rank, best_id = None, None
+        for keyword, decision_ids in self._decisions_by_keyword.items():
+            if keyword in text:
+                for decision_id, rank in decision_ids.items():
+                    if best_rank is None or rank < best_rank:
+                        best_rank, best_id = rank, decision_id
+        return self._decisions[best_id] if best_id is not None else None
+
+    def _index_keywords(self, decision: Decision) -> None:
+        """Add a decision to the keyword index."""
+        rank = self._decision_rank.setdefault(decision.id, len(self._decision_rank))
+        for keyword in _decision_keywords(decision.content):
+            self._decisions_by_keyword.setdefault(keyword, {})[decision.id] = rank
+
+    def _unindex_keywords(self, decision: Decision) -> None:
+        """Remove a decision from the keyword index."""
+        for keyword in _decision_keywords(decision.content):
+            decision_ids = self._decisions_by_keyword.get(keyword)
+            if decision_ids is not None:
+                decision_ids.pop(decision.id, None)
+                if not decision_ids:
+                    del self._decisions_by_keyword[keyword]
+
+    def get_decision_ids_by_topic(self, topic: str) -> list[str]:
+        """IDs of decisions whose topic is exactly `topic` (indexed lookup)."""
+        return list(self._decisions_by_topic.get(topic, ()))
+
+    def get_action_item_ids_by_decision(self, decision_id: str) -> list[str]:
+        """IDs of action items that follow from a decision (no parsing needed)."""
+        pred = self.graph._pred.get(decision_id, {})
+        return [
+            source for source, data in pred.items()
+            if data.get("relation") == _REL_FOLLOWS_FROM
+        ]
+
     def get_action_items_by_person(self, person_id: str) -> list[ActionItem]:
         """Get all action items assigned to a person."""
+        self._ensure("action_items")
         actions = []
         for source, _, data in self.graph.in_edges(person_id, data=True):
-            if data.get("relation") == RelationType.ASSIGNED_TO.value:
+            if data.get("relation") == _REL_ASSIGNED_TO:
                 if source in self._action_items:
                     actions.append(self._action_items[source])
         return actions
@@ -213,7 +585,7 @@ class MeetingGraph:
         """Get all action items that follow from a decision."""
         actions = []
         for source, _, data in self.graph.in_edges(decision_id, data=True):
-            if data.get("relation") == RelationType.FOLLOWS_FROM.value:
+            if data.get("relation") == _REL_FOLLOWS_FROM:
                 if source in self._action_items:
                     actions.append(self._action_items[source])
         return actions
@@ -258,6 +630,20 @@ class MeetingGraph:
 
         return downstream
 
+    def get_downstream_batch(self, node_ids: list[str],
+                             depth: int = 3) -> dict[str, list[str]]:
+        """
+        Get downstream nodes for several roots at once.
+
+        A plain loop: the traversals are pure Python and hold the GIL, so
+        a thread pool would add overhead without any speedup. Repeated
+        roots are traversed once.
+
+        Returns:
+            Dict mapping each root ID to its downstream node IDs
+        """
+        return {node_id: self.get_downstream(node_id, depth) for node_id in dict.fromkeys(node_ids)}
+
     def get_upstream(self, node_id: str, depth: int = 3) -> list[str]:
         """
         Get all nodes upstream from a given node.
@@ -317,8 +703,8 @@ class MeetingGraph:
             "people": len(self._people),
             "topics": len(self._topics),
             "blockers": len(self._blockers),
-            "total_nodes": self.graph.number_of_nodes(),
-            "total_edges": self.graph.number_of_edges()
+            "total_nodes": self._n_nodes,
+            "total_edges": self._n_edges
         }
 
     def __repr__(self) -> str:
@@ -340,9 +726,6 @@ class MeetingGraph:
         Args:
             filepath: Path to save the graph (JSON format)
         """
-        import json
-        from pathlib import Path
-        
         def serialize_obj(obj):
             """Convert dataclass to dict for JSON serialization."""
             if hasattr(obj, '__dataclass_fields__'):
@@ -357,9 +740,25 @@ class MeetingGraph:
                         result[field_name] = value
                 return result
             return obj
-        
+
+        # Node types and edge relations repeat on every entry, so write
+        # each distinct string once in a table and reference it by index
+        type_table: dict[str, int] = {}
+        graph_nodes = []
+        for node_id, node_data in self.graph.nodes(data=True):
+            if "type" in node_data:
+                node_type = node_data["type"]
+                node_data = {**node_data, "type": type_table.setdefault(node_type, len(type_table))}
+            graph_nodes.append((node_id, node_data))
+
+        rel_table: dict[str, int] = {}
+        graph_edges = []
+        for source, target, edge_data in self.graph.edges(data=True):
+            relation = _relation_name(edge_data.get("relation"))
+            graph_edges.append((source, target, rel_table.setdefault(relation, len(rel_table))))
+
         data = {
-            "version": "1.0",
+            "version": "1.1",
             "meetings": {k: serialize_obj(v) for k, v in self._meetings.items()},
             "decisions": {k: serialize_obj(v) for k, v in self._decisions.items()},
             "action_items": {k: serialize_obj(v) for k, v in self._action_items.items()},
@@ -367,13 +766,19 @@ class MeetingGraph:
             "topics": {k: serialize_obj(v) for k, v in self._topics.items()},
             "blockers": {k: serialize_obj(v) for k, v in self._blockers.items()},
             "projects": {k: serialize_obj(v) for k, v in self._projects.items()},
-            "graph_nodes": list(self.graph.nodes(data=True)),
-            "graph_edges": list(self.graph.edges(data=True))
+            "_type_table": type_table,
+            "_rel_table": rel_table,
+            "graph_nodes": graph_nodes,
+            "graph_edges": graph_edges
         }
         
         Path(filepath).parent.mkdir(parents=True, exist_ok=True)
-        with open(filepath, 'w') as f:
-            json.dump(data, f, indent=2, default=str)
+        if ORJSON_AVAILABLE:
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(data, default=str, option=_ORJSON_SAVE_OPTIONS))
+        else:
+            with open(filepath, 'w') as f:
+                json.dump(data, f, indent=2, default=str)
         
         print(f"Graph saved to {filepath}")
 
@@ -387,25 +792,33 @@ class MeetingGraph:
         Returns:
             True if loaded successfully, False otherwise
         """
-        import json
-        from pathlib import Path
-        
         if not Path(filepath).exists():
             return False
         
         try:
-            with open(filepath, 'r') as f:
-                data = json.load(f)
+            if ORJSON_AVAILABLE:
+                with open(filepath, 'rb') as f:
+                    data = orjson.loads(f.read())
+            else:
+                with open(filepath, 'r') as f:
+                    data = json.load(f)
             
             # Clear existing data
             self._meetings.clear()
+            self._meetings_by_date = None
             self._decisions.clear()
             self._action_items.clear()
             self._people.clear()
             self._topics.clear()
             self._blockers.clear()
             self._projects.clear()
+            self._raw_sections = {}
+            self._decisions_by_topic = {}
+            self._decisions_by_keyword = {}
+            self._decision_rank = {}
             self.graph.clear()
+            self._n_nodes = 0
+            self._n_edges = 0
             
             # Restore people
             for person_id, person_data in data.get("people", {}).items():
@@ -474,56 +887,44 @@ class MeetingGraph:
                     superseded_by=dec_data.get("superseded_by")
                 )
                 self._decisions[decision_id] = decision
+                if decision.topic:
+                    self._decisions_by_topic.setdefault(decision.topic, {})[decision_id] = None
+                self._index_keywords(decision)
             
-            # Restore action items
-            for action_id, action_data in data.get("action_items", {}).items():
-                due_date = datetime.fromisoformat(action_data["due_date"]) if action_data.get("due_date") else None
-                created_at = datetime.fromisoformat(action_data["created_at"]) if action_data.get("created_at") else datetime.now()
-                completed_at = datetime.fromisoformat(action_data["completed_at"]) if action_data.get("completed_at") else None
-                status_str = action_data.get("status", "pending")
-                status = ActionStatus(status_str) if status_str else ActionStatus.PENDING
-                
-                action = ActionItem(
-                    id=action_data["id"],
-                    task=action_data["task"],
-                    assigned_to=action_data.get("assigned_to"),
-                    meeting_id=action_data.get("meeting_id"),
-                    decision_id=action_data.get("decision_id"),
-                    due_date=due_date,
-                    status=status,
-                    estimated_days=action_data.get("estimated_days"),
-                    actual_days=action_data.get("actual_days"),
-                    blocker=action_data.get("blocker"),
-                    completed_at=completed_at,
-                    created_at=created_at
-                )
-                self._action_items[action_id] = action
-            
-            # Restore blockers
-            for blocker_id, blocker_data in data.get("blockers", {}).items():
-                created_at = datetime.fromisoformat(blocker_data["created_at"]) if blocker_data.get("created_at") else datetime.now()
-                resolved_at = datetime.fromisoformat(blocker_data["resolved_at"]) if blocker_data.get("resolved_at") else None
-                
-                blocker = Blocker(
-                    id=blocker_data["id"],
-                    description=blocker_data["description"],
-                    reported_by=blocker_data.get("reported_by"),
-                    meeting_id=blocker_data.get("meeting_id"),
-                    impact=blocker_data.get("impact"),
-                    resolution=blocker_data.get("resolution"),
-                    resolved=blocker_data.get("resolved", False),
-                    resolved_at=resolved_at,
-                    created_at=created_at
-                )
-                self._blockers[blocker_id] = blocker
-            
-            # Restore NetworkX graph
+            # Action items and blockers are parsed lazily on first access
+            self._raw_sections = {
+                "action_items": data.get("action_items", {}),
+                "blockers": data.get("blockers", {}),
+            }
+            self._action_items = _LazyDict(
+                self._raw_sections["action_items"], _action_item_from_dict
+            )
+            self._blockers = _LazyDict(
+                self._raw_sections["blockers"], _blocker_from_dict
+            )
+
+            # Restore NetworkX graph (version 1.1+ stores node types and
+            # edge relations as indexes into _type_table/_rel_table)
+            type_names = {i: name for name, i in data.get("_type_table", {}).items()}
+            rel_names = {i: name for name, i in data.get("_rel_table", {}).items()}
+
             for node_id, node_data in data.get("graph_nodes", []):
+                if type_names and "type" in node_data:
+                    node_data["type"] = type_names[node_data["type"]]
                 self.graph.add_node(node_id, **node_data)
-            
+
             for source, target, edge_data in data.get("graph_edges", []):
+                if not isinstance(edge_data, dict):
+                    edge_data = {"relation": rel_names[edge_data]}
+                relation = edge_data.get("relation")
+                if relation in _REL_CODES:
+                    edge_data["relation"] = _REL_CODES[relation]
                 self.graph.add_edge(source, target, **edge_data)
+
+            self._n_nodes = self.graph.number_of_nodes()
+            self._n_edges = self.graph.number_of_edges()
             
+            self._notify_change()
             print(f"Graph loaded from {filepath}: {self.stats}")
             return True
             
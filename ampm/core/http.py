@@ -0,0 +1,48 @@
+"""
+Shared HTTP Client
+==================
+One process-wide connection pool for the LLM SDK clients.
+
+Every Cerebras client built on this pool reuses the same keep-alive (and,
+with the h2 package installed, HTTP/2 multiplexed) connections, so a burst
+of calls does not pay a TLS handshake each. The voice bots get their own
+longer-lived pool for the speech APIs from speech_http_client().
+"""
+
+import functools
+
+import httpx
+
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+@functools.lru_cache(maxsize=1)
+def shared_http_client() -> httpx.Client:
+    """
+    Get the process-wide HTTP client (created on first use).
+
+    Callers pass per-request timeouts where they need tighter bounds.
+    """
+    return httpx.Client(
+        http2=HTTP2_AVAILABLE,
+        timeout=httpx.Timeout(10.0, connect=2.0),
+        limits=httpx.Limits(max_keepalive_connections=32, max_connections=64)
+    )
+
+
+def speech_http_client() -> httpx.Client:
+    """
+    Keep-alive HTTP client for the speech APIs (Whisper, ElevenLabs).
+
+    Connections stay open two minutes between turns, and the timeout
+    allows for long syntheses. The caller owns (and closes) the client.
+    """
+    return httpx.Client(
+        http2=HTTP2_AVAILABLE,
+        timeout=httpx.Timeout(30.0, connect=5.0),
+        limits=httpx.Limits(max_keepalive_connections=8, keepalive_expiry=120)
+    )
@@ -13,20 +13,81 @@ Combines:
 
 import os
 import time
-from typing import Optional
-from dataclasses import dataclass
+import asyncio
+import logging
+import hashlib
+import threading
+import itertools
+import functools
+from typing import AsyncIterator, Iterator, Optional, Union
+from dataclasses import dataclass, replace
+from concurrent.futures import ThreadPoolExecutor
 
 from .graph import MeetingGraph
 from .embeddings import EmbeddingStore, SearchResult
+from .cache import QueryCache, SemanticCache
+
+# Exact prompt token counts (optional; falls back to ~4 chars per token)
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# LLM prompt and sampling settings shared by every answer path
+_SYSTEM_PROMPT = """You are Parrot, an AI meeting assistant that helps teams remember decisions and track action items.
+
+Your role:
+- Answer questions about past meetings, decisions, and action items
+- Be concise and direct (2-3 sentences for spoken responses, more detail for written)
+- Always cite the specific meeting date and who made the decision
+- Include direct quotes when available
+- If you don't have enough information, say so clearly
+
+Important: Cite your sources. Reference specific meetings and people."""
+
+_USER_PROMPT_TEMPLATE = """Based on the following meeting context, answer this question:
+
+Question: {question}
+
+Context:
+{context}
+
+Provide a clear, sourced answer. If the information isn't in the context, say so."""
+
+_MAX_TOKENS = 500
+_TEMPERATURE = 0.7
+
+
+@functools.lru_cache(maxsize=1)
+def _get_encoder():
+    """Tokenizer for prompt budgeting, or None if tiktoken can't provide one."""
+    if not TIKTOKEN_AVAILABLE:
+        return None
+    try:
+        return tiktoken.encoding_for_model("gpt-4o-mini")
+    except Exception:
+        return None
+
+
+def _count_tokens(text: str) -> int:
+    """Count (or estimate) the LLM tokens in a piece of text."""
+    encoder = _get_encoder()
+    if encoder is None:
+        return len(text) // 4 + 1
+    return len(encoder.encode(text))
 
 
 @dataclass
 class QueryResult:
     """Result of a context query."""
-    answer: str
+    answer: Union[str, Iterator[str]]  # Iterator of tokens for query(stream=True)
     sources: list[dict]
     query_time_ms: float
     confidence: float
+    degraded: bool = False  # Answer built from raw context after the LLM failed
 
 
 class QueryEngine:
@@ -40,73 +101,290 @@ class QueryEngine:
     - "What happened in last week's sprint planning?"
     """
 
-    def __init__(self, graph: MeetingGraph, embeddings: Optional[EmbeddingStore] = None):
+    def __init__(self, graph: MeetingGraph, embeddings: Optional[EmbeddingStore] = None,
+                 cache_llm_responses: bool = True,
+                 semantic_threshold: Optional[float] = None):
         """
         Initialize the query engine.
 
         Args:
             graph: The meeting knowledge graph
             embeddings: Optional embedding store for semantic search
+            cache_llm_responses: Reuse the LLM answer for a byte-identical
+                prompt. Answers are sampled at temperature 0.7, so disable
+                this to get a fresh answer on every call.
+            semantic_threshold: Reuse the answer to an earlier question
+                whose embedding has at least this cosine similarity
+                (None, the default, disables it; needs local embeddings).
+                Each lookup costs an embedding call, and near-identical
+                wording can still mean the opposite, so only enable it
+                where rephrased repeats are common (spoken questions).
         """
         self.graph = graph
         self.embeddings = embeddings or EmbeddingStore()
 
-        # Initialize LLM - try Cerebras first, fall back to OpenAI
-        self.cerebras = None
-        self.openai = None
-        
+        # Cache answers to repeated questions; any graph change drops them
+        self._query_cache = QueryCache(max_size=512, ttl_seconds=300)
+        self.graph.on_change(self._query_cache.clear)
+
+        # Rephrased repeats ("why'd we pick stripe") hit on the question
+        # embedding; dropped on graph changes like the text cache
+        self._semantic_cache = None
+        if semantic_threshold is not None:
+            self._semantic_cache = SemanticCache(threshold=semantic_threshold, ttl_seconds=300)
+            self.graph.on_change(self._semantic_cache.clear)
+
+        # Graph fields per (result id, source); entries never expire on
+        # their own, only when the graph changes
+        self._enrich_cache = QueryCache(max_size=4096, ttl_seconds=float("inf"))
+        self.graph.on_change(self._enrich_cache.clear)
+
+        # LLM answers keyed on the full prompt, so they stay valid across
+        # graph changes that don't alter the retrieved context
+        self._llm_cache = QueryCache(max_size=1024, ttl_seconds=86400) if cache_llm_responses else None
+
+        # Question embeddings are deterministic, so repeats skip the model
+        self._question_vectors = QueryCache(max_size=256, ttl_seconds=float("inf"))
+
+        # LLM client, created on first use: (provider, client, model)
+        self._llm = None
+        self._llm_checked = False
+        self._http = None  # Shared keep-alive httpx.Client for the LLM SDKs
+        self._client_lock = threading.RLock()  # multi_query answers from worker threads
+
+        # Async client for streaming, built on first use: (client, model)
+        self._async_llm = None
+
+    def _get_llm(self) -> Optional[tuple]:
+        """
+        Create (once) the LLM client - Cerebras first, falling back to OpenAI.
+
+        The SDK imports happen here rather than in __init__, so engines that
+        never reach the LLM (cache hits, tooling) don't pay for them.
+
+        Returns:
+            (provider, client, model), or None if no LLM is configured
+        """
+        if self._llm_checked:
+            return self._llm
+        with self._client_lock:
+            if not self._llm_checked:
+                self._llm = self._create_llm()
+                # Only now, so other threads never see the flag without the client
+                self._llm_checked = True
+        return self._llm
+
+    def _create_llm(self) -> Optional[tuple]:
+        """Build the LLM client for _get_llm() (called once, under the lock)."""
+        llm = None
         if os.getenv("CEREBRAS_API_KEY"):
             try:
                 from cerebras.cloud.sdk import Cerebras
-                self.cerebras = Cerebras(api_key=os.getenv("CEREBRAS_API_KEY"))
+                client = Cerebras(
+                    api_key=os.getenv("CEREBRAS_API_KEY"),
+                    http_client=self._get_http_client()
+                )
+                llm = ("cerebras", client, "llama-3.3-70b")
                 print("QueryEngine: Using Cerebras")
             except ImportError:
                 pass
-        
-        if not self.cerebras and os.getenv("OPENAI_API_KEY"):
+
+        if not llm and os.getenv("OPENAI_API_KEY"):
             try:
                 from openai import OpenAI
-                import httpx
-                # Set longer timeout for OpenAI client
-                self.openai = OpenAI(
+                client = OpenAI(
                     api_key=os.getenv("OPENAI_API_KEY"),
-                    timeout=httpx.Timeout(60.0, connect=10.0)
+                    http_client=self._get_http_client()
                 )
+                llm = ("openai", client, "gpt-4o-mini")
                 print("QueryEngine: Using OpenAI")
             except ImportError:
                 pass
-        
-        if not self.cerebras and not self.openai:
+
+        if not llm:
             print("QueryEngine: WARNING - No LLM API available")
+        return llm
+
+    def _get_http_client(self):
+        """
+        Shared HTTP client for LLM calls, so TLS sessions are reused.
+
+        Uses HTTP/2 when the h2 package is installed.
+        """
+        with self._client_lock:
+            if self._http is None:
+                import httpx
+                from .http import HTTP2_AVAILABLE
+                # Longer read timeout for slow completions
+                self._http = httpx.Client(
+                    http2=HTTP2_AVAILABLE,
+                    timeout=httpx.Timeout(60.0, connect=10.0),
+                    limits=httpx.Limits(max_keepalive_connections=16, keepalive_expiry=60)
+                )
+            return self._http
+
+    def close(self):
+        """Close the shared HTTP connections."""
+        if self._http is not None:
+            self._http.close()
+            self._http = None
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
 
-    def query(self, question: str, top_k: int = 5) -> QueryResult:
+    @property
+    def cerebras(self):
+        """The Cerebras client, if that is the configured LLM."""
+        llm = self._get_llm()
+        return llm[1] if llm and llm[0] == "cerebras" else None
+
+    @property
+    def openai(self):
+        """The OpenAI client, if that is the configured LLM."""
+        llm = self._get_llm()
+        return llm[1] if llm and llm[0] == "openai" else None
+
+    def query(self, question: str, top_k: int = 5, stream: bool = False) -> QueryResult:
         """
         Answer a natural language question about meeting history.
 
         Args:
             question: Natural language question
             top_k: Number of relevant sources to retrieve
+            stream: Return the answer as an iterator of tokens. The first
+                token is already received, so query_time_ms is the time
+                to first token.
 
         Returns:
             QueryResult with answer, sources, and timing
         """
         start_time = time.time()
 
+        cache_key = QueryCache.make_key(question, top_k)
+        cached, vector = self._cached_result(question, cache_key, top_k)
+        if cached is not None:
+            result = replace(cached, query_time_ms=(time.time() - start_time) * 1000)
+            if stream:
+                result.answer = iter([cached.answer])
+            return result
+
+        if stream:
+            return self._run_query_stream(question, top_k, start_time)
+
+        result = self._run_query(question, top_k, start_time)
+        if self._cacheable(result):
+            self._store_result(cache_key, vector, top_k, result)
+        return result
+
+    @staticmethod
+    def _cacheable(result: QueryResult) -> bool:
+        """Whether a result may be cached: only real LLM answers are."""
+        return result.confidence > 0 and not result.degraded
+
+    def _embed_question(self, question: str) -> list[float]:
+        """Embed a normalized question, reusing earlier vectors ([] if unavailable)."""
+        vector = self._question_vectors.get(question)
+        if vector is None:
+            vector = self.embeddings.embed_text(question)
+            # A failed embedding ([]) is retried on the next ask
+            if vector:
+                self._question_vectors.put(question, vector)
+        return vector
+
+    def _cached_result(self, question: str, cache_key: str,
+                       scope) -> tuple[Optional[QueryResult], Optional[list[float]]]:
+        """
+        Look up a cached result: exact question first, then near-duplicates.
+
+        Returns:
+            (cached result or None, question embedding for storing the new
+            result, or None if the semantic cache wasn't consulted)
+        """
+        cached = self._query_cache.get(cache_key)
+        if cached is not None or self._semantic_cache is None:
+            return cached, None
+
+        try:
+            vector = self._embed_question(question.strip().lower())
+        except Exception as e:
+            logger.debug("Question embedding failed: %s", e)
+            return None, None
+        if not vector:
+            return None, None
+
+        cached = self._semantic_cache.get(vector, scope)
+        if cached is not None:
+            # Repeat the exact question without embedding it again
+            self._query_cache.put(cache_key, cached)
+        return cached, vector
+
+    def _store_result(self, cache_key: str, vector: Optional[list[float]],
+                      scope, result: QueryResult) -> None:
+        """Cache a result under its question text and embedding."""
+        self._query_cache.put(cache_key, result)
+        if vector:
+            self._semantic_cache.put(vector, result, scope)
+
+    def _run_query(self, question: str, top_k: int, start_time: float) -> QueryResult:
+        """Run the full search → enrich → generate pipeline (uncached)."""
         # Step 1: Semantic search for relevant content
-        print(f"Searching for: {question}")
-        search_results = self.embeddings.search(question, top_k=top_k)
-        print(f"Found {len(search_results)} search results")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Searching for: %s", question)
+        search_results = self._search(question, top_k)
+        logger.debug("Found %d search results", len(search_results))
+
+        return self._answer(question, search_results, start_time)
+
+    def _run_query_stream(self, question: str, top_k: int, start_time: float) -> QueryResult:
+        """Run search and enrichment, then start streaming the answer."""
+        search_results = self._search(question, top_k)
+        context = self._build_context(search_results)
+
+        outcome = {}
+        tokens = self._iter_answer(question, context, outcome)
+        first = next(tokens, "")
+
+        return QueryResult(
+            answer=itertools.chain([first], tokens),
+            sources=context,
+            query_time_ms=(time.time() - start_time) * 1000,
+            confidence=outcome.get("confidence", 0.0),
+            degraded=outcome.get("degraded", False)
+        )
 
+    def _answer(self, question: str, search_results: list[SearchResult],
+                start_time: float) -> QueryResult:
+        """Enrich search results with graph context and generate the answer."""
+        enriched_context = self._build_context(search_results)
+
+        # Step 3: Generate answer with LLM
+        answer, confidence, degraded = self._generate_answer(question, enriched_context)
+        logger.debug("Answer generated with confidence %s", confidence)
+
+        query_time_ms = (time.time() - start_time) * 1000
+
+        return QueryResult(
+            answer=answer,
+            sources=enriched_context,
+            query_time_ms=query_time_ms,
+            confidence=confidence,
+            degraded=degraded
+        )
+
+    def _build_context(self, search_results: list[SearchResult]) -> list[dict]:
+        """Enrich search results with graph context (graph fallback if none)."""
         # Step 2: Enrich with graph context
         enriched_context = self._enrich_with_graph(search_results)
-        print(f"Enriched to {len(enriched_context)} context items")
+        logger.debug("Enriched to %d context items", len(enriched_context))
 
         # If no search results, try to get context from graph directly
         if not enriched_context:
-            print("No search results, trying graph query...")
-            # Get some decisions as fallback context
-            all_decisions = list(self.graph._decisions.values())[:5]
-            for dec in all_decisions:
+            logger.debug("No search results, trying graph query...")
+            # Use the latest decisions as fallback context
+            for dec in self.graph.iter_recent_decisions(5):
                 enriched_context.append({
                     "id": dec.id,
                     "content": dec.content,
@@ -116,27 +394,67 @@ class QueryEngine:
                     "source_type": "decision",
                     "meeting_id": dec.meeting_id
                 })
-            print(f"Added {len(enriched_context)} decisions from graph as fallback")
+            enriched_context = self._dedupe_context(enriched_context)
+            logger.debug("Added %d decisions from graph as fallback", len(enriched_context))
 
-        # Step 3: Generate answer with LLM
-        print("Generating answer...")
-        # Debug: Show what we're sending to the LLM
-        if enriched_context:
-            print(f"DEBUG: First context item keys: {list(enriched_context[0].keys())}")
-            ctx0 = enriched_context[0]
-            print(f"DEBUG: decision_content = {ctx0.get('decision_content')}")
-            print(f"DEBUG: meeting_title = {ctx0.get('meeting_title')}")
-        answer, confidence = self._generate_answer(question, enriched_context)
-        print(f"Answer generated with confidence {confidence}")
+        return enriched_context
 
-        query_time_ms = (time.time() - start_time) * 1000
+    def multi_query(self, questions: list[str], top_k: int = 5) -> list[QueryResult]:
+        """
+        Answer several questions with one batched search.
 
-        return QueryResult(
-            answer=answer,
-            sources=enriched_context,
-            query_time_ms=query_time_ms,
-            confidence=confidence
-        )
+        Cached answers are returned directly. The remaining questions share
+        one batched vector search, then their LLM calls run concurrently.
+
+        Args:
+            questions: Natural language questions
+            top_k: Number of relevant sources to retrieve per question
+
+        Returns:
+            One QueryResult per question, in input order
+        """
+        start_time = time.time()
+        results: list[Optional[QueryResult]] = [None] * len(questions)
+
+        pending = []
+        for i, question in enumerate(questions):
+            cached = self._query_cache.get(QueryCache.make_key(question, top_k))
+            if cached is not None:
+                results[i] = replace(cached, query_time_ms=(time.time() - start_time) * 1000)
+            else:
+                pending.append(i)
+
+        if pending:
+            pending_questions = [questions[i] for i in pending]
+            batch_results = self.embeddings.batch_search(pending_questions, top_k=top_k)
+
+            with ThreadPoolExecutor(max_workers=min(len(pending), 8)) as executor:
+                answers = executor.map(
+                    lambda args: self._answer(args[0], args[1], start_time),
+                    zip(pending_questions, batch_results)
+                )
+                for i, result in zip(pending, answers):
+                    if self._cacheable(result):
+                        self._query_cache.put(QueryCache.make_key(questions[i], top_k), result)
+                    results[i] = result
+
+        return results
+
+    def _search(self, question: str, top_k: int) -> list[SearchResult]:
+        """
+        Semantic search for a question.
+
+        Local search reuses cached question embeddings (keyed on the
+        normalized question); Backboard search embeds server-side.
+        """
+        if self.embeddings.use_backboard and self.embeddings.backboard_api_key:
+            return self.embeddings.search(question, top_k=top_k)
+
+        if not self.embeddings.document_count:
+            return []
+
+        query_embedding = self._embed_question(question.strip().lower())
+        return self.embeddings.search_by_vector(query_embedding, top_k=top_k)
 
     def _enrich_with_graph(self, search_results: list[SearchResult]) -> list[dict]:
         """
@@ -147,6 +465,63 @@ class QueryEngine:
         - People involved
         - Meeting context
         """
+        # Pass 1: reuse cached graph fields, collect IDs for the rest
+        graph_fields = {}
+        misses = []
+        decision_ids = set()
+        meeting_ids = set()
+        for result in search_results:
+            key = (result.id, result.source)
+            if key in graph_fields:
+                continue
+            cached = self._enrich_cache.get(key)
+            if cached is not None:
+                graph_fields[key] = cached
+                continue
+
+            misses.append(result)
+            if result.source == "meeting":
+                meeting_id = result.metadata.get("meeting_id")
+                if meeting_id:
+                    meeting_ids.add(meeting_id)
+            elif result.source == "decision":
+                decision_id = result.metadata.get("decision_id")
+                if decision_id:
+                    decision_ids.add(decision_id)
+
+        if misses:
+            # Pass 2: fetch the uncached records in batches
+            if self.graph.is_remote:
+                # Overlap the independent reads when they hit storage
+                with ThreadPoolExecutor(max_workers=3) as executor:
+                    decisions_future = executor.submit(self.graph.get_decisions_batch, decision_ids)
+                    meetings_future = executor.submit(self.graph.get_meetings_batch, meeting_ids)
+                    by_meeting_future = executor.submit(
+                        self.graph.get_decisions_by_meeting_batch, meeting_ids
+                    )
+                    decisions = decisions_future.result()
+                    meetings = meetings_future.result()
+                    meeting_decisions = by_meeting_future.result()
+            else:
+                decisions = self.graph.get_decisions_batch(decision_ids)
+                meetings = self.graph.get_meetings_batch(meeting_ids)
+                meeting_decisions = self.graph.get_decisions_by_meeting_batch(meeting_ids)
+
+            # Meetings the decisions came from
+            upstream_ids = {
+                d.meeting_id for d in decisions.values()
+                if d.meeting_id and d.meeting_id not in meetings
+            }
+            if upstream_ids:
+                meetings.update(self.graph.get_meetings_batch(upstream_ids))
+
+            for result in misses:
+                key = (result.id, result.source)
+                fields = self._graph_fields(result, meetings, decisions, meeting_decisions)
+                graph_fields[key] = fields
+                self._enrich_cache.put(key, fields)
+
+        # Pass 3: merge per-call fields with the graph fields
         enriched = []
 
         for result in search_results:
@@ -157,122 +532,393 @@ class QueryEngine:
                 "source_type": result.source,
                 "metadata": result.metadata
             }
+            context.update(graph_fields[(result.id, result.source)])
+            enriched.append(context)
 
-            # Add graph context based on source type
-            if result.source == "meeting":
-                meeting_id = result.metadata.get("meeting_id")
-                if meeting_id:
-                    meeting = self.graph.get_meeting(meeting_id)
-                    if meeting:
-                        context["meeting_title"] = meeting.title
-                        context["meeting_date"] = str(meeting.date)
-                        context["attendees"] = meeting.attendees
-                        # Get decisions from this meeting
-                        decisions = self.graph.get_decisions_by_meeting(meeting_id)
-                        context["decisions"] = [
-                            {"content": d.content, "made_by": d.made_by}
-                            for d in decisions
-                        ]
+        return self._dedupe_context(enriched)
 
-            elif result.source == "decision":
-                decision_id = result.metadata.get("decision_id")
-                if decision_id:
-                    decision = self.graph.get_decision(decision_id)
-                    if decision:
-                        context["decision_content"] = decision.content
-                        context["rationale"] = decision.rationale
-                        context["made_by"] = decision.made_by
-                        context["quote"] = decision.quote
-                        # Get upstream context (meeting)
-                        if decision.meeting_id:
-                            meeting = self.graph.get_meeting(decision.meeting_id)
-                            if meeting:
-                                context["meeting_title"] = meeting.title
-                                context["meeting_date"] = str(meeting.date)
+    @staticmethod
+    def _dedupe_context(context: list[dict]) -> list[dict]:
+        """
+        Drop context items that repeat an earlier one.
 
-            enriched.append(context)
+        Chunks of the same meeting, and the same decision text from the
+        same meeting, collapse into the first (highest scoring) item.
+        """
+        seen = set()
+        unique = []
+        for ctx in context:
+            metadata = ctx.get("metadata") or {}
+            meeting_id = ctx.get("meeting_id") or metadata.get("meeting_id")
+            if ctx.get("source_type") == "meeting" and meeting_id:
+                key = ("meeting", meeting_id)
+            elif ctx.get("decision_content"):
+                key = ("decision", meeting_id, ctx["decision_content"])
+            else:
+                key = (ctx.get("source_type"), ctx.get("id"))
+
+            if key not in seen:
+                seen.add(key)
+                unique.append(ctx)
+        return unique
+
+    def _graph_fields(self, result: SearchResult, meetings: dict, decisions: dict,
+                      meeting_decisions: dict) -> dict:
+        """Build the graph context for one search result from prefetched records."""
+        fields = {}
+
+        # Add graph context based on source type
+        if result.source == "meeting":
+            meeting_id = result.metadata.get("meeting_id")
+            meeting = meetings.get(meeting_id) if meeting_id else None
+            if meeting:
+                fields["meeting_title"] = meeting.title
+                fields["meeting_date"] = str(meeting.date)
+                fields["attendees"] = meeting.attendees
+                # Decisions from this meeting
+                fields["decisions"] = [
+                    {"content": d.content, "made_by": d.made_by}
+                    for d in meeting_decisions.get(meeting_id, [])
+                ]
 
-        return enriched
+        elif result.source == "decision":
+            decision_id = result.metadata.get("decision_id")
+            decision = decisions.get(decision_id) if decision_id else None
+            if decision:
+                fields["decision_content"] = decision.content
+                fields["rationale"] = decision.rationale
+                fields["made_by"] = decision.made_by
+                fields["quote"] = decision.quote
+                # Upstream context (meeting)
+                meeting = meetings.get(decision.meeting_id) if decision.meeting_id else None
+                if meeting:
+                    fields["meeting_title"] = meeting.title
+                    fields["meeting_date"] = str(meeting.date)
 
-    def _generate_answer(self, question: str, context: list[dict]) -> tuple[str, float]:
+        return fields
+
+    def _generate_answer(self, question: str, context: list[dict]) -> tuple[str, float, bool]:
         """
         Generate an answer using Cerebras LLM.
 
-        Returns (answer, confidence_score)
+        Returns (answer, confidence_score, degraded), degraded being True
+        when the LLM failed and the answer was built from raw context
         """
-        # Format context for prompt
-        context_text = self._format_context(context)
+        llm = self._get_llm()
+        if llm is None:
+            return "No LLM API available. Please set OPENAI_API_KEY or CEREBRAS_API_KEY.", 0.0, False
+        provider, client, model = llm
 
-        system_prompt = """You are Parrot, an AI meeting assistant that helps teams remember decisions and track action items.
+        system_prompt, user_prompt = self._build_prompts(question, context)
+        # Simple confidence based on context availability
+        confidence = min(1.0, len(context) / 3)
 
-Your role:
-- Answer questions about past meetings, decisions, and action items
-- Be concise and direct (2-3 sentences for spoken responses, more detail for written)
-- Always cite the specific meeting date and who made the decision
-- Include direct quotes when available
-- If you don't have enough information, say so clearly
+        cache_key = None
+        if self._llm_cache is not None:
+            cache_key = self._llm_cache_key(model, system_prompt, user_prompt)
+            cached = self._llm_cache.get(cache_key)
+            if cached is not None:
+                return cached, confidence, False
 
-Important: Cite your sources. Reference specific meetings and people."""
+        # OpenAI calls get a 30 second per-request timeout
+        extra = {"timeout": 30.0} if provider == "openai" else {}
 
-        user_prompt = f"""Based on the following meeting context, answer this question:
+        # Retry logic for resilience
+        max_retries = 2
+        last_error = None
+        answer = None
 
-Question: {question}
+        for attempt in range(max_retries + 1):
+            try:
+                response = client.chat.completions.create(
+                    model=model,
+                    messages=[
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": user_prompt}
+                    ],
+                    max_tokens=_MAX_TOKENS,
+                    temperature=_TEMPERATURE,
+                    **extra
+                )
+                answer = response.choices[0].message.content
+                if answer:
+                    break
 
-Context:
-{context_text}
+            except Exception as e:
+                last_error = e
+                if attempt < max_retries:
+                    print(f"Retry {attempt + 1}/{max_retries} after error: {e}")
+                    time.sleep(1)  # Brief pause before retry
 
-Provide a clear, sourced answer. If the information isn't in the context, say so."""
+        if answer:
+            if cache_key:
+                self._llm_cache.put(cache_key, answer)
+            return answer, confidence, False
+
+        answer, confidence = self._fallback_answer(context, last_error)
+        return answer, confidence, True
+
+    # ==================== Async / Streaming ====================
+
+    async def aquery(self, question: str, top_k: int = 5) -> QueryResult:
+        """
+        Async version of query(), built on query_stream's LLM streaming.
+
+        Uses the same result cache as query().
+        """
+        start_time = time.time()
+
+        cache_key = QueryCache.make_key(question, top_k)
+        cached = self._query_cache.get(cache_key)
+        if cached is not None:
+            return replace(cached, query_time_ms=(time.time() - start_time) * 1000)
+
+        search_results = await asyncio.to_thread(self._search, question, top_k)
+        context = self._build_context(search_results)
+
+        outcome = {}
+        tokens = [token async for token in self._stream_answer(question, context, outcome)]
+
+        result = QueryResult(
+            answer="".join(tokens),
+            sources=context,
+            query_time_ms=(time.time() - start_time) * 1000,
+            confidence=outcome.get("confidence", 0.0),
+            degraded=outcome.get("degraded", False)
+        )
+        if self._cacheable(result):
+            self._query_cache.put(cache_key, result)
+        return result
+
+    async def query_stream(self, question: str, top_k: int = 5) -> AsyncIterator[str]:
+        """
+        Stream the answer to a question as tokens arrive.
+
+        Search and graph enrichment run in a worker thread, then the LLM
+        response is streamed so callers can render a partial answer.
+
+        Usage:
+            async for token in engine.query_stream("Why did we choose Stripe?"):
+                print(token, end="", flush=True)
+        """
+        search_results = await asyncio.to_thread(self._search, question, top_k)
+        context = self._build_context(search_results)
+
+        async for token in self._stream_answer(question, context):
+            yield token
+
+    def _get_async_llm(self):
+        """Build (once) the async counterpart of the configured LLM client."""
+        llm = self._get_llm()
+        if self._async_llm is None and llm:
+            if llm[0] == "cerebras":
+                from cerebras.cloud.sdk import AsyncCerebras
+                client = AsyncCerebras(api_key=os.getenv("CEREBRAS_API_KEY"))
+                self._async_llm = (client, "llama-3.3-70b")
+            else:
+                from openai import AsyncOpenAI
+                import httpx
+                client = AsyncOpenAI(
+                    api_key=os.getenv("OPENAI_API_KEY"),
+                    timeout=httpx.Timeout(60.0, connect=10.0)
+                )
+                self._async_llm = (client, "gpt-4o-mini")
+        return self._async_llm
+
+    def _iter_answer(self, question: str, context: list[dict],
+                     outcome: Optional[dict] = None) -> Iterator[str]:
+        """
+        Stream an LLM answer with the sync client (see _stream_answer).
+
+        outcome["confidence"] is set before the first token is yielded, and
+        outcome["degraded"] when the answer is the raw-context fallback.
+        """
+        outcome = outcome if outcome is not None else {}
+        outcome["confidence"] = 0.0
+
+        llm = self._get_llm()
+        if llm is None:
+            yield "No LLM API available. Please set OPENAI_API_KEY or CEREBRAS_API_KEY."
+            return
+
+        provider, client, model = llm
+        system_prompt, user_prompt = self._build_prompts(question, context)
+
+        cache_key = None
+        if self._llm_cache is not None:
+            cache_key = self._llm_cache_key(model, system_prompt, user_prompt)
+            cached = self._llm_cache.get(cache_key)
+            if cached is not None:
+                outcome["confidence"] = min(1.0, len(context) / 3)
+                yield cached
+                return
 
-        # Retry logic for resilience
         max_retries = 2
         last_error = None
-        
+
         for attempt in range(max_retries + 1):
+            streamed = []
             try:
-                answer = None
-                
-                # Try Cerebras first
-                if self.cerebras:
-                    response = self.cerebras.chat.completions.create(
-                        model="llama-3.3-70b",
-                        messages=[
-                            {"role": "system", "content": system_prompt},
-                            {"role": "user", "content": user_prompt}
-                        ],
-                        max_tokens=500,
-                        temperature=0.7
-                    )
-                    answer = response.choices[0].message.content
-                
-                # Fall back to OpenAI
-                elif self.openai:
-                    response = self.openai.chat.completions.create(
-                        model="gpt-4o-mini",
-                        messages=[
-                            {"role": "system", "content": system_prompt},
-                            {"role": "user", "content": user_prompt}
-                        ],
-                        max_tokens=500,
-                        temperature=0.7,
-                        timeout=30.0  # 30 second timeout
-                    )
-                    answer = response.choices[0].message.content
-                
-                else:
-                    return "No LLM API available. Please set OPENAI_API_KEY or CEREBRAS_API_KEY.", 0.0
+                response = client.chat.completions.create(
+                    model=model,
+                    messages=[
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": user_prompt}
+                    ],
+                    max_tokens=_MAX_TOKENS,
+                    temperature=_TEMPERATURE,
+                    stream=True
+                )
+                for chunk in response:
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        if not streamed:
+                            outcome["confidence"] = min(1.0, len(context) / 3)
+                        streamed.append(chunk.choices[0].delta.content)
+                        yield streamed[-1]
+
+                if streamed:
+                    if cache_key:
+                        self._llm_cache.put(cache_key, "".join(streamed))
+                    return
 
-                if answer:
-                    # Simple confidence based on context availability
-                    confidence = min(1.0, len(context) / 3)
-                    return answer, confidence
-                    
             except Exception as e:
+                if streamed:
+                    raise
                 last_error = e
                 if attempt < max_retries:
                     print(f"Retry {attempt + 1}/{max_retries} after error: {e}")
                     time.sleep(1)  # Brief pause before retry
+
+        answer, confidence = self._fallback_answer(context, last_error)
+        outcome["confidence"] = confidence
+        outcome["degraded"] = True
+        yield answer
+
+    async def _stream_answer(self, question: str, context: list[dict],
+                             outcome: Optional[dict] = None) -> AsyncIterator[str]:
+        """
+        Stream an LLM answer, falling back to a context summary on failure.
+
+        Retries use a non-blocking backoff and only happen before the
+        first token; a stream that fails midway is re-raised. The answer's
+        confidence is written to outcome["confidence"] if given, and
+        outcome["degraded"] is set for the raw-context fallback.
+        """
+        outcome = outcome if outcome is not None else {}
+        outcome["confidence"] = 0.0
+
+        llm = self._get_async_llm()
+        if llm is None:
+            yield "No LLM API available. Please set OPENAI_API_KEY or CEREBRAS_API_KEY."
+            return
+
+        client, model = llm
+        system_prompt, user_prompt = self._build_prompts(question, context)
+
+        cache_key = None
+        if self._llm_cache is not None:
+            cache_key = self._llm_cache_key(model, system_prompt, user_prompt)
+            cached = self._llm_cache.get(cache_key)
+            if cached is not None:
+                outcome["confidence"] = min(1.0, len(context) / 3)
+                yield cached
+                return
+
+        max_retries = 2
+        last_error = None
+
+        for attempt in range(max_retries + 1):
+            streamed = []
+            try:
+                stream = await client.chat.completions.create(
+                    model=model,
+                    messages=[
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": user_prompt}
+                    ],
+                    max_tokens=_MAX_TOKENS,
+                    temperature=_TEMPERATURE,
+                    stream=True
+                )
+                async for chunk in stream:
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        streamed.append(chunk.choices[0].delta.content)
+                        yield streamed[-1]
+
+                if streamed:
+                    if cache_key:
+                        self._llm_cache.put(cache_key, "".join(streamed))
+                    outcome["confidence"] = min(1.0, len(context) / 3)
+                    return
+
+            except Exception as e:
+                if streamed:
+                    raise
+                last_error = e
+                if attempt < max_retries:
+                    print(f"Retry {attempt + 1}/{max_retries} after error: {e}")
+                    await asyncio.sleep(1)  # Brief pause before retry
+
+        answer, confidence = self._fallback_answer(context, last_error)
+        outcome["confidence"] = confidence
+        outcome["degraded"] = True
+        yield answer
+
+    @staticmethod
+    def _llm_cache_key(model: str, system_prompt: str, user_prompt: str) -> str:
+        """Cache key for an LLM answer: hash of the model and full prompt."""
+        return hashlib.sha256(f"{model}|{system_prompt}|{user_prompt}".encode()).hexdigest()
+
+    def _build_prompts(self, question: str, context: list[dict]) -> tuple[str, str]:
+        """Build the (system, user) prompts for a question and its context."""
+        # Format context for prompt, keeping it within the token budget
+        selected = self._budget_context(context)
+        context_text = self._join_sources([body for _, body in selected])
+
+        user_prompt = _USER_PROMPT_TEMPLATE.format(question=question, context=context_text)
+        return _SYSTEM_PROMPT, user_prompt
+
+    def _budget_context(self, context: list[dict],
+                        max_tokens: int = 1500) -> list[tuple[dict, str]]:
+        """
+        Pick the sources to send to the LLM within a token budget.
+
+        Sources are taken best score first, skipping any that refer to the
+        same meeting/decision as one already taken. The best source is
+        always kept, even if it alone exceeds the budget.
+
+        Returns:
+            (context item, formatted body) pairs for the selected sources
+        """
+        ranked = sorted(context, key=lambda c: c.get("score", 0), reverse=True)
+
+        selected = []
+        seen = set()
+        used_tokens = 0
+        for ctx in ranked:
+            metadata = ctx.get("metadata") or {}
+            meeting_id = ctx.get("meeting_id") or metadata.get("meeting_id")
+            decision_id = metadata.get("decision_id")
+            if not decision_id and ctx.get("source_type") == "decision":
+                decision_id = ctx.get("id")
+            key = (meeting_id, decision_id) if meeting_id or decision_id else ("id", ctx.get("id"))
+            if key in seen:
                 continue
-        
+
+            body = self._format_source(ctx)
+            tokens = _count_tokens(body)
+            if selected and used_tokens + tokens > max_tokens:
+                continue
+
+            seen.add(key)
+            selected.append((ctx, body))
+            used_tokens += tokens
+
+        return selected
+
+    def _fallback_answer(self, context: list[dict],
+                         last_error: Optional[Exception]) -> tuple[str, float]:
+        """Build an answer straight from the context when the LLM fails."""
         # If we have context but LLM failed, provide a basic answer from context
         if context:
             # Build a simple answer from context without LLM
@@ -280,14 +926,14 @@ Provide a clear, sourced answer. If the information isn't in the context, say so
             
             for ctx in context[:5]:
                 if ctx.get("decision_content"):
-                    part = f"\n**Decision:** {ctx['decision_content']}"
+                    lines = [f"\n**Decision:** {ctx['decision_content']}"]
                     if ctx.get("rationale"):
-                        part += f"\n  - Rationale: {ctx['rationale']}"
+                        lines.append(f"  - Rationale: {ctx['rationale']}")
                     if ctx.get("made_by"):
-                        part += f"\n  - Made by: {ctx['made_by']}"
+                        lines.append(f"  - Made by: {ctx['made_by']}")
                     if ctx.get("meeting_title"):
-                        part += f"\n  - From: {ctx['meeting_title']} ({ctx.get('meeting_date', 'unknown date')})"
-                    fallback_parts.append(part)
+                        lines.append(f"  - From: {ctx['meeting_title']} ({ctx.get('meeting_date', 'unknown date')})")
+                    fallback_parts.append("\n".join(lines))
                 elif ctx.get("content"):
                     content = ctx['content'][:300]
                     if ctx.get("meeting_title"):
@@ -305,62 +951,77 @@ Provide a clear, sourced answer. If the information isn't in the context, say so
 
     def _format_context(self, context: list[dict]) -> str:
         """Format context for the LLM prompt."""
-        if not context:
-            return "No context available."
+        if logger.isEnabledFor(logging.DEBUG):
+            for i, ctx in enumerate(context, 1):
+                logger.debug("Formatting source %d: keys=%s...", i, list(ctx.keys())[:5])
 
-        parts = []
-
-        for i, ctx in enumerate(context, 1):
-            lines = [f"--- Source {i} ---"]
-
-            # Debug: print what we're working with
-            print(f"  Formatting source {i}: keys={list(ctx.keys())[:5]}...")
-
-            # Add meeting info if available
-            meeting_title = ctx.get("meeting_title")
-            meeting_date = ctx.get("meeting_date")
-            if meeting_title:
-                meeting_line = f"Meeting: {meeting_title}"
-                if meeting_date:
-                    meeting_line += f" ({meeting_date})"
-                lines.append(meeting_line)
-
-            # Add decision info if available
-            decision_content = ctx.get("decision_content")
-            if decision_content:
-                lines.append(f"Decision: {decision_content}")
-                rationale = ctx.get("rationale")
-                if rationale:
-                    lines.append(f"Rationale: {rationale}")
-                made_by = ctx.get("made_by")
-                if made_by:
-                    lines.append(f"Made by: {made_by}")
-                quote = ctx.get("quote")
-                if quote:
-                    lines.append(f"Quote: \"{quote}\"")
-
-            # Add content for non-decision items or as fallback
-            content = ctx.get("content")
-            if content and not decision_content:
-                lines.append(f"Content: {content[:500]}")
+        return self._join_sources([self._format_source(ctx) for ctx in context])
 
-            # Fallback: if we only have the header, add whatever content we can find
-            if len(lines) == 1:
-                if content:
-                    lines.append(f"Content: {content[:500]}")
-                elif ctx.get("metadata"):
-                    # Try to extract info from metadata
-                    meta = ctx.get("metadata", {})
-                    if meta.get("topic"):
-                        lines.append(f"Topic: {meta.get('topic')}")
+    @staticmethod
+    def _join_sources(bodies: list[str]) -> str:
+        """Number formatted source bodies and join them into the prompt context."""
+        if not bodies:
+            return "No context available."
 
-            part = "\n".join(lines)
-            parts.append(part)
+        parts = [
+            f"--- Source {i} ---\n{body}" if body else f"--- Source {i} ---"
+            for i, body in enumerate(bodies, 1)
+        ]
 
         formatted = "\n\n".join(parts)
-        print(f"  Formatted {len(parts)} sources, total length: {len(formatted)}")
+        logger.debug("Formatted %d sources, total length: %d", len(parts), len(formatted))
         return formatted
 
+    @staticmethod
+    def _format_source(ctx: dict) -> str:
+        """Format the body of one context item (without its Source header)."""
+        get = ctx.get
+        lines = []
+
+        # Add meeting info if available
+        meeting_title = get("meeting_title")
+        if meeting_title:
+            meeting_date = get("meeting_date")
+            lines.append(f"Meeting: {meeting_title} ({meeting_date})" if meeting_date
+                         else f"Meeting: {meeting_title}")
+
+        # Decision info if available, otherwise the raw content
+        decision_content = get("decision_content")
+        if decision_content:
+            lines.append(f"Decision: {decision_content}")
+            rationale = get("rationale")
+            if rationale:
+                lines.append(f"Rationale: {rationale}")
+            made_by = get("made_by")
+            if made_by:
+                lines.append(f"Made by: {made_by}")
+            quote = get("quote")
+            if quote:
+                lines.append(f"Quote: \"{quote}\"")
+        else:
+            content = get("content")
+            if content:
+                lines.append(f"Content: {content[:500]}")
+
+        # Fallback: try to extract something from metadata
+        if not lines:
+            topic = (get("metadata") or {}).get("topic")
+            if topic:
+                lines.append(f"Topic: {topic}")
+
+        return "\n".join(lines)
+
+    def get_cache_stats(self) -> dict:
+        """
+        Get query cache statistics (hits, misses, hit_rate, size).
+
+        Near-duplicate question hits are reported under "semantic".
+        """
+        stats = self._query_cache.stats()
+        if self._semantic_cache is not None:
+            stats["semantic"] = self._semantic_cache.stats()
+        return stats
+
     # ==================== Convenience Methods ====================
 
     def why(self, topic: str) -> QueryResult:
@@ -379,7 +1040,23 @@ Provide a clear, sourced answer. If the information isn't in the context, say so
         """Shortcut for 'What's the status of X?' queries."""
         return self.query(f"What's the current status of {topic}?")
 
-    def query_fast(self, question: str) -> QueryResult:
+    def why_batch(self, topics: list[str]) -> list[QueryResult]:
+        """Batched why() over several topics."""
+        return self.multi_query([f"Why did we decide {topic}?" for topic in topics])
+
+    def who_batch(self, topics: list[str]) -> list[QueryResult]:
+        """Batched who() over several topics."""
+        return self.multi_query([f"Who decided {topic}?" for topic in topics])
+
+    def what_happened_batch(self, topics: list[str]) -> list[QueryResult]:
+        """Batched what_happened() over several topics."""
+        return self.multi_query([f"What happened with {topic}?" for topic in topics])
+
+    def status_batch(self, topics: list[str]) -> list[QueryResult]:
+        """Batched status() over several topics."""
+        return self.multi_query([f"What's the current status of {topic}?" for topic in topics])
+
+    def query_fast(self, question: str, stream: bool = False) -> QueryResult:
         """
         Fast query using Backboard's integrated memory + LLM.
 
@@ -387,9 +1064,33 @@ Provide a clear, sourced answer. If the information isn't in the context, say so
         RAG directly. Best for simple factual questions.
 
         Falls back to full query() if Backboard isn't available or errors.
+
+        Args:
+            question: Natural language question
+            stream: Return the answer as an iterator of tokens, as in
+                query(stream=True). Backboard answers arrive whole, so
+                only the local fallback actually streams.
         """
         start_time = time.time()
 
+        cache_key = QueryCache.make_key(question, "fast")
+        cached, vector = self._cached_result(question, cache_key, "fast")
+        if cached is not None:
+            result = replace(cached, query_time_ms=(time.time() - start_time) * 1000)
+            if stream:
+                result.answer = iter([cached.answer])
+            return result
+
+        result = self._run_query_fast(question, start_time, stream)
+        if isinstance(result.answer, str) and self._cacheable(result):
+            self._store_result(cache_key, vector, "fast", result)
+            if stream:
+                result = replace(result, answer=iter([result.answer]))
+        return result
+
+    def _run_query_fast(self, question: str, start_time: float,
+                        stream: bool = False) -> QueryResult:
+        """Backboard RAG with local fallback (uncached)."""
         # Try Backboard's integrated RAG if available
         if (self.embeddings.use_backboard and
             self.embeddings.backboard_api_key and
@@ -402,7 +1103,7 @@ Provide a clear, sourced answer. If the information isn't in the context, say so
                     # Check if answer is an error message
                     if "Error" in answer and ("402" in answer or "credits" in answer.lower()):
                         print("Backboard API out of credits, falling back to local query...")
-                        return self.query(question)
+                        return self.query(question, stream=stream)
 
                     query_time_ms = (time.time() - start_time) * 1000
                     sources = [
@@ -426,4 +1127,4 @@ Provide a clear, sourced answer. If the information isn't in the context, say so
                 print(f"Backboard query failed: {e}, falling back to local query...")
 
         # Fallback to full query
-        return self.query(question)
+        return self.query(question, stream=stream)
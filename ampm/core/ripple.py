@@ -12,18 +12,70 @@ When a decision is modified:
 """
 
 import os
+import json
+import asyncio
 import time
+import hashlib
+import functools
+import itertools
 from typing import Optional
-from dataclasses import dataclass
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, replace
+from concurrent.futures import ThreadPoolExecutor
 
-from cerebras.cloud.sdk import Cerebras
+from cerebras.cloud.sdk import APITimeoutError, AsyncCerebras, Cerebras
 
 from .graph import MeetingGraph
+from .cache import QueryCache
+from .http import shared_http_client
 from ..models import Decision, ActionItem, ActionStatus
 
+# Words too common to signal that a task relates to a decision
+_STOPWORDS = frozenset({
+    "a", "an", "the", "and", "or", "to", "of", "for", "in", "on", "at", "by",
+    "with", "from", "as", "is", "be", "we", "our", "it", "this", "that", "-",
+})
 
-@dataclass
+
+# One system prompt, byte-for-byte identical across every ripple call, so
+# the provider's prefix cache can serve its prefill. The first line of the
+# user message names the task.
+_SYSTEM_PROMPT = """You analyze the downstream impact of a changed meeting decision. Be concise.
+The first line of each request names the task. Respond with JSON only.
+
+TASK: ACTION_ITEMS
+Decide which numbered action items are affected by the decision change.
+Give one entry per item:
+{"items": [{"idx": 1, "affected": true, "severity": "critical|high|medium|low", "reason": "brief explanation", "suggestion": "what to do", "confidence": 0.0-1.0}, ...]}
+
+TASK: ACTION_ITEM_UPDATE
+The change was revised after an earlier analysis; each item carries its previous verdict.
+Use the same format as ACTION_ITEMS, with entries ONLY for items whose verdict or severity changes.
+
+TASK: DECISION
+Decide whether the new decision conflicts with the existing one:
+{"conflict": true, "severity": "critical|high|medium|low", "reason": "brief explanation"}"""
+
+
+# Severity -> bucket index, most severe first (unknown severities sort last)
+_SEVERITY_RANK = {"critical": 0, "high": 1, "medium": 2, "low": 3}
+
+# Action items in these states cannot be affected by a decision change
+_CLOSED_STATUSES = frozenset({ActionStatus.COMPLETED, ActionStatus.CANCELLED})
+
+
+def _severity(value, default: str) -> str:
+    """Normalize an LLM-reported severity, falling back to a default if unknown."""
+    severity = str(value or "").strip().lower()
+    return severity if severity in _SEVERITY_RANK else default
+
+
+@functools.lru_cache(maxsize=4096)
+def _keywords(text: str) -> frozenset[str]:
+    """Lower-cased words of a text, minus stopwords (memoized per text)."""
+    return frozenset(text.lower().split()) - _STOPWORDS
+
+
+@dataclass(slots=True, frozen=True)
 class Impact:
     """An impacted artifact."""
     id: str
@@ -34,7 +86,7 @@ class Impact:
     suggestion: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RippleReport:
     """Report of all downstream impacts from a change."""
     change_description: str
@@ -55,18 +107,68 @@ class RippleDetector:
     - "If we change this requirement, who needs to know?"
     """
 
-    def __init__(self, graph: MeetingGraph):
+    def __init__(self, graph: MeetingGraph, analysis_budget_s: float = 10.0,
+                 request_timeout_s: float = 2.0,
+                 draft_model: Optional[str] = "llama3.1-8b",
+                 target_model: str = "llama-3.3-70b"):
         """
         Initialize the ripple detector.
 
         Args:
             graph: The meeting knowledge graph
+            analysis_budget_s: Wall-clock budget for one detect() call; items
+                not analyzed in time are flagged for manual review
+            request_timeout_s: Timeout for each related-decision LLM call
+            draft_model: Small model that screens action items first; only
+                items it finds affected (or is unsure about) go to the
+                target model. None to always use the target model.
+            target_model: Model whose verdicts are final
         """
         self.graph = graph
+        self.analysis_budget_s = analysis_budget_s
+        self.request_timeout_s = request_timeout_s
+        self.draft_model = draft_model
+        self.target_model = target_model
+
+        # Draft "not affected" verdicts below this confidence are re-checked
+        self.draft_min_confidence = 0.8
+
+        # LLM verdicts keyed on the exact change and item, so repeated
+        # what-if exploration skips the round trip. Values are 1-tuples
+        # because "not affected" (None) is a verdict worth caching too.
+        self._verdict_cache = QueryCache(max_size=4096, ttl_seconds=3600)
+
+        # Last action-item verdicts per decision, for incremental what-ifs:
+        # decision_id -> {"old_value", "new_value", "verdicts"}
+        self._sessions: dict[str, dict] = {}
+
+        # Keyword -> IDs of action items whose task contains it. Built on
+        # first use and dropped whenever the graph changes.
+        self._keyword_index: Optional[dict[str, set[str]]] = None
+        graph.on_change(self._invalidate_keyword_index)
+
+        # Whole what_if() reports keyed on (topic, change); any graph
+        # mutation can change the answer, so the cache is cleared on change
+        self._what_if_cache = QueryCache(max_size=128, ttl_seconds=3600)
+        graph.on_change(self._what_if_cache.clear)
+
+        # Verdicts that fell back (LLM error, timeout, budget ran out).
+        # what_if() only caches reports analyzed without any.
+        self._degraded_verdicts = 0
+
+        # Action items screened, and how many the prefilter ruled out
+        self._prefilter_checked = 0
+        self._prefilter_skipped = 0
+
         self.cerebras = None
+        self._async_cerebras = None  # Created on first adetect()
         if os.getenv("CEREBRAS_API_KEY"):
             try:
-                self.cerebras = Cerebras(api_key=os.getenv("CEREBRAS_API_KEY"))
+                # All detectors share one connection pool
+                self.cerebras = Cerebras(
+                    api_key=os.getenv("CEREBRAS_API_KEY"),
+                    http_client=shared_http_client()
+                )
             except Exception:
                 pass
 
@@ -88,20 +190,11 @@ class RippleDetector:
         # Get the original decision
         decision = self.graph.get_decision(decision_id)
         if not decision:
-            return RippleReport(
-                change_description=f"Decision {decision_id} not found",
-                total_affected=0,
-                impacts=[],
-                people_to_notify=[],
-                suggestions=[],
-                analysis_time_ms=0
-            )
+            return self._not_found_report(decision_id)
 
         if old_value is None:
             old_value = decision.content
 
-        change_description = f"Change: '{old_value}' → '{new_value}'"
-
         # Get all dependent nodes (action items that follow from this decision)
         dependent_ids = self._get_dependent_nodes(decision_id)
 
@@ -109,14 +202,56 @@ class RippleDetector:
         impacts = self._analyze_impacts(
             dependent_ids,
             old_value,
-            new_value
+            new_value,
+            decision_id,
+            deadline=start_time + self.analysis_budget_s
         )
 
-        # Collect people to notify
-        people_to_notify = self._get_people_to_notify(impacts)
+        return self._build_report(old_value, new_value, impacts, start_time)
+
+    async def adetect(self, decision_id: str, new_value: str,
+                      old_value: Optional[str] = None) -> RippleReport:
+        """
+        Async version of detect().
+
+        The related-decision checks run concurrently on the async Cerebras
+        client, alongside the batched action-item call.
+        """
+        start_time = time.time()
+
+        decision = self.graph.get_decision(decision_id)
+        if not decision:
+            return self._not_found_report(decision_id)
+
+        if old_value is None:
+            old_value = decision.content
+
+        dependent_ids = self._get_dependent_nodes(decision_id)
+        impacts = await self._aanalyze_impacts(
+            dependent_ids, old_value, new_value, decision_id,
+            deadline=start_time + self.analysis_budget_s
+        )
 
-        # Generate suggestions
-        suggestions = self._generate_suggestions(impacts, new_value)
+        return self._build_report(old_value, new_value, impacts, start_time)
+
+    def _not_found_report(self, decision_id: str) -> RippleReport:
+        """Empty report for an unknown decision."""
+        return RippleReport(
+            change_description=f"Decision {decision_id} not found",
+            total_affected=0,
+            impacts=[],
+            people_to_notify=[],
+            suggestions=[],
+            analysis_time_ms=0
+        )
+
+    def _build_report(self, old_value: str, new_value: str,
+                      impacts: list[Impact], start_time: float) -> RippleReport:
+        """Assemble the report for analyzed impacts."""
+        change_description = f"Change: '{old_value}' → '{new_value}'"
+
+        # People to notify and suggestions, in one pass over the impacts
+        people_to_notify, suggestions = self._finalize(impacts, new_value)
 
         analysis_time_ms = (time.time() - start_time) * 1000
 
@@ -137,31 +272,104 @@ class RippleDetector:
         - Action items that follow from this decision
         - Other decisions with the same topic
         """
-        dependent_ids = []
+        # Action items that depend on this decision (from graph edges)
+        dependent_ids = self.graph.get_action_item_ids_by_decision(decision_id)
 
-        # Find action items that depend on this decision
-        for action_id, action in self.graph._action_items.items():
-            if action.decision_id == decision_id:
-                dependent_ids.append(action_id)
-
-        # Find related decisions (same topic)
+        # Related decisions (same topic, from the topic index)
         decision = self.graph.get_decision(decision_id)
         if decision and decision.topic:
-            for other_id, other_dec in self.graph._decisions.items():
-                if other_id != decision_id and other_dec.topic == decision.topic:
-                    dependent_ids.append(other_id)
+            dependent_ids.extend(
+                other_id for other_id in self.graph.get_decision_ids_by_topic(decision.topic)
+                if other_id != decision_id
+            )
 
         return dependent_ids
 
-    def _analyze_impacts(self, node_ids: list[str],
-                         old_value: str, new_value: str) -> list[Impact]:
+    def _analyze_impacts(self, node_ids: list[str], old_value: str, new_value: str,
+                         decision_id: Optional[str] = None,
+                         deadline: Optional[float] = None) -> list[Impact]:
         """
         Analyze each downstream node for impact.
-        Uses parallel LLM calls for speed.
+
+        Action items share one batched LLM call; with an LLM available,
+        that call and the related-decision checks all run concurrently.
         """
-        impacts = []
+        decisions, action_items = self._group_dependents(node_ids)
+
+        if not self.cerebras or not decisions:
+            impacts = self._analyze_action_items(
+                action_items, old_value, new_value, decision_id, deadline
+            )
+            impacts.extend(
+                impact for impact in (
+                    self._analyze_decision_impact(d, old_value, new_value, deadline)
+                    for d in decisions
+                ) if impact
+            )
+            return self._sort_impacts(impacts)
+
+        # Related decisions are submitted shortest prompt first
+        with ThreadPoolExecutor(max_workers=min(8, len(decisions) + 1)) as pool:
+            action_future = pool.submit(
+                self._analyze_action_items, action_items, old_value, new_value,
+                decision_id, deadline
+            )
+            decision_futures = [
+                pool.submit(self._analyze_decision_impact, d, old_value, new_value, deadline)
+                for d in decisions
+            ]
+
+            impacts = action_future.result()
+            for future in decision_futures:
+                impact = future.result()
+                if impact:
+                    impacts.append(impact)
+
+        return self._sort_impacts(impacts)
+
+    async def _aanalyze_impacts(self, node_ids: list[str], old_value: str, new_value: str,
+                                decision_id: Optional[str] = None,
+                                deadline: Optional[float] = None) -> list[Impact]:
+        """Analyze impacts with the related-decision checks running concurrently."""
+        decisions, action_items = self._group_dependents(node_ids)
+
+        results = await asyncio.gather(
+            self._aanalyze_action_items(action_items, old_value, new_value, decision_id, deadline),
+            *(self._aanalyze_decision_impact(d, old_value, new_value, deadline) for d in decisions)
+        )
 
-        # Group nodes by type
+        impacts = list(results[0])
+        impacts.extend(impact for impact in results[1:] if impact)
+        return self._sort_impacts(impacts)
+
+    async def _aanalyze_action_items(self, action_items: list[ActionItem], old_value: str,
+                                     new_value: str, decision_id: Optional[str],
+                                     deadline: Optional[float]) -> list[Impact]:
+        """
+        Run the action-item batch in a worker thread, bounded by the deadline.
+
+        Items are screened once, here. On timeout the candidates are
+        flagged for manual review; the thread keeps running and still
+        caches its verdicts.
+        """
+        candidates = self._screen_action_items(action_items, old_value, decision_id)
+        if not candidates:
+            return []
+
+        try:
+            return await asyncio.wait_for(
+                asyncio.to_thread(
+                    self._analyze_candidates, candidates, old_value, new_value,
+                    decision_id, deadline
+                ),
+                timeout=self._time_left(deadline)
+            )
+        except asyncio.TimeoutError:
+            self._degraded_verdicts += 1
+            return [self._unanalyzed_action_impact(action) for action, _ in candidates]
+
+    def _group_dependents(self, node_ids: list[str]) -> tuple[list[Decision], list[ActionItem]]:
+        """Split dependent node IDs into decisions and action items."""
         decisions = []
         action_items = []
 
@@ -171,217 +379,567 @@ class RippleDetector:
             elif node_id in self.graph._action_items:
                 action_items.append(self.graph._action_items[node_id])
 
-        # Analyze action items (parallel)
-        with ThreadPoolExecutor(max_workers=5) as executor:
-            futures = []
+        # Short prompts first, so a long outlier cannot hold up the rest
+        decisions.sort(key=lambda d: len(d.content))
+        return decisions, action_items
 
-            for action in action_items:
-                future = executor.submit(
-                    self._analyze_action_item_impact,
-                    action, old_value, new_value
-                )
-                futures.append(future)
+    def _screen_action_items(self, action_items: list[ActionItem], old_value: str,
+                             decision_id: Optional[str] = None
+                             ) -> list[tuple[ActionItem, frozenset[str]]]:
+        """
+        Action items the prefilter could not rule out, shortest task first.
 
-            for future in as_completed(futures):
-                impact = future.result()
-                if impact:
-                    impacts.append(impact)
+        Each candidate comes with the keywords it shares with the old decision.
+        """
+        old_keywords = _keywords(old_value)
+        matching_ids = self._actions_matching(old_keywords)
+        decision = self.graph.get_decision(decision_id) if decision_id else None
+        candidates = []
+        for action in action_items:
+            self._prefilter_checked += 1
+            if action.id not in matching_ids or self._quick_classify(action, old_keywords, decision):
+                self._prefilter_skipped += 1
+                continue
+            candidates.append((action, old_keywords & _keywords(action.task)))
+
+        candidates.sort(key=lambda candidate: len(candidate[0].task))
+        return candidates
+
+    def _analyze_action_items(self, action_items: list[ActionItem], old_value: str,
+                              new_value: str, decision_id: Optional[str],
+                              deadline: Optional[float] = None) -> list[Impact]:
+        """Screen action items cheaply; only overlapping ones need analysis."""
+        candidates = self._screen_action_items(action_items, old_value, decision_id)
+
+        if not candidates:
+            return []
+
+        return self._analyze_candidates(candidates, old_value, new_value, decision_id, deadline)
+
+    def _analyze_candidates(self, candidates: list[tuple[ActionItem, frozenset[str]]],
+                            old_value: str, new_value: str, decision_id: Optional[str],
+                            deadline: Optional[float] = None) -> list[Impact]:
+        """Analyze screened action items (see _screen_action_items())."""
+        if self.cerebras:
+            return self._analyze_action_items_cached(
+                [action for action, _ in candidates], old_value, new_value, decision_id, deadline
+            )
+        return [
+            self._heuristic_action_impact(action, overlap)
+            for action, overlap in candidates
+        ]
+
+    @staticmethod
+    def _sort_impacts(impacts: list[Impact]) -> list[Impact]:
+        """Sort impacts by severity, most severe first (stable bucket sort)."""
+        buckets: list[list[Impact]] = [[], [], [], [], []]
+        for impact in impacts:
+            buckets[_SEVERITY_RANK.get(impact.severity, 4)].append(impact)
+        return list(itertools.chain.from_iterable(buckets))
+
+    def _invalidate_keyword_index(self) -> None:
+        """Drop the keyword index (graph change hook)."""
+        self._keyword_index = None
+
+    def _actions_matching(self, keywords: frozenset[str]) -> set[str]:
+        """IDs of all action items sharing at least one keyword, via the inverted index."""
+        index = self._keyword_index
+        if index is None:
+            index = {}
+            for action_id, action in self.graph._action_items.items():
+                for word in _keywords(action.task):
+                    index.setdefault(word, set()).add(action_id)
+            self._keyword_index = index
+
+        matching: set[str] = set()
+        for word in keywords:
+            ids = index.get(word)
+            if ids:
+                matching |= ids
+        return matching
+
+    @staticmethod
+    def _quick_classify(action: ActionItem, old_keywords: frozenset[str],
+                        decision: Optional[Decision] = None) -> bool:
+        """
+        Cheap structural check that an action item is not affected.
 
-        # Analyze related decisions
-        for decision in decisions:
-            impact = self._analyze_decision_impact(decision, old_value, new_value)
-            if impact:
-                impacts.append(impact)
+        True (no LLM call needed) when the action is closed, shares no
+        keywords with the old decision, or was created in an earlier
+        meeting before the decision was made.
+        """
+        if action.status in _CLOSED_STATUSES:
+            return True
 
-        # Sort by severity
-        severity_order = {"critical": 0, "high": 1, "medium": 2, "low": 3}
-        impacts.sort(key=lambda x: severity_order.get(x.severity, 4))
+        if old_keywords.isdisjoint(_keywords(action.task)):
+            return True
 
-        return impacts
+        return (
+            decision is not None
+            and action.meeting_id != decision.meeting_id
+            and action.created_at < decision.timestamp
+        )
 
-    def _analyze_action_item_impact(self, action: ActionItem,
-                                    old_value: str, new_value: str) -> Optional[Impact]:
-        """Analyze if an action item is impacted by the change."""
-        # Skip completed actions
-        if action.status == ActionStatus.COMPLETED:
-            return None
+    def get_prefilter_stats(self) -> dict:
+        """Get how many action items the prefilter ruled out without an LLM call."""
+        checked = self._prefilter_checked
+        return {
+            "checked": checked,
+            "skipped": self._prefilter_skipped,
+            "skip_rate": self._prefilter_skipped / checked if checked else 0.0,
+        }
+
+    def _heuristic_action_impact(self, action: ActionItem, overlap: frozenset[str]) -> Impact:
+        """Impact based on keyword match alone (no LLM available)."""
+        return Impact(
+            id=action.id,
+            type="action_item",
+            title=action.task,
+            severity="high" if len(overlap) > 2 else "medium",
+            reason=f"Task contains keywords from changed decision: {', '.join(list(overlap)[:3])}",
+            suggestion="Review and update task based on new decision"
+        )
 
-        # Quick heuristic check - keyword overlap
-        old_keywords = set(old_value.lower().split())
-        action_keywords = set(action.task.lower().split())
-        overlap = old_keywords & action_keywords
+    @staticmethod
+    def _unanalyzed_action_impact(action: ActionItem) -> Impact:
+        """Impact for an action item the LLM could not analyze in time."""
+        return Impact(
+            id=action.id,
+            type="action_item",
+            title=action.task,
+            severity="medium",
+            reason="Not analyzed within the time budget - may be affected",
+            suggestion="Review and update task based on new decision"
+        )
 
-        # If no keyword overlap, likely not impacted
-        if not overlap:
+    @staticmethod
+    def _time_left(deadline: Optional[float]) -> Optional[float]:
+        """Seconds until the deadline (None when unbounded), never negative."""
+        if deadline is None:
             return None
+        return max(0.0, deadline - time.time())
 
-        # If no LLM available, return simple impact based on keyword match
-        if not self.cerebras:
-            return Impact(
-                id=action.id,
-                type="action_item",
-                title=action.task,
-                severity="high" if len(overlap) > 2 else "medium",
-                reason=f"Task contains keywords from changed decision: {', '.join(list(overlap)[:3])}",
-                suggestion="Review and update task based on new decision"
+    def _request_timeout(self, deadline: Optional[float]) -> float:
+        """Timeout for one related-decision call: the per-request cap or what is left."""
+        left = self._time_left(deadline)
+        return self.request_timeout_s if left is None else min(self.request_timeout_s, left)
+
+    @staticmethod
+    def _verdict_key(*parts: str) -> str:
+        """Cache key for an LLM verdict: SHA-256 of the NUL-joined parts."""
+        return hashlib.sha256("\x00".join(parts).encode()).hexdigest()
+
+    def _analyze_action_items_cached(self, actions: list[ActionItem], old_value: str,
+                                     new_value: str, decision_id: Optional[str] = None,
+                                     deadline: Optional[float] = None) -> list[Impact]:
+        """
+        Serve cached verdicts and analyze the rest with one LLM call.
+
+        If the same decision was just analyzed against a different new
+        value, the call is an incremental one that only reports flips.
+        The call gets whatever is left of the deadline; if it runs out,
+        the uncached items are flagged for manual review.
+        """
+        verdicts: dict[str, Optional[Impact]] = {}
+        misses = []
+        for action in actions:
+            key = self._verdict_key(old_value, new_value, action.task, action.status.value)
+            cached = self._verdict_cache.get(key)
+            if cached is None:
+                misses.append((action, key))
+            else:
+                verdicts[action.id] = cached[0]
+
+        if misses:
+            miss_actions = [action for action, _ in misses]
+            timeout = self._time_left(deadline)
+            session = self._sessions.get(decision_id) if decision_id else None
+            if timeout == 0:
+                analyzed = None
+            elif (session and session["old_value"] == old_value
+                    and all(action.id in session["verdicts"] for action in miss_actions)):
+                analyzed = self._analyze_action_items_delta(
+                    miss_actions, old_value, session["new_value"], new_value,
+                    session["verdicts"], timeout=timeout
+                )
+            else:
+                analyzed = self._analyze_action_items_batch(
+                    miss_actions, old_value, new_value, timeout=timeout
+                )
+
+            if analyzed is None:
+                # Nothing to cache; report whatever was already known, and
+                # flag the rest if the budget ran out
+                self._degraded_verdicts += 1
+                impacts = [impact for impact in verdicts.values() if impact]
+                if self._time_left(deadline) == 0:
+                    impacts.extend(self._unanalyzed_action_impact(action) for action in miss_actions)
+                return impacts
+
+            for action, key in misses:
+                verdicts[action.id] = analyzed.get(action.id)
+                self._verdict_cache.put(key, (verdicts[action.id],))
+
+        if decision_id:
+            self._sessions[decision_id] = {
+                "old_value": old_value,
+                "new_value": new_value,
+                "verdicts": verdicts,
+            }
+
+        return [impact for impact in verdicts.values() if impact]
+
+    def _analyze_action_items_batch(self, actions: list[ActionItem], old_value: str,
+                                    new_value: str, timeout: Optional[float] = None
+                                    ) -> Optional[dict[str, Optional[Impact]]]:
+        """
+        Analyze several action items with a single LLM call.
+
+        With a draft model configured, the small model answers first and
+        its confident "not affected" verdicts are final; only the items
+        it flags (or is unsure about) are re-asked of the target model,
+        with the same prompt.
+
+        Returns:
+            Action ID -> Impact (None if not affected), or None if the call fails
+        """
+        started = time.time()
+        verdicts: dict[str, Optional[Impact]] = {}
+        pending = actions
+
+        if self.draft_model and self.draft_model != self.target_model:
+            draft = self._request_verdicts(
+                self._batch_prompt(pending, old_value, new_value),
+                pending,
+                max_tokens=150 * len(pending),
+                timeout=timeout,
+                model=self.draft_model,
+                min_confidence=self.draft_min_confidence
+            )
+            if draft:
+                verdicts = {action_id: None for action_id, impact in draft.items() if impact is None}
+                pending = [action for action in pending if action.id not in verdicts]
+
+        if pending:
+            if timeout is not None:
+                timeout = timeout - (time.time() - started)
+                if timeout <= 0:
+                    return None
+            returned = self._request_verdicts(
+                self._batch_prompt(pending, old_value, new_value),
+                pending,
+                max_tokens=150 * len(pending),
+                timeout=timeout
             )
+            if returned is None:
+                return None
+            for action in pending:
+                verdicts[action.id] = returned.get(action.id)
 
-        # Use LLM for detailed analysis
-        try:
-            response = self.cerebras.chat.completions.create(
-                model="llama-3.3-70b",
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You analyze if a task is impacted by a decision change. Be concise."
-                    },
-                    {
-                        "role": "user",
-                        "content": f"""Is this action item affected by the decision change?
+        return verdicts
 
+    @staticmethod
+    def _batch_prompt(actions: list[ActionItem], old_value: str, new_value: str) -> str:
+        """User prompt for a batch of action-item verdicts."""
+        items = "\n".join(
+            f"[{idx}] task=\"{action.task}\" status={action.status.value}"
+            for idx, action in enumerate(actions, 1)
+        )
+        return f"""TASK: ACTION_ITEMS
 Decision change: "{old_value}" → "{new_value}"
 
-Action item: "{action.task}"
-Status: {action.status.value}
+Items:
+{items}"""
+
+    def _analyze_action_items_delta(self, actions: list[ActionItem], old_value: str,
+                                    previous_new_value: str, new_value: str,
+                                    previous: dict[str, Optional[Impact]],
+                                    timeout: Optional[float] = None
+                                    ) -> Optional[dict[str, Optional[Impact]]]:
+        """
+        Re-analyze action items for a revised change, reporting only flips.
 
-If affected, respond with:
-SEVERITY: [critical/high/medium/low]
-REASON: [brief explanation]
-SUGGESTION: [what to do]
+        The prompt carries the previous verdicts, and the model answers for
+        the items whose verdict changes, so output stays short when the
+        user iterates on the same decision ("switch to PayPal" → "switch
+        to Stripe").
 
-If not affected, respond with just: NOT_AFFECTED"""
-                    }
+        Returns:
+            Action ID -> Impact (None if not affected), or None if the call fails
+        """
+        lines = []
+        for idx, action in enumerate(actions, 1):
+            impact = previous.get(action.id)
+            verdict = f"affected ({impact.severity})" if impact else "not affected"
+            lines.append(f"[{idx}] task=\"{action.task}\" status={action.status.value} previously={verdict}")
+        items = "\n".join(lines)
+
+        returned = self._request_verdicts(
+            f"""TASK: ACTION_ITEM_UPDATE
+Previously we analyzed the change "{old_value}" → "{previous_new_value}".
+The target is now "{new_value}".
+
+Items:
+{items}""",
+            actions,
+            max_tokens=150 * len(actions),
+            timeout=timeout
+        )
+        if returned is None:
+            return None
+
+        verdicts = {action.id: previous.get(action.id) for action in actions}
+        verdicts.update(returned)
+        return verdicts
+
+    def _request_verdicts(self, user_prompt: str, actions: list[ActionItem], max_tokens: int,
+                          timeout: Optional[float] = None, model: Optional[str] = None,
+                          min_confidence: Optional[float] = None
+                          ) -> Optional[dict[str, Optional[Impact]]]:
+        """
+        Ask the LLM for JSON verdicts on numbered action items.
+
+        Args:
+            model: Model to ask (defaults to the target model)
+            min_confidence: If set, "not affected" verdicts reported with a
+                lower confidence are left out, as if unanswered
+
+        Returns:
+            Action ID -> Impact (None if not affected) for each item the
+            model answered for, or None if the call fails
+        """
+        try:
+            response = self.cerebras.chat.completions.create(
+                model=model or self.target_model,
+                messages=[
+                    {"role": "system", "content": _SYSTEM_PROMPT},
+                    {"role": "user", "content": user_prompt}
                 ],
-                max_tokens=150,
-                temperature=0.3
+                response_format={"type": "json_object"},
+                max_tokens=max_tokens,
+                temperature=0.3,
+                **({"timeout": timeout} if timeout is not None else {})
             )
 
-            result = response.choices[0].message.content.strip()
+            verdicts = json.loads(response.choices[0].message.content).get("items", [])
 
-            if "NOT_AFFECTED" in result:
-                return None
+        except Exception as e:
+            print(f"Error analyzing action items: {e}")
+            return None
+
+        if not isinstance(verdicts, list):
+            print(f"Error analyzing action items: expected an items list, got {type(verdicts).__name__}")
+            return None
 
-            # Parse response
-            lines = result.split("\n")
-            severity = "medium"
-            reason = "May be affected by decision change"
-            suggestion = "Review and update if needed"
-
-            for line in lines:
-                if line.startswith("SEVERITY:"):
-                    severity = line.replace("SEVERITY:", "").strip().lower()
-                elif line.startswith("REASON:"):
-                    reason = line.replace("REASON:", "").strip()
-                elif line.startswith("SUGGESTION:"):
-                    suggestion = line.replace("SUGGESTION:", "").strip()
-
-            return Impact(
+        returned = {}
+        for verdict in verdicts:
+            if not isinstance(verdict, dict):
+                continue
+            try:
+                idx = int(verdict.get("idx"))
+            except (TypeError, ValueError):
+                continue
+            if not 1 <= idx <= len(actions):
+                continue
+            action = actions[idx - 1]
+
+            if not verdict.get("affected"):
+                if min_confidence is not None:
+                    try:
+                        confidence = float(verdict.get("confidence", 0.0))
+                    except (TypeError, ValueError):
+                        confidence = 0.0
+                    if confidence < min_confidence:
+                        continue
+                returned[action.id] = None
+                continue
+
+            returned[action.id] = Impact(
                 id=action.id,
                 type="action_item",
                 title=action.task,
-                severity=severity,
-                reason=reason,
-                suggestion=suggestion
+                severity=_severity(verdict.get("severity"), "medium"),
+                reason=verdict.get("reason") or "May be affected by decision change",
+                suggestion=verdict.get("suggestion") or "Review and update if needed"
             )
 
-        except Exception as e:
-            print(f"Error analyzing action item: {e}")
-            return None
+        return returned
 
-    def _analyze_decision_impact(self, decision: Decision,
-                                 old_value: str, new_value: str) -> Optional[Impact]:
+    def _analyze_decision_impact(self, decision: Decision, old_value: str, new_value: str,
+                                 deadline: Optional[float] = None) -> Optional[Impact]:
         """Analyze if a related decision conflicts with the change."""
         # If no LLM available, return simple impact for related decisions
         if not self.cerebras:
-            return Impact(
-                id=decision.id,
-                type="decision",
-                title=decision.content[:50] + "..." if len(decision.content) > 50 else decision.content,
-                severity="medium",
-                reason="Related decision in same topic area - review for consistency",
-                suggestion="Verify this decision is still valid with the change"
-            )
+            return self._heuristic_decision_impact(decision)
+
+        key = self._verdict_key(new_value, decision.content)
+        cached = self._verdict_cache.get(key)
+        if cached is not None:
+            return cached[0]
+
+        # Out of budget: flag for review instead of waiting on the LLM
+        timeout = self._request_timeout(deadline)
+        if timeout == 0:
+            self._degraded_verdicts += 1
+            return self._heuristic_decision_impact(decision)
 
         # Check for potential contradiction with LLM
         try:
             response = self.cerebras.chat.completions.create(
-                model="llama-3.3-70b",
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You analyze if two decisions conflict. Be concise."
-                    },
-                    {
-                        "role": "user",
-                        "content": f"""Does this new decision conflict with an existing one?
-
-New decision: "{new_value}"
-Existing decision: "{decision.content}"
-
-If they conflict, respond with:
-SEVERITY: [critical/high/medium/low]
-REASON: [brief explanation]
-
-If no conflict, respond with: NO_CONFLICT"""
-                    }
-                ],
+                model=self.target_model,
+                messages=self._decision_conflict_messages(decision, new_value),
+                response_format={"type": "json_object"},
                 max_tokens=100,
-                temperature=0.3
+                temperature=0.3,
+                timeout=timeout
+            )
+            return self._decision_impact_from_reply(
+                decision, key, response.choices[0].message.content
             )
 
-            result = response.choices[0].message.content.strip()
+        except APITimeoutError:
+            self._degraded_verdicts += 1
+            return self._heuristic_decision_impact(decision)
+        except Exception as e:
+            print(f"Error analyzing decision: {e}")
+            self._degraded_verdicts += 1
+            return None
 
-            if "NO_CONFLICT" in result:
-                return None
+    async def _aanalyze_decision_impact(self, decision: Decision, old_value: str, new_value: str,
+                                        deadline: Optional[float] = None) -> Optional[Impact]:
+        """Async version of _analyze_decision_impact()."""
+        if not self.cerebras:
+            return self._heuristic_decision_impact(decision)
 
-            # Parse response
-            lines = result.split("\n")
-            severity = "high"
-            reason = "May conflict with existing decision"
-
-            for line in lines:
-                if line.startswith("SEVERITY:"):
-                    severity = line.replace("SEVERITY:", "").strip().lower()
-                elif line.startswith("REASON:"):
-                    reason = line.replace("REASON:", "").strip()
-
-            return Impact(
-                id=decision.id,
-                type="decision",
-                title=decision.content[:50] + "..." if len(decision.content) > 50 else decision.content,
-                severity=severity,
-                reason=reason,
-                suggestion="Review for consistency with new decision"
+        key = self._verdict_key(new_value, decision.content)
+        cached = self._verdict_cache.get(key)
+        if cached is not None:
+            return cached[0]
+
+        timeout = self._request_timeout(deadline)
+        if timeout == 0:
+            self._degraded_verdicts += 1
+            return self._heuristic_decision_impact(decision)
+
+        try:
+            response = await asyncio.wait_for(
+                self._get_async_cerebras().chat.completions.create(
+                    model=self.target_model,
+                    messages=self._decision_conflict_messages(decision, new_value),
+                    response_format={"type": "json_object"},
+                    max_tokens=100,
+                    temperature=0.3,
+                    timeout=timeout
+                ),
+                timeout=timeout
+            )
+            return self._decision_impact_from_reply(
+                decision, key, response.choices[0].message.content
             )
 
+        except (APITimeoutError, asyncio.TimeoutError):
+            self._degraded_verdicts += 1
+            return self._heuristic_decision_impact(decision)
         except Exception as e:
             print(f"Error analyzing decision: {e}")
+            self._degraded_verdicts += 1
             return None
 
-    def _get_people_to_notify(self, impacts: list[Impact]) -> list[str]:
-        """Get list of people who should be notified about impacts."""
+    def _get_async_cerebras(self):
+        """Create (once) the async Cerebras client used by adetect()."""
+        if self._async_cerebras is None:
+            self._async_cerebras = AsyncCerebras(api_key=os.getenv("CEREBRAS_API_KEY"))
+        return self._async_cerebras
+
+    @staticmethod
+    def _heuristic_decision_impact(decision: Decision) -> Impact:
+        """Impact for a related decision when no LLM is available."""
+        return Impact(
+            id=decision.id,
+            type="decision",
+            title=decision.content[:50] + "..." if len(decision.content) > 50 else decision.content,
+            severity="medium",
+            reason="Related decision in same topic area - review for consistency",
+            suggestion="Verify this decision is still valid with the change"
+        )
+
+    @staticmethod
+    def _decision_conflict_messages(decision: Decision, new_value: str) -> list[dict]:
+        """Chat messages asking whether a new decision conflicts with an existing one."""
+        return [
+            {
+                "role": "system",
+                "content": _SYSTEM_PROMPT
+            },
+            {
+                "role": "user",
+                "content": (
+                    "TASK: DECISION\n"
+                    f"New decision: \"{new_value}\"\n"
+                    f"Existing decision: \"{decision.content}\""
+                )
+            }
+        ]
+
+    def _decision_impact_from_reply(self, decision: Decision, key: str,
+                                    reply: str) -> Optional[Impact]:
+        """
+        Parse a JSON conflict verdict into an Impact and cache it.
+
+        Raises:
+            ValueError: If the reply is not a JSON object
+        """
+        verdict = json.loads(reply)
+        if not isinstance(verdict, dict):
+            raise ValueError(f"Expected a JSON object, got: {reply[:100]}")
+
+        if not verdict.get("conflict"):
+            self._verdict_cache.put(key, (None,))
+            return None
+
+        impact = Impact(
+            id=decision.id,
+            type="decision",
+            title=decision.content[:50] + "..." if len(decision.content) > 50 else decision.content,
+            severity=_severity(verdict.get("severity"), "high"),
+            reason=verdict.get("reason") or "May conflict with existing decision",
+            suggestion="Review for consistency with new decision"
+        )
+        self._verdict_cache.put(key, (impact,))
+        return impact
+
+    def _finalize(self, impacts: list[Impact], new_value: str) -> tuple[list[str], list[str]]:
+        """
+        Collect people to notify and generate suggestions in a single pass.
+
+        Returns:
+            (people to notify, actionable suggestions)
+        """
         people = set()
+        add_person = people.add
+        action_items = self.graph._action_items
+        decisions = self.graph._decisions
+        critical_count = high_count = action_count = 0
 
         for impact in impacts:
+            severity = impact.severity
+            if severity == "critical":
+                critical_count += 1
+            elif severity == "high":
+                high_count += 1
+
             if impact.type == "action_item":
-                action = self.graph._action_items.get(impact.id)
+                action_count += 1
+                action = action_items.get(impact.id)
                 if action and action.assigned_to:
-                    people.add(action.assigned_to)
+                    add_person(action.assigned_to)
             elif impact.type == "decision":
-                decision = self.graph._decisions.get(impact.id)
+                decision = decisions.get(impact.id)
                 if decision and decision.made_by:
-                    people.add(decision.made_by)
+                    add_person(decision.made_by)
 
-        return list(people)
-
-    def _generate_suggestions(self, impacts: list[Impact], new_value: str) -> list[str]:
-        """Generate actionable suggestions based on impacts."""
         suggestions = []
 
-        critical_count = sum(1 for i in impacts if i.severity == "critical")
-        high_count = sum(1 for i in impacts if i.severity == "high")
-        action_count = sum(1 for i in impacts if i.type == "action_item")
-
         if critical_count > 0:
             suggestions.append(f"⚠️ {critical_count} critical impact(s) - address before proceeding")
 
@@ -394,7 +952,7 @@ If no conflict, respond with: NO_CONFLICT"""
         if not suggestions:
             suggestions.append("Change appears safe - minimal downstream impact")
 
-        return suggestions
+        return list(people), suggestions
 
     # ==================== Convenience Methods ====================
 
@@ -403,7 +961,35 @@ If no conflict, respond with: NO_CONFLICT"""
         Convenience method for "what if" scenarios.
 
         Example: what_if("payment provider", "switch to PayPal")
+
+        Repeating a scenario against an unchanged graph returns the
+        cached report. Reports with a failed, timed-out or unanalyzed
+        verdict are not cached, so the next call retries them.
         """
+        key = (topic, change)
+        cached = self._what_if_cache.get(key)
+        if cached is not None:
+            return self._copy_report(cached)
+
+        # A concurrent detect() failing too only means one report less cached
+        degraded_before = self._degraded_verdicts
+        report = self._what_if(topic, change)
+        if self._degraded_verdicts == degraded_before:
+            self._what_if_cache.put(key, self._copy_report(report))
+        return report
+
+    @staticmethod
+    def _copy_report(report: RippleReport) -> RippleReport:
+        """Copy of a report with its own lists, so callers can't edit the cached one."""
+        return replace(
+            report,
+            impacts=list(report.impacts),
+            people_to_notify=list(report.people_to_notify),
+            suggestions=list(report.suggestions)
+        )
+
+    def _what_if(self, topic: str, change: str) -> RippleReport:
+        """Uncached what_if()."""
         # Find decisions about this topic
         decisions = self.graph.get_decisions_by_topic(topic)
 
@@ -6,20 +6,64 @@ Load meeting data from various sources into the memory system.
 Supports real-time updates during meetings with auto-persistence.
 """
 
+import os
 import json
-import uuid
+import atexit
+import hashlib
+import secrets
+import fnmatch
+import functools
+import threading
 from pathlib import Path
-from datetime import datetime
+from datetime import date, datetime
 from typing import Optional, Union, Callable
+from concurrent.futures import ThreadPoolExecutor
+
+# Faster JSON (optional)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Incremental JSON parsing for very large files (optional)
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
 
 from ..core.graph import MeetingGraph
 from ..core.embeddings import EmbeddingStore
 from ..agents.meeting_agent import MeetingAgent
+from .wal import WAL
 from ..models import (
     Meeting, Decision, ActionItem, Blocker, Person,
-    DecisionStatus, ActionStatus, MeetingType
+    DecisionStatus, ActionStatus, MeetingType, person_id_for
 )
 
+# Files at least this large are streamed meeting by meeting (needs ijson)
+STREAM_THRESHOLD_BYTES = 32 * 1024 * 1024
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_day(day: date) -> str:
+    """Format a date as YYYY-MM-DD (memoized: many items share a day)."""
+    return day.strftime('%Y-%m-%d')
+
+
+def _synchronized(method):
+    """
+    Run a realtime update under the save lock, so a background save never sees it half-applied.
+
+    The flip side: an update made while flush() is saving blocks until the save is done.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._save_lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
 
 class MeetingLoader:
     """
@@ -33,7 +77,8 @@ class MeetingLoader:
 
     def __init__(self, graph: Optional[MeetingGraph] = None,
                  embeddings: Optional[EmbeddingStore] = None,
-                 fast_load: bool = False):
+                 fast_load: bool = False,
+                 cache_dir: str = ".ampm_cache"):
         """
         Initialize the meeting loader.
 
@@ -41,6 +86,7 @@ class MeetingLoader:
             graph: Optional existing graph (creates new if None)
             embeddings: Optional embedding store for indexing
             fast_load: Skip LLM-based entity extraction (faster but less data)
+            cache_dir: Where realtime updates are saved and logged
         """
         self.graph = graph or MeetingGraph()
         self.embeddings = embeddings or EmbeddingStore(use_backboard=True)
@@ -50,12 +96,53 @@ class MeetingLoader:
         if fast_load:
             self.agent.skip_extraction = True
 
-    def load_file(self, path: Union[str, Path]) -> list[Meeting]:
+        # Debounced auto-save: realtime updates mark the state dirty, and
+        # it is written after save_delay_s of quiet or every save_every
+        # updates, whichever comes first (see flush()). Both run off the
+        # caller's thread, so an update never starts a save itself. The
+        # save does hold _save_lock while it indexes queued documents and
+        # writes both files, so an update arriving mid-save waits for it.
+        self.save_delay_s = 2.0
+        self.save_every = 20
+        self._dirty = False
+        self._unsaved = 0
+        self._save_timer: Optional[threading.Timer] = None
+        self._save_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ampm-save")
+        self._save_queued = False
+        self._save_lock = threading.RLock()
+        self._cache_dir = cache_dir
+        self._flush_at_exit = False
+
+        # Realtime updates are appended to a write-ahead log as they happen;
+        # each snapshot save truncates it, and recover() replays it
+        self._wal = WAL(Path(self._cache_dir) / "wal.jsonl")
+        self._replaying = False
+
+        # Content hash of each ingested file -> the meeting IDs it produced,
+        # so re-loading an unchanged file into this graph is skipped
+        self._manifest_path = Path(self._cache_dir) / "ingest_manifest.json"
+        self._manifest: Optional[dict[str, dict]] = None
+
+        # get_context_for_query() output, rebuilt after the graph changes.
+        # Some updates edit nodes in place (e.g. completing an action), so
+        # loads and realtime updates also invalidate it when they finish.
+        self._context: Optional[str] = None
+        self._context_version = 0
+        self.graph.on_change(self._invalidate_context)
+
+    def load_file(self, path: Union[str, Path], flush: bool = True) -> list[Meeting]:
         """
         Load meetings from a JSON file.
 
+        Search documents are queued while the file is processed and
+        indexed together at the end. Very large files are streamed one
+        meeting at a time when ijson is installed. A file whose content
+        was already ingested into this graph is not processed again.
+
         Args:
             path: Path to JSON file
+            flush: Index the queued documents before returning (pass False
+                   to keep queuing, then call embeddings.flush())
 
         Returns:
             List of loaded Meeting objects
@@ -65,16 +152,31 @@ class MeetingLoader:
         if not path.exists():
             raise FileNotFoundError(f"File not found: {path}")
 
-        with open(path, 'r') as f:
-            data = json.load(f)
+        digest = self._file_digest(path)
+        meetings = self._ingested(digest)
+        if meetings is None:
+            if self._should_stream(path):
+                meetings = self._process_stream(path)
+            else:
+                meetings = self._process_data(self._read_file(path), prepared=True)
+            self._record_ingest(digest, meetings)
+            self._save_manifest()
 
-        return self._process_data(data)
+        if flush:
+            self.embeddings.flush()
+        self._invalidate_context()
+        return meetings
 
     def load_directory(self, path: Union[str, Path],
                        pattern: str = "*.json") -> list[Meeting]:
         """
         Load all meeting files from a directory.
 
+        Files are read, parsed and (if needed) run through transcript
+        extraction in parallel; they are then added to the graph in name
+        order on the calling thread, and indexed in one batch. Files
+        already ingested into this graph are skipped (see load_file()).
+
         Args:
             path: Directory path
             pattern: Glob pattern for files (default: *.json)
@@ -87,18 +189,219 @@ class MeetingLoader:
         if not path.is_dir():
             raise NotADirectoryError(f"Not a directory: {path}")
 
+        file_paths = self._list_files(path, pattern)
+        if not file_paths:
+            return []
+
         meetings = []
-        for file_path in sorted(path.glob(pattern)):
-            try:
-                file_meetings = self.load_file(file_path)
-                meetings.extend(file_meetings)
-                print(f"Loaded {len(file_meetings)} meeting(s) from {file_path.name}")
-            except Exception as e:
-                print(f"Error loading {file_path.name}: {e}")
+        workers = min(8, os.cpu_count() or 1, len(file_paths))
+        self._load_manifest()  # Before the workers consult it
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                # map() yields in file order, so the graph is built deterministically
+                results = pool.map(self._try_read_file, file_paths)
+                for file_path, (digest, data, error) in zip(file_paths, results):
+                    if error is None:
+                        try:
+                            file_meetings = self._ingested(digest)
+                            if file_meetings is not None:
+                                print(f"Unchanged since last load: {file_path.name}")
+                            else:
+                                if data is None:
+                                    file_meetings = self._process_stream(file_path)
+                                else:
+                                    file_meetings = self._process_data(data, prepared=True)
+                                self._record_ingest(digest, file_meetings)
+                                print(f"Loaded {len(file_meetings)} meeting(s) from {file_path.name}")
+                            meetings.extend(file_meetings)
+                            continue
+                        except Exception as e:
+                            error = e
+                    print(f"Error loading {file_path.name}: {error}")
+        finally:
+            # Index every file's documents in one batch
+            self.embeddings.flush()
+            self._invalidate_context()
+            self._save_manifest()
 
         return meetings
 
-    def _process_data(self, data: Union[dict, list]) -> list[Meeting]:
+    @staticmethod
+    def _list_files(path: Path, pattern: str) -> list[Path]:
+        """
+        Files in a directory matching a glob pattern, sorted by name.
+
+        Single-level patterns are matched against one os.scandir() pass
+        (no per-entry Path objects or extra stat calls); recursive or
+        multi-part patterns fall back to Path.glob().
+        """
+        if "/" in pattern or "**" in pattern:
+            return sorted(p for p in path.glob(pattern) if p.is_file())
+
+        with os.scandir(path) as entries:
+            names = [e.name for e in entries if e.is_file()]
+
+        if pattern in ("*.json", "*"):
+            suffix = pattern[1:]
+            names = [name for name in names if name.endswith(suffix)]
+        else:
+            names = fnmatch.filter(names, pattern)
+        names.sort()
+        return [path / name for name in names]
+
+    def _read_file(self, path: Path) -> Union[dict, list]:
+        """
+        Read a meeting file and run any transcript extraction.
+
+        Makes no graph changes, so files can be read in parallel.
+        """
+        if ORJSON_AVAILABLE:
+            with open(path, 'rb') as f:
+                data = orjson.loads(f.read())
+        else:
+            with open(path, 'r') as f:
+                data = json.load(f)
+
+        for item in self._meeting_items(data):
+            item.update(self.agent.prepare_meeting_data(item))
+        return data
+
+    def _try_read_file(self, path: Path) -> tuple[Optional[str], Optional[Union[dict, list]], Optional[Exception]]:
+        """
+        _read_file() for the worker pool: (content hash, data, error).
+
+        Data is None for files already ingested and for files to stream,
+        which are left to the caller.
+        """
+        try:
+            digest = self._file_digest(path)
+            if self._ingested(digest) is not None or self._should_stream(path):
+                return digest, None, None
+            return digest, self._read_file(path), None
+        except Exception as e:
+            return None, None, e
+
+    # ==================== Ingest Manifest ====================
+
+    @staticmethod
+    def _file_digest(path: Path) -> str:
+        """SHA-256 of a file's bytes, read in chunks."""
+        hasher = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                hasher.update(chunk)
+        return hasher.hexdigest()
+
+    def _load_manifest(self) -> dict[str, dict]:
+        """The ingest manifest, read from the cache directory on first use."""
+        if self._manifest is None:
+            try:
+                with open(self._manifest_path, 'r') as f:
+                    self._manifest = json.load(f)
+            except (OSError, ValueError):
+                self._manifest = {}
+        return self._manifest
+
+    def _ingested(self, digest: str) -> Optional[list[Meeting]]:
+        """
+        The meetings an identical file produced before, or None.
+
+        Only counts if every one of those meetings is still in the graph
+        (e.g. a fresh graph has to ingest the file again).
+        """
+        entry = self._load_manifest().get(digest)
+        if entry is None:
+            return None
+
+        meeting_ids = entry["meetings"]
+        found = self.graph.get_meetings_batch(meeting_ids)
+        if len(found) != len(meeting_ids):
+            return None
+        return [found[mid] for mid in meeting_ids]
+
+    def _record_ingest(self, digest: str, meetings: list[Meeting]) -> None:
+        """Remember which meetings a file's content produced."""
+        self._load_manifest()[digest] = {
+            "meetings": [meeting.id for meeting in meetings],
+            "at": datetime.now().isoformat()
+        }
+
+    def _save_manifest(self) -> None:
+        """Write the ingest manifest to the cache directory."""
+        if not self._manifest:
+            return
+        try:
+            self._manifest_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self._manifest_path, 'w') as f:
+                json.dump(self._manifest, f, indent=2)
+        except OSError as e:
+            print(f"Warning: Could not save ingest manifest: {e}")
+
+    @staticmethod
+    def _meeting_items(data: Union[dict, list]) -> list[dict]:
+        """The meeting dicts in any supported file format."""
+        if isinstance(data, list):
+            return data
+        if isinstance(data, dict):
+            return data["meetings"] if "meetings" in data else [data]
+        return []
+
+    @staticmethod
+    def _should_stream(path: Path) -> bool:
+        """Whether a file is large enough to stream rather than parse whole."""
+        return IJSON_AVAILABLE and path.stat().st_size >= STREAM_THRESHOLD_BYTES
+
+    def _process_stream(self, path: Path) -> list[Meeting]:
+        """
+        Process a meeting file incrementally with ijson.
+
+        Each meeting is parsed and handed to the agent before the next one
+        is read, so peak memory is one meeting rather than the whole file.
+        Accepts the same formats as _process_data().
+        """
+        with open(path, 'rb') as f:
+            first = f.read(64).lstrip()[:1]
+            f.seek(0)
+
+            if first == b"[":
+                # Array of meetings
+                return [
+                    self.agent.process_meeting_data(item, defer_indexing=True)
+                    for item in ijson.items(f, "item", use_float=True)
+                ]
+
+            has_meetings = any(
+                prefix == "" and event == "map_key" and value == "meetings"
+                for prefix, event, value in ijson.parse(f)
+            )
+            f.seek(0)
+            if not has_meetings:
+                # Single meeting: nothing to stream
+                return self._process_data(next(ijson.items(f, "", use_float=True)))
+
+            # Format: {"project": "...", "team": {...}, "meetings": [...]}
+            # The header is read in its own passes so the team exists first
+            project_name = next(ijson.items(f, "project"), None)
+            f.seek(0)
+            self._add_team(dict(ijson.kvitems(f, "team")))
+            f.seek(0)
+
+            meetings = []
+            for item in ijson.items(f, "meetings.item", use_float=True):
+                item["project"] = project_name
+                meetings.append(self.agent.process_meeting_data(item, defer_indexing=True))
+            return meetings
+
+    def _add_team(self, team: dict) -> None:
+        """Add team members ({name: role}) that are not in the graph yet."""
+        new_people: dict[str, Person] = {}
+        for name, role in team.items():
+            person_id = person_id_for(name)
+            if person_id not in new_people and not self.graph.get_person(person_id):
+                new_people[person_id] = Person(id=person_id, name=name, role=role)
+        self.graph.add_people(list(new_people.values()))
+
+    def _process_data(self, data: Union[dict, list], prepared: bool = False) -> list[Meeting]:
         """Process JSON data and return meetings."""
         meetings = []
 
@@ -106,7 +409,7 @@ class MeetingLoader:
         if isinstance(data, list):
             # Array of meetings
             for item in data:
-                meeting = self.agent.process_meeting_data(item)
+                meeting = self.agent.process_meeting_data(item, defer_indexing=True, prepared=prepared)
                 meetings.append(meeting)
 
         elif isinstance(data, dict):
@@ -117,22 +420,17 @@ class MeetingLoader:
                 team = data.get("team", {})
 
                 # Add team members
-                for name, role in team.items():
-                    from ..models import Person
-                    person_id = name.lower().replace(" ", "_")
-                    if not self.graph.get_person(person_id):
-                        person = Person(id=person_id, name=name, role=role)
-                        self.graph.add_person(person)
+                self._add_team(team)
 
                 # Process meetings
                 for item in data["meetings"]:
                     item["project"] = project_name
-                    meeting = self.agent.process_meeting_data(item)
+                    meeting = self.agent.process_meeting_data(item, defer_indexing=True, prepared=prepared)
                     meetings.append(meeting)
 
             else:
                 # Single meeting
-                meeting = self.agent.process_meeting_data(data)
+                meeting = self.agent.process_meeting_data(data, defer_indexing=True, prepared=prepared)
                 meetings.append(meeting)
 
         return meetings
@@ -163,71 +461,83 @@ class MeetingLoader:
         Get formatted context for LLM queries.
 
         This provides backward compatibility with the old MeetingKnowledge class.
+        The result is cached until the graph changes.
         """
-        parts = []
+        context = self._context
+        if context is not None:
+            return context
+
+        version = self._context_version
+        context = self._build_context()
+        # Don't cache a string that an update raced with
+        if version == self._context_version:
+            self._context = context
+        return context
+
+    def _invalidate_context(self) -> None:
+        """Drop the cached get_context_for_query() output."""
+        self._context_version += 1
+        self._context = None
 
+    def _build_context(self) -> str:
+        """Format every meeting for get_context_for_query()."""
         # Get all meetings sorted by date
-        meetings = sorted(
-            self.graph._meetings.values(),
-            key=lambda m: m.date
-        )
+        meetings = self.graph.get_meetings_by_date()
 
         if not meetings:
             return "No meeting data loaded."
 
-        parts.append("=== MEETING HISTORY ===")
+        # Resolve lookups once, not per line
+        names = {pid: person.name for pid, person in self.graph._people.items()}
+        get_decision = self.graph._decisions.get
+        get_action = self.graph._action_items.get
+        get_blocker = self.graph._blockers.get
+
+        parts = ["=== MEETING HISTORY ==="]
+        add = parts.append
 
         for meeting in meetings:
-            parts.append(f"\n--- {meeting.title} ({meeting.date.strftime('%Y-%m-%d')}) ---")
+            add(f"\n--- {meeting.title} ({_format_day(meeting.date.date())}) ---")
 
             if meeting.attendees:
-                attendee_names = []
-                for pid in meeting.attendees:
-                    person = self.graph.get_person(pid)
-                    if person:
-                        attendee_names.append(person.name)
-                parts.append(f"Attendees: {', '.join(attendee_names)}")
+                add("Attendees: " + ", ".join(
+                    [names[pid] for pid in meeting.attendees if pid in names]
+                ))
 
             # Decisions
             for dec_id in meeting.decisions:
-                dec = self.graph.get_decision(dec_id)
+                dec = get_decision(dec_id)
                 if dec:
-                    parts.append(f"\nDECISION: {dec.content}")
+                    add(f"\nDECISION: {dec.content}")
                     if dec.topic:
-                        parts.append(f"  Topic: {dec.topic}")
+                        add(f"  Topic: {dec.topic}")
                     if dec.rationale:
-                        parts.append(f"  Reasoning: {dec.rationale}")
-                    if dec.made_by:
-                        person = self.graph.get_person(dec.made_by)
-                        if person:
-                            parts.append(f"  Made by: {person.name}")
+                        add(f"  Reasoning: {dec.rationale}")
+                    if dec.made_by in names:
+                        add(f"  Made by: {names[dec.made_by]}")
                     if dec.quote:
-                        parts.append(f"  Quote: \"{dec.quote}\"")
+                        add(f"  Quote: \"{dec.quote}\"")
 
             # Action items
             for action_id in meeting.action_items:
-                action = self.graph._action_items.get(action_id)
+                action = get_action(action_id)
                 if action:
-                    parts.append(f"\nACTION ITEM: {action.task}")
-                    if action.assigned_to:
-                        person = self.graph.get_person(action.assigned_to)
-                        if person:
-                            parts.append(f"  Assigned to: {person.name}")
+                    add(f"\nACTION ITEM: {action.task}")
+                    if action.assigned_to in names:
+                        add(f"  Assigned to: {names[action.assigned_to]}")
                     if action.due_date:
-                        parts.append(f"  Due: {action.due_date.strftime('%Y-%m-%d')}")
-                    parts.append(f"  Status: {action.status.value}")
+                        add(f"  Due: {_format_day(action.due_date.date())}")
+                    add(f"  Status: {action.status.value}")
 
             # Blockers
             for blocker_id in meeting.blockers:
-                blocker = self.graph._blockers.get(blocker_id)
+                blocker = get_blocker(blocker_id)
                 if blocker:
-                    parts.append(f"\nBLOCKER: {blocker.description}")
-                    if blocker.reported_by:
-                        person = self.graph.get_person(blocker.reported_by)
-                        if person:
-                            parts.append(f"  Reported by: {person.name}")
+                    add(f"\nBLOCKER: {blocker.description}")
+                    if blocker.reported_by in names:
+                        add(f"  Reported by: {names[blocker.reported_by]}")
                     if blocker.impact:
-                        parts.append(f"  Impact: {blocker.impact}")
+                        add(f"  Impact: {blocker.impact}")
 
         return "\n".join(parts)
 
@@ -243,18 +553,70 @@ class MeetingLoader:
 
     def _generate_id(self, prefix: str) -> str:
         """Generate a unique ID with prefix."""
-        return f"{prefix}_{uuid.uuid4().hex[:8]}"
+        return f"{prefix}_{secrets.token_hex(4)}"
 
-    def _auto_save(self, cache_dir: str = ".ampm_cache") -> None:
-        """Auto-save graph and embeddings after updates."""
-        cache_path = Path(cache_dir)
-        cache_path.mkdir(exist_ok=True)
-        
-        try:
-            self.graph.save(str(cache_path / "graph.json"))
-            self.embeddings.save(str(cache_path / "embeddings.json"))
-        except Exception as e:
-            print(f"Auto-save warning: {e}")
+    def _auto_save(self, cache_dir: Optional[str] = None) -> None:
+        """
+        Schedule a save of graph and embeddings after an update.
+
+        Writes are coalesced: the save runs once updates pause for
+        save_delay_s, or immediately every save_every updates.
+        """
+        with self._save_lock:
+            self._dirty = True
+            self._unsaved += 1
+            if cache_dir and cache_dir != self._cache_dir:
+                self._cache_dir = cache_dir
+                self._wal = WAL(Path(cache_dir) / "wal.jsonl")
+
+            if not self._flush_at_exit:
+                atexit.register(self.flush)
+                self._flush_at_exit = True
+
+            if self._unsaved >= self.save_every and not self._save_queued:
+                # Save in the background; the WAL already holds the update
+                self._save_queued = True
+                self._save_executor.submit(self.flush)
+                return
+
+            # Restart the quiet-period timer
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+            self._save_timer = threading.Timer(self.save_delay_s, self.flush)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+
+    def flush(self) -> None:
+        """
+        Persist pending updates now (index queued documents, save to disk).
+
+        Call before shutdown or whenever the on-disk state must be current;
+        it also runs automatically at interpreter exit.
+        """
+        with self._save_lock:
+            self._save_queued = False
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+
+            self.embeddings.flush()
+            if not self._dirty:
+                return
+            self._dirty = False
+            self._unsaved = 0
+
+            cache_path = Path(self._cache_dir)
+            cache_path.mkdir(exist_ok=True)
+
+            try:
+                self.graph.save(str(cache_path / "graph.json"))
+                self.embeddings.save(str(cache_path / "embeddings.json"))
+            except Exception as e:
+                print(f"Auto-save warning: {e}")
+                return
+
+            # The snapshot now covers everything logged
+            self._wal.truncate()
 
     def get_or_create_live_meeting(self, title: str = None) -> Meeting:
         """
@@ -274,26 +636,15 @@ class MeetingLoader:
             return existing
         
         # Create new live meeting
+        now = datetime.now()
         if not title:
-            title = f"Live Meeting - {datetime.now().strftime('%Y-%m-%d %H:%M')}"
-        
-        meeting = Meeting(
-            id=live_meeting_id,
-            title=title,
-            date=datetime.now(),
-            meeting_type=MeetingType.AD_HOC,
-            attendees=[],
-            decisions=[],
-            action_items=[],
-            blockers=[],
-            updates=[],
-            learnings=[],
-            topics=[]
-        )
-        
-        self.graph.add_meeting(meeting)
+            title = f"Live Meeting - {now.strftime('%Y-%m-%d %H:%M')}"
+
+        meeting = self._apply_live_meeting(id=live_meeting_id, title=title, at=now.isoformat())
+        self._log("live_meeting", id=live_meeting_id, title=title, at=now.isoformat())
         return meeting
 
+    @_synchronized
     def add_decision_realtime(
         self,
         content: str,
@@ -301,7 +652,8 @@ class MeetingLoader:
         topic: str = None,
         made_by: str = None,
         meeting_id: str = "live_meeting",
-        auto_save: bool = True
+        auto_save: bool = True,
+        flush: bool = True
     ) -> Decision:
         """
         Add a decision in real-time during a meeting.
@@ -313,6 +665,8 @@ class MeetingLoader:
             made_by: Person ID who made the decision
             meeting_id: Meeting to attach to (defaults to live meeting)
             auto_save: Whether to persist immediately
+            flush: Index now; pass False to queue the search document and
+                   index a whole batch later with embeddings.flush()
             
         Returns:
             The created Decision object
@@ -321,49 +675,18 @@ class MeetingLoader:
         if meeting_id == "live_meeting":
             self.get_or_create_live_meeting()
         
-        # Create decision
-        decision_id = self._generate_id("dec")
-        decision = Decision(
-            id=decision_id,
-            content=content,
-            rationale=rationale,
-            topic=topic,
-            made_by=made_by,
-            meeting_id=meeting_id,
-            status=DecisionStatus.CONFIRMED,
-            confidence=1.0,
-            timestamp=datetime.now()
+        record = dict(
+            id=self._generate_id("dec"), content=content, rationale=rationale,
+            topic=topic, made_by=made_by, meeting_id=meeting_id,
+            at=datetime.now().isoformat()
         )
-        
-        # Add to graph
-        self.graph.add_decision(decision)
-        
-        # Update meeting's decision list
-        meeting = self.graph.get_meeting(meeting_id)
-        if meeting and decision_id not in meeting.decisions:
-            meeting.decisions.append(decision_id)
-        
-        # Index in embeddings
-        embed_text = f"Decision: {content}"
-        if rationale:
-            embed_text += f"\nRationale: {rationale}"
-        self.embeddings.add_document(
-            doc_id=decision_id,
-            content=embed_text,
-            metadata={
-                "type": "decision",
-                "topic": topic or "",
-                "meeting_id": meeting_id,
-                "source": "realtime"
-            }
-        )
-        
-        if auto_save:
-            self._auto_save()
+        decision = self._apply_decision(**record)
+        self._commit("decision", record, auto_save, flush)
         
         print(f"✓ Added decision: {content[:50]}...")
         return decision
 
+    @_synchronized
     def add_action_realtime(
         self,
         task: str,
@@ -371,7 +694,8 @@ class MeetingLoader:
         due_date: datetime = None,
         decision_id: str = None,
         meeting_id: str = "live_meeting",
-        auto_save: bool = True
+        auto_save: bool = True,
+        flush: bool = True
     ) -> ActionItem:
         """
         Add an action item in real-time during a meeting.
@@ -383,6 +707,8 @@ class MeetingLoader:
             decision_id: Optional decision this follows from
             meeting_id: Meeting to attach to
             auto_save: Whether to persist immediately
+            flush: Index now; pass False to queue the search document and
+                   index a whole batch later with embeddings.flush()
             
         Returns:
             The created ActionItem object
@@ -391,57 +717,27 @@ class MeetingLoader:
         if meeting_id == "live_meeting":
             self.get_or_create_live_meeting()
         
-        # Create action item
-        action_id = self._generate_id("action")
-        action = ActionItem(
-            id=action_id,
-            task=task,
-            assigned_to=assigned_to,
-            meeting_id=meeting_id,
-            decision_id=decision_id,
-            due_date=due_date,
-            status=ActionStatus.PENDING,
-            created_at=datetime.now()
-        )
-        
-        # Add to graph
-        self.graph.add_action_item(action)
-        
-        # Update meeting's action list
-        meeting = self.graph.get_meeting(meeting_id)
-        if meeting and action_id not in meeting.action_items:
-            meeting.action_items.append(action_id)
-        
-        # Index in embeddings
-        embed_text = f"Action Item: {task}"
-        if assigned_to:
-            person = self.graph.get_person(assigned_to)
-            if person:
-                embed_text += f"\nAssigned to: {person.name}"
-        self.embeddings.add_document(
-            doc_id=action_id,
-            content=embed_text,
-            metadata={
-                "type": "action_item",
-                "assigned_to": assigned_to or "",
-                "meeting_id": meeting_id,
-                "source": "realtime"
-            }
+        record = dict(
+            id=self._generate_id("action"), task=task, assigned_to=assigned_to,
+            due_date=due_date.isoformat() if due_date else None,
+            decision_id=decision_id, meeting_id=meeting_id,
+            at=datetime.now().isoformat()
         )
-        
-        if auto_save:
-            self._auto_save()
+        action = self._apply_action(**record)
+        self._commit("action", record, auto_save, flush)
         
         print(f"✓ Added action: {task[:50]}...")
         return action
 
+    @_synchronized
     def add_blocker_realtime(
         self,
         description: str,
         reported_by: str = None,
         impact: str = None,
         meeting_id: str = "live_meeting",
-        auto_save: bool = True
+        auto_save: bool = True,
+        flush: bool = True
     ) -> Blocker:
         """
         Add a blocker in real-time during a meeting.
@@ -452,6 +748,8 @@ class MeetingLoader:
             impact: Impact description
             meeting_id: Meeting to attach to
             auto_save: Whether to persist immediately
+            flush: Index now; pass False to queue the search document and
+                   index a whole batch later with embeddings.flush()
             
         Returns:
             The created Blocker object
@@ -460,46 +758,18 @@ class MeetingLoader:
         if meeting_id == "live_meeting":
             self.get_or_create_live_meeting()
         
-        # Create blocker
-        blocker_id = self._generate_id("blocker")
-        blocker = Blocker(
-            id=blocker_id,
-            description=description,
-            reported_by=reported_by,
-            meeting_id=meeting_id,
-            impact=impact,
-            resolved=False,
-            created_at=datetime.now()
-        )
-        
-        # Add to graph
-        self.graph.add_blocker(blocker)
-        
-        # Update meeting's blocker list
-        meeting = self.graph.get_meeting(meeting_id)
-        if meeting and blocker_id not in meeting.blockers:
-            meeting.blockers.append(blocker_id)
-        
-        # Index in embeddings
-        embed_text = f"Blocker: {description}"
-        if impact:
-            embed_text += f"\nImpact: {impact}"
-        self.embeddings.add_document(
-            doc_id=blocker_id,
-            content=embed_text,
-            metadata={
-                "type": "blocker",
-                "meeting_id": meeting_id,
-                "source": "realtime"
-            }
+        record = dict(
+            id=self._generate_id("blocker"), description=description,
+            reported_by=reported_by, impact=impact, meeting_id=meeting_id,
+            at=datetime.now().isoformat()
         )
-        
-        if auto_save:
-            self._auto_save()
+        blocker = self._apply_blocker(**record)
+        self._commit("blocker", record, auto_save, flush)
         
         print(f"✓ Added blocker: {description[:50]}...")
         return blocker
 
+    @_synchronized
     def add_person_realtime(
         self,
         name: str,
@@ -519,29 +789,21 @@ class MeetingLoader:
         Returns:
             The created Person object
         """
-        person_id = name.lower().replace(" ", "_")
+        person_id = person_id_for(name)
         
         # Check if already exists
         existing = self.graph.get_person(person_id)
         if existing:
             return existing
         
-        person = Person(
-            id=person_id,
-            name=name,
-            role=role,
-            email=email,
-            expertise=[]
-        )
-        
-        self.graph.add_person(person)
-        
-        if auto_save:
-            self._auto_save()
+        record = dict(name=name, role=role, email=email)
+        person = self._apply_person(**record)
+        self._commit("person", record, auto_save)
         
         print(f"✓ Added person: {name}")
         return person
 
+    @_synchronized
     def resolve_blocker_realtime(
         self,
         blocker_id: str,
@@ -559,20 +821,16 @@ class MeetingLoader:
         Returns:
             The updated Blocker object or None if not found
         """
-        blocker = self.graph._blockers.get(blocker_id)
+        record = dict(id=blocker_id, resolution=resolution, at=datetime.now().isoformat())
+        blocker = self._apply_resolve_blocker(**record)
         if not blocker:
             return None
-        
-        blocker.resolved = True
-        blocker.resolution = resolution
-        blocker.resolved_at = datetime.now()
-        
-        if auto_save:
-            self._auto_save()
+        self._commit("resolve_blocker", record, auto_save)
         
         print(f"✓ Resolved blocker: {blocker.description[:50]}...")
         return blocker
 
+    @_synchronized
     def complete_action_realtime(
         self,
         action_id: str,
@@ -588,25 +846,23 @@ class MeetingLoader:
         Returns:
             The updated ActionItem object or None if not found
         """
-        action = self.graph._action_items.get(action_id)
+        record = dict(id=action_id, at=datetime.now().isoformat())
+        action = self._apply_complete_action(**record)
         if not action:
             return None
-        
-        action.status = ActionStatus.COMPLETED
-        action.completed_at = datetime.now()
-        
-        if auto_save:
-            self._auto_save()
+        self._commit("complete_action", record, auto_save)
         
         print(f"✓ Completed action: {action.task[:50]}...")
         return action
 
+    @_synchronized
     def add_note_realtime(
         self,
         content: str,
         category: str = "note",
         meeting_id: str = "live_meeting",
-        auto_save: bool = True
+        auto_save: bool = True,
+        flush: bool = True
     ) -> str:
         """
         Add a free-form note to the knowledge graph.
@@ -616,6 +872,8 @@ class MeetingLoader:
             category: Category tag (e.g., "note", "insight", "question")
             meeting_id: Meeting to attach to
             auto_save: Whether to persist immediately
+            flush: Index now; pass False to queue the search document and
+                   index a whole batch later with embeddings.flush()
             
         Returns:
             The note ID
@@ -624,23 +882,279 @@ class MeetingLoader:
         if meeting_id == "live_meeting":
             self.get_or_create_live_meeting()
         
-        note_id = self._generate_id("note")
+        record = dict(
+            id=self._generate_id("note"), content=content, category=category,
+            meeting_id=meeting_id, at=datetime.now().isoformat()
+        )
+        note_id = self._apply_note(**record)
+        self._commit("note", record, auto_save, flush)
+        
+        print(f"✓ Added {category}: {content[:50]}...")
+        return note_id
+
+    # ==================== Write-Ahead Log ====================
+
+    def _log(self, op: str, **record) -> None:
+        """Append an update to the write-ahead log (unless replaying it)."""
+        if not self._replaying:
+            self._wal.append(op, record)
+
+    def _commit(self, op: str, record: dict, auto_save: bool, flush: bool = False) -> None:
+        """Finish a realtime update: index if asked, then log it and schedule a save."""
+        self._invalidate_context()
+        if flush:
+            self.embeddings.flush()
+        # Completions, resolutions and notes edit items in place (or only
+        # the search index), so graph listeners (query caches) aren't told
+        self.graph._notify_change()
+        if auto_save:
+            self._log(op, **record)
+            self._auto_save()
+
+    def recover(self) -> int:
+        """
+        Replay realtime updates logged since the last snapshot.
+
+        Call after loading graph.json and embeddings.json from the cache
+        directory. The replayed state is written as a new snapshot.
+
+        Returns:
+            Number of updates replayed
+        """
+        appliers = {
+            "live_meeting": self._apply_live_meeting,
+            "decision": self._apply_decision,
+            "action": self._apply_action,
+            "blocker": self._apply_blocker,
+            "person": self._apply_person,
+            "resolve_blocker": self._apply_resolve_blocker,
+            "complete_action": self._apply_complete_action,
+            "note": self._apply_note,
+        }
+
+        replayed = 0
+        with self._save_lock:
+            self._replaying = True
+            try:
+                for op, record in self._wal.replay():
+                    apply = appliers.get(op)
+                    if apply is None:
+                        print(f"WAL: skipping unknown op '{op}'")
+                        continue
+                    apply(**record)
+                    replayed += 1
+            finally:
+                self._replaying = False
+                self._invalidate_context()
+                self.graph._notify_change()
+
+            if replayed:
+                print(f"✓ Replayed {replayed} update(s) from {self._wal.path}")
+                self._dirty = True
+            self.flush()
+        return replayed
+
+    def _link(self, ids: list[str], item_id: str) -> None:
+        """
+        Append an item ID to one of a meeting's ID lists.
+
+        Fresh realtime IDs are random, so the O(n) duplicate check is only
+        needed when replaying the WAL over a snapshot that may already
+        include the update.
+        """
+        if not self._replaying or item_id not in ids:
+            ids.append(item_id)
+
+    def _apply_live_meeting(self, id: str, title: str, at: str) -> Meeting:
+        """Create the live meeting."""
+        meeting = self.graph.get_meeting(id)
+        if meeting:
+            return meeting
+
+        meeting = Meeting(
+            id=id,
+            title=title,
+            date=datetime.fromisoformat(at),
+            meeting_type=MeetingType.AD_HOC,
+            attendees=[],
+            decisions=[],
+            action_items=[],
+            blockers=[],
+            updates=[],
+            learnings=[],
+            topics=[]
+        )
+        
+        self.graph.add_meeting(meeting)
+        return meeting
+
+    def _apply_decision(self, id: str, content: str, rationale: Optional[str],
+                        topic: Optional[str], made_by: Optional[str],
+                        meeting_id: str, at: str) -> Decision:
+        """Add a realtime decision to the graph and queue it for search."""
+        decision = Decision(
+            id=id,
+            content=content,
+            rationale=rationale,
+            topic=topic,
+            made_by=made_by,
+            meeting_id=meeting_id,
+            status=DecisionStatus.CONFIRMED,
+            confidence=1.0,
+            timestamp=datetime.fromisoformat(at)
+        )
+        
+        # Add to graph
+        self.graph.add_decision(decision)
+        
+        # Update meeting's decision list
+        meeting = self.graph.get_meeting(meeting_id)
+        if meeting:
+            self._link(meeting.decisions, id)
+        
+        # Index in embeddings
+        embed_text = f"Decision: {content}"
+        if rationale:
+            embed_text += f"\nRationale: {rationale}"
+        self.embeddings.add_document(
+            doc_id=id,
+            content=embed_text,
+            metadata={
+                "type": "decision",
+                "topic": topic or "",
+                "meeting_id": meeting_id,
+                "source": "realtime"
+            },
+            defer=True
+        )
+        return decision
+
+    def _apply_action(self, id: str, task: str, assigned_to: Optional[str],
+                      due_date: Optional[str], decision_id: Optional[str],
+                      meeting_id: str, at: str) -> ActionItem:
+        """Add a realtime action item to the graph and queue it for search."""
+        action = ActionItem(
+            id=id,
+            task=task,
+            assigned_to=assigned_to,
+            meeting_id=meeting_id,
+            decision_id=decision_id,
+            due_date=datetime.fromisoformat(due_date) if due_date else None,
+            status=ActionStatus.PENDING,
+            created_at=datetime.fromisoformat(at)
+        )
+        
+        # Add to graph
+        self.graph.add_action_item(action)
+        
+        # Update meeting's action list
+        meeting = self.graph.get_meeting(meeting_id)
+        if meeting:
+            self._link(meeting.action_items, id)
         
-        # Index in embeddings (notes don't go in the graph structure)
+        # Index in embeddings
+        embed_text = f"Action Item: {task}"
+        if assigned_to:
+            person = self.graph.get_person(assigned_to)
+            if person:
+                embed_text += f"\nAssigned to: {person.name}"
         self.embeddings.add_document(
-            doc_id=note_id,
+            doc_id=id,
+            content=embed_text,
+            metadata={
+                "type": "action_item",
+                "assigned_to": assigned_to or "",
+                "meeting_id": meeting_id,
+                "source": "realtime"
+            },
+            defer=True
+        )
+        return action
+
+    def _apply_blocker(self, id: str, description: str, reported_by: Optional[str],
+                       impact: Optional[str], meeting_id: str, at: str) -> Blocker:
+        """Add a realtime blocker to the graph and queue it for search."""
+        blocker = Blocker(
+            id=id,
+            description=description,
+            reported_by=reported_by,
+            meeting_id=meeting_id,
+            impact=impact,
+            resolved=False,
+            created_at=datetime.fromisoformat(at)
+        )
+        
+        # Add to graph
+        self.graph.add_blocker(blocker)
+        
+        # Update meeting's blocker list
+        meeting = self.graph.get_meeting(meeting_id)
+        if meeting:
+            self._link(meeting.blockers, id)
+        
+        # Index in embeddings
+        embed_text = f"Blocker: {description}"
+        if impact:
+            embed_text += f"\nImpact: {impact}"
+        self.embeddings.add_document(
+            doc_id=id,
+            content=embed_text,
+            metadata={
+                "type": "blocker",
+                "meeting_id": meeting_id,
+                "source": "realtime"
+            },
+            defer=True
+        )
+        return blocker
+
+    def _apply_person(self, name: str, role: Optional[str], email: Optional[str]) -> Person:
+        """Add a person to the graph."""
+        person = Person(
+            id=person_id_for(name),
+            name=name,
+            role=role,
+            email=email,
+            expertise=[]
+        )
+        
+        self.graph.add_person(person)
+        return person
+
+    def _apply_resolve_blocker(self, id: str, resolution: str, at: str) -> Optional[Blocker]:
+        """Mark a blocker resolved (None if not found)."""
+        blocker = self.graph._blockers.get(id)
+        if not blocker:
+            return None
+        
+        blocker.resolved = True
+        blocker.resolution = resolution
+        blocker.resolved_at = datetime.fromisoformat(at)
+        return blocker
+
+    def _apply_complete_action(self, id: str, at: str) -> Optional[ActionItem]:
+        """Mark an action item completed (None if not found)."""
+        action = self.graph._action_items.get(id)
+        if not action:
+            return None
+        
+        action.status = ActionStatus.COMPLETED
+        action.completed_at = datetime.fromisoformat(at)
+        return action
+
+    def _apply_note(self, id: str, content: str, category: str,
+                    meeting_id: str, at: str) -> str:
+        """Queue a free-form note for search (notes don't go in the graph structure)."""
+        self.embeddings.add_document(
+            doc_id=id,
             content=content,
             metadata={
                 "type": "note",
                 "category": category,
                 "meeting_id": meeting_id,
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": at,
                 "source": "realtime"
-            }
+            },
+            defer=True
         )
-        
-        if auto_save:
-            self._auto_save()
-        
-        print(f"✓ Added {category}: {content[:50]}...")
-        return note_id
+        return id
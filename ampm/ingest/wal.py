@@ -0,0 +1,71 @@
+"""
+Write-Ahead Log
+===============
+Append-only JSONL log of realtime updates.
+
+Each realtime update appends one small record instead of rewriting the
+whole graph; full snapshots (graph.json + embeddings.json) are written
+only periodically, after which the log is truncated. On startup the log
+is replayed on top of the last snapshot.
+"""
+
+import json
+from pathlib import Path
+from typing import Iterator, Union
+
+# Faster JSON (optional)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+class WAL:
+    """Write-ahead log stored as one JSON record per line."""
+
+    def __init__(self, path: Union[str, Path]):
+        """
+        Initialize the log.
+
+        Args:
+            path: Log file path (created on first append)
+        """
+        self.path = Path(path)
+
+    def append(self, op: str, payload: dict) -> None:
+        """Append one record for an update."""
+        record = {"op": op, "data": payload}
+        if ORJSON_AVAILABLE:
+            line = orjson.dumps(record) + b"\n"
+        else:
+            line = json.dumps(record).encode() + b"\n"
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "ab") as f:
+            f.write(line)
+
+    def replay(self) -> Iterator[tuple[str, dict]]:
+        """
+        Yield (op, payload) for every logged record, oldest first.
+
+        A torn final line (crash mid-write) is skipped.
+        """
+        if not self.path.exists():
+            return
+
+        with open(self.path, "rb") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    record = orjson.loads(line) if ORJSON_AVAILABLE else json.loads(line)
+                except ValueError:
+                    print(f"WAL: skipping unreadable record in {self.path}")
+                    continue
+                yield record["op"], record["data"]
+
+    def truncate(self) -> None:
+        """Drop all records (after a snapshot that covers them)."""
+        if self.path.exists():
+            self.path.unlink()
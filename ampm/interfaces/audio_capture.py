@@ -0,0 +1,236 @@
+"""
+Streaming Audio Capture
+=======================
+Microphone capture that yields whole utterances instead of fixed windows.
+
+A sounddevice InputStream delivers 30 ms frames to a callback. Each frame
+is classified as speech or silence (WebRTC VAD when installed, otherwise an
+energy threshold), and an utterance is emitted as soon as speech is
+followed by a short pause. Transcription then runs only on real speech and
+starts when the speaker stops, not when a recording window closes.
+"""
+
+import queue
+import collections
+from typing import Optional
+
+import numpy as np
+import sounddevice as sd
+
+# Voice activity detection (optional, falls back to an energy threshold)
+try:
+    import webrtcvad
+    WEBRTCVAD_AVAILABLE = True
+except ImportError:
+    WEBRTCVAD_AVAILABLE = False
+
+# Frame size fed to the VAD (WebRTC VAD accepts 10, 20 or 30 ms)
+FRAME_MS = 30
+
+# Trailing silence that ends an utterance
+END_SILENCE_S = 0.4
+
+# Audio kept from just before speech starts, so the first word isn't clipped
+PRE_ROLL_S = 0.2
+
+# Shorter bursts (clicks, coughs) are dropped
+MIN_SPEECH_S = 0.25
+
+# Long monologues are cut so transcription can start
+MAX_UTTERANCE_S = 15.0
+
+
+class UtteranceCapture:
+    """
+    Continuous microphone capture with speech endpointing.
+
+    start() opens the input stream; next_utterance() blocks until a
+    complete utterance (int16 samples) is available. With stream_chunks,
+    speech frames are instead handed out one by one through next_chunk()
+    while the utterance is still in progress (for streaming STT).
+    """
+
+    def __init__(
+        self,
+        sample_rate: int = 16000,
+        device: Optional[int] = None,
+        speech_level: float = 150.0,
+        vad_mode: int = 2,
+        stream_chunks: bool = False
+    ):
+        """
+        Initialize the capture (the stream opens on start()).
+
+        Args:
+            sample_rate: Samples per second (8000, 16000, 32000 or 48000)
+            device: Input device index (None for the system default)
+            speech_level: Mean absolute int16 level counted as speech when
+                          WebRTC VAD is not installed
+            vad_mode: WebRTC VAD aggressiveness, 0 (lenient) to 3 (strict)
+            stream_chunks: Deliver speech frames via next_chunk() as they
+                           arrive instead of whole utterances
+        """
+        self.sample_rate = sample_rate
+        self.device = device
+        self.speech_level = speech_level
+        self.frame_length = sample_rate * FRAME_MS // 1000
+        self._vad = webrtcvad.Vad(vad_mode) if WEBRTCVAD_AVAILABLE else None
+
+        frames_per_second = 1000 / FRAME_MS
+        self._end_frames = int(END_SILENCE_S * frames_per_second)
+        self._min_speech_frames = int(MIN_SPEECH_S * frames_per_second)
+        self._max_frames = int(MAX_UTTERANCE_S * frames_per_second)
+
+        self._pre_roll: collections.deque = collections.deque(
+            maxlen=int(PRE_ROLL_S * frames_per_second)
+        )
+        self._frames: list[np.ndarray] = []
+        self._in_speech = False
+        self._speech_frames = 0
+        self._silent_frames = 0
+
+        self.stream_chunks = stream_chunks
+        self._utterances: queue.Queue = queue.Queue(maxsize=8)
+        self._chunks: queue.Queue = queue.Queue()
+        self._stream: Optional[sd.InputStream] = None
+        self._feed_carry = np.zeros(0, dtype=np.int16)  # Partial frame from feed()
+
+    @property
+    def running(self) -> bool:
+        """Whether the input stream is open."""
+        return self._stream is not None
+
+    def start(self) -> None:
+        """Open the input stream (raises if the device can't be opened)."""
+        if self._stream is not None:
+            return
+
+        stream = sd.InputStream(
+            samplerate=self.sample_rate,
+            channels=1,
+            dtype='int16',
+            blocksize=self.frame_length,
+            device=self.device,
+            callback=self._on_audio
+        )
+        stream.start()
+        self._stream = stream
+
+    def stop(self) -> None:
+        """Close the input stream."""
+        if self._stream is not None:
+            self._stream.stop()
+            self._stream.close()
+            self._stream = None
+
+    def next_utterance(self, timeout: Optional[float] = None) -> Optional[np.ndarray]:
+        """
+        Wait for the next complete utterance.
+
+        Args:
+            timeout: Seconds to wait (None waits indefinitely)
+
+        Returns:
+            int16 samples, or None if nothing was said within the timeout
+        """
+        try:
+            return self._utterances.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def next_chunk(self, timeout: Optional[float] = None) -> Optional[np.ndarray]:
+        """
+        Wait for the next speech frame (stream_chunks mode).
+
+        Args:
+            timeout: Seconds to wait (None waits indefinitely)
+
+        Returns:
+            int16 samples; an empty array marks the end of an utterance;
+            None if nothing arrived within the timeout
+        """
+        try:
+            return self._chunks.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def feed(self, samples: np.ndarray) -> None:
+        """
+        Segment int16 audio pushed from another source (e.g. a browser tab).
+
+        Use instead of start(); samples are cut into VAD frames and may be
+        of any length.
+        """
+        if len(self._feed_carry):
+            samples = np.concatenate([self._feed_carry, samples])
+        usable = len(samples) - len(samples) % self.frame_length
+        for offset in range(0, usable, self.frame_length):
+            frame = samples[offset:offset + self.frame_length]
+            self._on_audio(frame.reshape(-1, 1), self.frame_length, None, None)
+        self._feed_carry = samples[usable:]
+
+    def clear(self) -> None:
+        """Drop audio that was captured but not consumed yet."""
+        for pending in (self._utterances, self._chunks):
+            while True:
+                try:
+                    pending.get_nowait()
+                except queue.Empty:
+                    break
+
+    def _is_speech(self, frame: np.ndarray) -> bool:
+        """Classify one frame."""
+        if self._vad is not None:
+            return self._vad.is_speech(frame.tobytes(), self.sample_rate)
+        return float(np.abs(frame).mean()) >= self.speech_level
+
+    def _on_audio(self, indata, frames, time_info, status) -> None:
+        """Stream callback (audio thread): segment frames into utterances."""
+        frame = indata[:, 0].copy()
+        speech = self._is_speech(frame)
+
+        if not self._in_speech:
+            self._pre_roll.append(frame)
+            if speech:
+                self._in_speech = True
+                self._frames = list(self._pre_roll)
+                self._pre_roll.clear()
+                if self.stream_chunks:
+                    for pending in self._frames:
+                        self._chunks.put_nowait(pending)
+                self._speech_frames = 1
+                self._silent_frames = 0
+            return
+
+        self._frames.append(frame)
+        if self.stream_chunks:
+            self._chunks.put_nowait(frame)
+        if speech:
+            self._speech_frames += 1
+            self._silent_frames = 0
+        else:
+            self._silent_frames += 1
+
+        if self._silent_frames >= self._end_frames or len(self._frames) >= self._max_frames:
+            self._emit()
+
+    def _emit(self) -> None:
+        """Queue the current utterance (if long enough) and reset."""
+        if self.stream_chunks:
+            self._chunks.put_nowait(np.zeros(0, dtype=np.int16))
+        elif self._speech_frames >= self._min_speech_frames:
+            utterance = np.concatenate(self._frames)
+            try:
+                self._utterances.put_nowait(utterance)
+            except queue.Full:
+                # Consumer is behind: keep the newest speech
+                try:
+                    self._utterances.get_nowait()
+                except queue.Empty:
+                    pass
+                self._utterances.put_nowait(utterance)
+
+        self._frames = []
+        self._in_speech = False
+        self._speech_frames = 0
+        self._silent_frames = 0
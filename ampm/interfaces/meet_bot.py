@@ -14,25 +14,26 @@ Features:
 """
 
 import os
+import re
 import sys
 import asyncio
 import time
-import tempfile
 import wave
 import io
 import base64
 import threading
 import queue
 import random
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Iterator, Optional
 
 from playwright.async_api import async_playwright
 import sounddevice as sd
 import numpy as np
 from openai import OpenAI
 from elevenlabs import ElevenLabs
-from elevenlabs.play import play
 try:
     import pyaudio
     PYAUDIO_AVAILABLE = True
@@ -43,13 +44,33 @@ from ..core.graph import MeetingGraph
 from ..core.query import QueryEngine
 from ..core.embeddings import EmbeddingStore
 from ..core.ripple import RippleDetector
+from ..core.http import speech_http_client
 from ..ingest.loader import MeetingLoader
+from .audio_capture import UtteranceCapture
+from .streaming_asr import OnlineASRProcessor, FASTER_WHISPER_AVAILABLE, transcribe as transcribe_local
 
 # Configuration
 SAMPLE_RATE = 16000
 CHANNELS = 1
-RECORD_SECONDS = 6
+RECORD_SECONDS = 6  # Fixed window, only if the streaming capture can't be opened
 INTERRUPT_RECORD_SECONDS = 2  # Shorter recordings during speech for faster interrupt detection
+STREAM_CHUNK_SECONDS = 1.0  # Speech fed to the streaming transcriber per pass
+# Speech prescan before Whisper: per 30 ms frame, RMS level and zero-crossing
+# rate typical of voice (noise crosses zero far more often, hum far less)
+SPEECH_FRAME_RMS = 200
+SPEECH_ZCR_RANGE = (0.01, 0.35)
+MIN_SPEECH_SECONDS = 0.25
+# Echo detection: captured audio is correlated with the bot's last answer
+ECHO_RATE = 8000
+ECHO_CORRELATION = 0.6
+ECHO_TAIL_SECONDS = 5.0  # How long after an answer ends its echo is looked for
+TTS_MODEL = "eleven_flash_v2_5"  # Lowest-latency ElevenLabs model
+TTS_SAMPLE_RATE = 16000  # Raw PCM from ElevenLabs (pcm_16000), played without decoding
+TTS_FORMAT = f"pcm_{TTS_SAMPLE_RATE}"
+TTS_FLUSH_CHARS = 150  # Streamed answer text is sent to TTS per sentence, or at this length
+
+# End of a sentence in streamed LLM text (punctuation, optional closing quote, whitespace)
+SENTENCE_END = re.compile(r'[.!?]["\')\]]*\s')
 
 # Browser profile directory
 PROFILE_DIR = Path(__file__).parent.parent.parent / ".browser_profile"
@@ -63,6 +84,37 @@ STOP_PHRASES = ["hey parrot stop", "hey parrot, stop", "hey par stop", "hey parr
 # Thank you phrases (all start with "hey par...")
 THANK_YOU_PHRASES = ["hey parrot thank you", "hey parrot thanks", "hey parrot, thank you", "hey parrot, thanks", "hey par thank you", "hey par thanks"]
 
+
+def _phrase_pattern(phrases: list[str]) -> re.Pattern:
+    """Compile phrases into one alternation (longest first wins at a position)."""
+    return re.compile("|".join(
+        re.escape(phrase) for phrase in sorted(set(phrases), key=len, reverse=True)
+    ))
+
+
+# Each transcript (and streamed partial) is scanned once per phrase kind
+WAKE_PATTERN = _phrase_pattern(WAKE_WORDS)
+STOP_PATTERN = _phrase_pattern(STOP_PHRASES)
+THANK_YOU_PATTERN = _phrase_pattern(THANK_YOU_PHRASES)
+
+# Multi-word wake words with their words in order but anything between
+# them (a transcript may split or pad the wake word)
+FUZZY_WAKE_PATTERNS = [
+    re.compile(".*?".join(re.escape(part) for part in parts), re.DOTALL)
+    for parts in dict.fromkeys(tuple(wake.split()) for wake in WAKE_WORDS)
+    if len(parts) > 1
+]
+
+# Stop and thank-you together, one named group each, so the interrupt
+# listener classifies a transcript in a single scan
+INTERRUPT_PATTERN = re.compile(
+    f"(?P<stop>{STOP_PATTERN.pattern})|(?P<thank_you>{THANK_YOU_PATTERN.pattern})"
+)
+
+# Question intents
+RIPPLE_PATTERN = _phrase_pattern(["what if", "if we change", "impact of", "affects", "ripple", "downstream"])
+FOLLOW_UP_PATTERN = _phrase_pattern(["what about", "and what", "also", "related to that", "more about"])
+
 # Friendly acknowledgment responses
 ACKNOWLEDGMENT_RESPONSES = [
     "You're welcome!",
@@ -75,6 +127,94 @@ ACKNOWLEDGMENT_RESPONSES = [
 ]
 
 
+def _stream_tts(elevenlabs: ElevenLabs, text: str, voice_id: str) -> Iterator[bytes]:
+    """Yield TTS audio chunks (int16 PCM) as ElevenLabs synthesizes them."""
+    tts = elevenlabs.text_to_speech
+    # elevenlabs 1.x names the streaming endpoint convert_as_stream
+    stream = getattr(tts, "stream", None) or tts.convert_as_stream
+    return stream(
+        text=text,
+        voice_id=voice_id,
+        model_id=TTS_MODEL,
+        output_format=TTS_FORMAT
+    )
+
+
+def _split_sentences(tokens: Iterable[str]) -> Iterator[str]:
+    """
+    Regroup streamed LLM tokens into chunks for TTS.
+
+    A chunk ends at a sentence boundary, or at the last word break once
+    TTS_FLUSH_CHARS characters are pending, so speech can start long
+    before the whole answer has been generated.
+    """
+    buffer = ""
+    for token in tokens:
+        buffer += token
+
+        end = None
+        for match in SENTENCE_END.finditer(buffer):
+            end = match.end()
+        if end is None and len(buffer) >= TTS_FLUSH_CHARS:
+            end = buffer.rfind(" ") + 1 or None
+
+        if end:
+            if buffer[:end].strip():
+                yield buffer[:end].strip()
+            buffer = buffer[end:]
+
+    if buffer.strip():
+        yield buffer.strip()
+
+
+def _echo_samples(audio: np.ndarray, rate: int) -> np.ndarray:
+    """int16 audio as float32 at ECHO_RATE (averaging adjacent samples)."""
+    step = rate // ECHO_RATE
+    samples = audio.reshape(-1).astype(np.float32)
+    return samples[:len(samples) - len(samples) % step].reshape(-1, step).mean(axis=1)
+
+
+def _peak_correlation(audio: np.ndarray, reference: np.ndarray) -> float:
+    """
+    Peak normalized cross-correlation of captured audio with a reference.
+
+    audio (int16 at SAMPLE_RATE) is brought to ECHO_RATE like the
+    reference; the shorter signal slides along the longer one in a single
+    FFT, and every lag is normalized by the energy of both windows.
+    """
+    samples = _echo_samples(audio, SAMPLE_RATE)
+
+    short, long = sorted((samples, reference), key=len)
+    short_energy = float(np.dot(short, short))
+    if not short_energy:
+        return 0.0
+
+    size = 1 << (len(long) + len(short) - 1).bit_length()
+    lags = len(long) - len(short) + 1
+    corr = np.fft.irfft(np.fft.rfft(long, size) * np.conj(np.fft.rfft(short, size)), size)[:lags]
+
+    energy = np.concatenate([[0.0], np.cumsum(np.square(long, dtype=np.float64))])
+    window_energy = energy[len(short):] - energy[:lags]
+    norm = np.sqrt(window_energy * short_energy)
+
+    # Near-silent windows would divide rounding noise by ~0
+    valid = window_energy > 1e-3 * window_energy.max()
+    if not valid.any():
+        return 0.0
+    return float(np.max(np.abs(corr[valid]) / norm[valid]))
+
+
+def _warm_up_tts(elevenlabs: ElevenLabs, voice_id: str) -> None:
+    """Synthesize a throwaway clip so the first answer skips connection setup."""
+    for _ in elevenlabs.text_to_speech.convert(
+        text="Hi there",
+        voice_id=voice_id,
+        model_id=TTS_MODEL,
+        output_format=TTS_FORMAT
+    ):
+        pass
+
+
 class DemoMeetBot:
     """
     Google Meet bot - Demo version.
@@ -102,11 +242,16 @@ class DemoMeetBot:
             fast_mode: Use Backboard's integrated RAG for faster responses (default True).
         """
         self.meeting_url = meeting_url
-        self.elevenlabs = ElevenLabs(api_key=os.getenv("ELEVENLABS_API_KEY"))
+        self._tts_client = speech_http_client()
+        self.elevenlabs = ElevenLabs(
+            api_key=os.getenv("ELEVENLABS_API_KEY"),
+            httpx_client=self._tts_client
+        )
         self.voice_id = os.getenv("ELEVENLABS_VOICE_ID", "21m00Tcm4TlvDq8ikWAM")
         self.browser = None
         self.page = None
         self.fast_mode = fast_mode and use_backboard
+        self._speaker: Optional[sd.RawOutputStream] = None
 
         # Initialize memory system with persistence
         config_dir = str(PROFILE_DIR.parent / ".ampm")
@@ -143,6 +288,9 @@ class DemoMeetBot:
 
         PROFILE_DIR.mkdir(exist_ok=True)
 
+        # Warm up TTS while the browser starts and joins
+        warmup = asyncio.create_task(self._warmup())
+
         async with async_playwright() as p:
             print("\nLaunching browser...")
 
@@ -158,8 +306,70 @@ class DemoMeetBot:
 
             await self._ensure_google_login()
             await self._join_meeting()
+            await warmup
             await self._demo_loop()
 
+    async def _warmup(self):
+        """Open the TTS connection and output device ahead of the first question."""
+        try:
+            self._open_speaker()
+            await asyncio.get_event_loop().run_in_executor(
+                None, _warm_up_tts, self.elevenlabs, self.voice_id
+            )
+        except Exception as e:
+            print(f"Warning: TTS warmup failed: {e}")
+
+    def _open_speaker(self) -> sd.RawOutputStream:
+        """Open (once) the output stream streamed TTS audio is written to."""
+        if self._speaker is None:
+            speaker = sd.RawOutputStream(samplerate=TTS_SAMPLE_RATE, channels=1, dtype='int16')
+            speaker.start()
+            self._speaker = speaker
+        return self._speaker
+
+    def _synthesize(self, sentences: queue.Queue, audio: queue.Queue) -> None:
+        """
+        TTS stage: stream each queued sentence's PCM into the audio queue.
+
+        Runs until a None sentence arrives, then passes None on.
+        """
+        try:
+            while True:
+                sentence = sentences.get()
+                if sentence is None:
+                    break
+                for chunk in _stream_tts(self.elevenlabs, sentence, self.voice_id):
+                    if chunk:
+                        audio.put(chunk)
+        finally:
+            audio.put(None)
+
+    def _play_pcm(self, audio: queue.Queue) -> Optional[float]:
+        """
+        Playback stage: write queued PCM chunks to the speakers until None.
+
+        Returns:
+            Time (time.time()) the first chunk was played, None if no audio
+        """
+        speaker = self._open_speaker()
+        first_audio_at = None
+        carry = b""
+
+        while True:
+            chunk = audio.get()
+            if chunk is None:
+                break
+            if first_audio_at is None:
+                first_audio_at = time.time()
+
+            # Chunks can split an int16 sample; hold the odd byte back
+            chunk = carry + chunk
+            cut = len(chunk) - len(chunk) % 2
+            carry = chunk[cut:]
+            speaker.write(chunk[:cut])
+
+        return first_audio_at
+
     async def _ensure_google_login(self):
         """Check Google login."""
         print("\nChecking Google login...")
@@ -247,39 +457,50 @@ class DemoMeetBot:
         # Add to conversation history for context
         self.conversation_history.append({"role": "user", "content": question})
 
-        # Check if this is a ripple/impact question
-        ripple_keywords = ["what if", "if we change", "impact of", "affects", "ripple", "downstream"]
-        is_ripple_query = any(kw in question.lower() for kw in ripple_keywords)
-
-        # Check if this is a follow-up question
-        follow_up_keywords = ["what about", "and what", "also", "related to that", "more about"]
-        is_follow_up = any(kw in question.lower() for kw in follow_up_keywords)
+        # Check if this is a ripple/impact or follow-up question
+        question_lower = question.lower()
+        is_ripple_query = RIPPLE_PATTERN.search(question_lower) is not None
+        is_follow_up = FOLLOW_UP_PATTERN.search(question_lower) is not None
 
         print("Thinking...", end=" ", flush=True)
         llm_start = time.time()
 
-        answer = ""
-
         # Handle ripple detection queries
         if is_ripple_query and self.graph._decisions:
-            answer = self._handle_ripple_query(question)
+            result = None
+            tokens = iter([self._handle_ripple_query(question)])
         else:
-            # Regular query with context
+            # Regular query with context, streamed so speech starts early
             if is_follow_up and self.last_query_result:
                 # Add context from last query
-                context_question = f"Context: {self.last_query_result.answer[:200]}... Question: {question}"
-                if self.fast_mode:
-                    result = self.query_engine.query_fast(context_question)
-                else:
-                    result = self.query_engine.query(context_question)
+                query_question = f"Context: {self.last_query_result.answer[:200]}... Question: {question}"
             else:
-                if self.fast_mode:
-                    result = self.query_engine.query_fast(question)
-                else:
-                    result = self.query_engine.query(question)
+                query_question = question
 
-            answer = result.answer
-            self.last_query_result = result
+            if self.fast_mode:
+                result = self.query_engine.query_fast(query_question, stream=True)
+            else:
+                result = self.query_engine.query(query_question, stream=True)
+            tokens = result.answer
+
+        llm_time = time.time() - llm_start
+        print(f"({llm_time:.2f}s to first token)")
+
+        # Pipeline: LLM tokens -> sentences -> TTS stream -> speakers, so
+        # the first sentence plays while the rest is still generated
+        loop = asyncio.get_event_loop()
+        sentences: queue.Queue = queue.Queue()
+        audio: queue.Queue = queue.Queue()
+        synthesizing = loop.run_in_executor(None, self._synthesize, sentences, audio)
+        playing = loop.run_in_executor(None, self._play_pcm, audio)
+
+        print("\nAMPM: ", end="", flush=True)
+        answer = await loop.run_in_executor(None, self._queue_sentences, tokens, sentences)
+        llm_total_time = time.time() - llm_start
+        print("\n")
+
+        if result is not None:
+            self.last_query_result = replace(result, answer=answer)
 
             # Extract decision context for potential ripple follow-ups
             if result.sources:
@@ -288,44 +509,46 @@ class DemoMeetBot:
                         self.last_decision_context = source
                         break
 
-        llm_time = time.time() - llm_start
-        print(f"({llm_time:.2f}s)")
-
         # Add to history
         self.conversation_history.append({"role": "assistant", "content": answer})
 
-        print(f"\nAMPM: {answer}\n")
-
-        # TTS
         print("Speaking...", end=" ", flush=True)
-        tts_start = time.time()
-
-        audio = self.elevenlabs.text_to_speech.convert(
-            text=answer,
-            voice_id=self.voice_id,
-            model_id="eleven_turbo_v2_5",
-            output_format="mp3_44100_128"
-        )
-        play(audio)
+        await synthesizing
+        first_audio_at = await playing
 
-        tts_time = time.time() - tts_start
         total_time = time.time() - total_start
+        first_audio_time = (first_audio_at or time.time()) - total_start
 
         print(f"Done!")
-        print(f"LLM: {llm_time:.2f}s | TTS: {tts_time:.2f}s | Total: {total_time:.2f}s\n")
+        print(f"LLM: {llm_total_time:.2f}s | First audio: {first_audio_time:.2f}s | "
+              f"Total: {total_time:.2f}s\n")
+
+    @staticmethod
+    def _queue_sentences(tokens: Iterable[str], sentences: queue.Queue) -> str:
+        """
+        LLM stage: print and queue each complete sentence of the streamed answer.
+
+        Always finishes with a None sentence.
+
+        Returns:
+            The answer text that was queued
+        """
+        spoken = []
+        try:
+            for sentence in _split_sentences(tokens):
+                print(sentence, end=" ", flush=True)
+                spoken.append(sentence)
+                sentences.put(sentence)
+        finally:
+            sentences.put(None)
+        return " ".join(spoken)
 
     def _handle_ripple_query(self, question: str) -> str:
         """Handle ripple effect / impact analysis queries."""
         question_lower = question.lower()
 
         # Try to find a decision mentioned in the question
-        target_decision = None
-        for dec_id, dec in self.graph._decisions.items():
-            # Check if decision content keywords appear in question
-            dec_keywords = dec.content.lower().split()[:5]
-            if any(kw in question_lower for kw in dec_keywords if len(kw) > 3):
-                target_decision = dec
-                break
+        target_decision = self.graph.find_mentioned_decision(question_lower)
 
         # Fall back to last decision context
         if not target_decision and self.last_decision_context:
@@ -382,6 +605,9 @@ class DemoMeetBot:
         print("\nLeaving...")
         if self.browser:
             await self.browser.close()
+        if self._speaker is not None:
+            self._speaker.close()
+        self._tts_client.close()
         print("Goodbye!")
 
 
@@ -417,14 +643,20 @@ class MeetBot:
             fast_mode: Use Backboard's integrated RAG for faster responses (default True).
         """
         self.meeting_url = meeting_url
-        self.openai = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-        self.elevenlabs = ElevenLabs(api_key=os.getenv("ELEVENLABS_API_KEY"))
+        # Speech APIs share one keep-alive client, warmed up in start()
+        self._tts_client = speech_http_client()
+        self.openai = OpenAI(api_key=os.getenv("OPENAI_API_KEY"), http_client=self._tts_client)
+        self.elevenlabs = ElevenLabs(
+            api_key=os.getenv("ELEVENLABS_API_KEY"),
+            httpx_client=self._tts_client
+        )
         self.voice_id = os.getenv("ELEVENLABS_VOICE_ID", "21m00Tcm4TlvDq8ikWAM")
         self.browser = None
         self.page = None
         self.is_listening = True
         self.is_speaking = False
         self.last_spoken_audio = None  # Store last spoken audio for echo detection
+        self._echo_reference = None  # Last spoken audio, decoded for correlation
         self.last_speak_time = 0  # Track when bot last spoke
         self.audio_context_initialized = False  # Track if audio context is set up
 
@@ -434,6 +666,25 @@ class MeetBot:
         self.listening_thread = None
         self.stop_listening = False
 
+        # One microphone stream serves both listening and interrupt
+        # detection; it yields whole utterances as the speaker pauses, or
+        # with a local Whisper model, speech is transcribed as it arrives
+        self.online_asr = OnlineASRProcessor(SAMPLE_RATE) if FASTER_WHISPER_AVAILABLE else None
+        self.capture = UtteranceCapture(SAMPLE_RATE, stream_chunks=self.online_asr is not None)
+        self._stt_lock = threading.Lock()
+        self._skip_utterance = False
+
+        # Meeting tab audio, pushed from the page and endpointed the same way
+        self.meeting_capture = UtteranceCapture(SAMPLE_RATE)
+        self._meeting_binding_exposed = False
+
+        # Blocking audio waits, STT and TTS each get their own worker, so a
+        # long mic wait never queues a transcription or synthesis behind it
+        self._audio_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ampm-audio")
+        self._stt_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ampm-stt")
+        self._tts_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ampm-tts")
+        self._speaker: Optional[sd.RawOutputStream] = None  # Streamed answers, see _play_pcm
+
         # Initialize memory system with persistence
         config_dir = str(PROFILE_DIR.parent / ".ampm")
         self.graph = MeetingGraph()
@@ -443,7 +694,8 @@ class MeetBot:
             persist=True
         )
         self.loader = MeetingLoader(self.graph, self.embeddings)
-        self.query_engine = QueryEngine(self.graph, self.embeddings)
+        # Spoken questions get rephrased a lot; reuse near-duplicate answers
+        self.query_engine = QueryEngine(self.graph, self.embeddings, semantic_threshold=0.95)
         self.ripple_detector = RippleDetector(self.graph)
         self.fast_mode = fast_mode and use_backboard
 
@@ -472,6 +724,9 @@ class MeetBot:
 
         PROFILE_DIR.mkdir(exist_ok=True)
 
+        # Warm up STT/TTS while the browser starts and joins
+        warmup = asyncio.create_task(self._warmup())
+
         async with async_playwright() as p:
             print("\nLaunching browser...")
 
@@ -490,8 +745,33 @@ class MeetBot:
 
             await self._ensure_google_login()
             await self._join_meeting()
+            await warmup
             await self._listen_loop()
 
+    async def _warmup(self):
+        """
+        Pay one-time speech setup costs before the first utterance.
+
+        Loads the local Whisper model (or opens the Whisper API connection)
+        and synthesizes a throwaway TTS clip, in parallel.
+        """
+        loop = asyncio.get_event_loop()
+
+        def warm_stt():
+            if FASTER_WHISPER_AVAILABLE:
+                transcribe_local(np.zeros(SAMPLE_RATE, dtype=np.float32))
+            else:
+                self.openai.models.list()
+
+        results = await asyncio.gather(
+            loop.run_in_executor(self._stt_pool, warm_stt),
+            loop.run_in_executor(self._tts_pool, _warm_up_tts, self.elevenlabs, self.voice_id),
+            return_exceptions=True
+        )
+        for name, result in zip(("STT", "TTS"), results):
+            if isinstance(result, Exception):
+                print(f"Warning: {name} warmup failed: {result}")
+
     async def _ensure_google_login(self):
         """Check Google login status."""
         print("\nChecking Google login...")
@@ -575,144 +855,88 @@ class MeetBot:
         print("\nPress Ctrl+C to leave.\n")
 
     async def _setup_meeting_audio_capture(self):
-        """Set up JavaScript to capture audio from Google Meet using screen capture."""
+        """
+        Stream audio from Google Meet's audio element into Python.
+
+        The page resamples the meeting audio to SAMPLE_RATE and pushes
+        ~128 ms blocks of int16 PCM through an exposed binding, so audio
+        arrives continuously without polling page.evaluate().
+        """
         try:
-            # Use getDisplayMedia to capture tab audio
-            # This requires user permission but captures the actual meeting audio
+            if not self._meeting_binding_exposed:
+                await self.page.expose_binding("ampmPushAudio", self._on_meeting_audio)
+                self._meeting_binding_exposed = True
+
             setup_script = """
-            (async function() {
-                window.ampmAudioCapture = {
-                    mediaRecorder: null,
-                    audioChunks: [],
-                    stream: null,
-                    initialized: false,
-                    lastAudioTime: 0
-                };
-                
-                // Function to capture audio from meeting tab
-                window.ampmAudioCapture.init = async function() {
-                    try {
-                        // Request screen/tab capture with audio
-                        // This will show a permission dialog - user needs to select the Google Meet tab
-                        console.log('Parrot: Requesting screen capture with audio...');
-                        console.log('Parrot: Please select the Google Meet tab when prompted');
-                        
-                        // Note: This requires user interaction, so we'll use a different approach
-                        // Instead, we'll capture from the audio elements in the page
-                        const audioElements = document.querySelectorAll('audio');
-                        console.log('Parrot: Found', audioElements.length, 'audio elements');
-                        
-                        if (audioElements.length > 0) {
-                            // Create audio context and connect to first audio element
-                            const audioContext = new (window.AudioContext || window.webkitAudioContext)();
-                            const audioElement = audioElements[0];
-                            
-                            // Create source from audio element
-                            const source = audioContext.createMediaElementSource(audioElement);
-                            
-                            // Create analyser
-                            const analyser = audioContext.createAnalyser();
-                            analyser.fftSize = 2048;
-                            analyser.smoothingTimeConstant = 0.3;
-                            
-                            source.connect(analyser);
-                            analyser.connect(audioContext.destination);
-                            
-                            this.analyser = analyser;
-                            this.audioContext = audioContext;
-                            this.bufferLength = analyser.frequencyBinCount;
-                            this.dataArray = new Uint8Array(this.bufferLength);
-                            
-                            this.initialized = true;
-                            console.log('Parrot: Audio capture initialized from audio element');
-                            return true;
-                        }
-                        
-                        return false;
-                    } catch (error) {
-                        console.error('Parrot: Error initializing audio capture:', error);
+            async (sampleRate) => {
+                if (window.ampmAudioCapture && window.ampmAudioCapture.initialized) {
+                    return true;
+                }
+                try {
+                    const audioElements = document.querySelectorAll('audio');
+                    console.log('Parrot: Found', audioElements.length, 'audio elements');
+                    if (audioElements.length === 0) {
                         return false;
                     }
-                };
-                
-                // Function to get audio data
-                window.ampmAudioCapture.getAudioData = function() {
-                    if (!this.initialized || !this.analyser) {
-                        return null;
-                    }
-                    this.analyser.getByteTimeDomainData(this.dataArray);
-                    const now = Date.now();
-                    if (now - this.lastAudioTime > 100) {  // Sample every 100ms
-                        this.lastAudioTime = now;
-                        return Array.from(this.dataArray);
-                    }
-                    return null;
-                };
-                
-                // Try to initialize after a delay
-                setTimeout(() => {
-                    window.ampmAudioCapture.init().then(success => {
-                        if (!success) {
-                            console.log('Parrot: Audio capture initialization failed, will use system mic');
+
+                    // The context resamples to the STT rate
+                    const audioContext = new AudioContext({ sampleRate: sampleRate });
+                    const source = audioContext.createMediaElementSource(audioElements[0]);
+                    const processor = audioContext.createScriptProcessor(2048, 1, 1);
+
+                    processor.onaudioprocess = (event) => {
+                        const input = event.inputBuffer.getChannelData(0);
+                        const pcm = new Int16Array(input.length);
+                        for (let i = 0; i < input.length; i++) {
+                            pcm[i] = Math.max(-1, Math.min(1, input[i])) * 32767;
                         }
-                    });
-                }, 3000);
-                
-                return true;
-            })();
+                        const bytes = new Uint8Array(pcm.buffer);
+                        let binary = '';
+                        for (let i = 0; i < bytes.length; i += 0x8000) {
+                            binary += String.fromCharCode.apply(null, bytes.subarray(i, i + 0x8000));
+                        }
+                        window.ampmPushAudio(btoa(binary));
+                    };
+
+                    // Keep the meeting audible; the processor outputs silence
+                    source.connect(audioContext.destination);
+                    source.connect(processor);
+                    processor.connect(audioContext.destination);
+
+                    window.ampmAudioCapture = { audioContext, processor, initialized: true };
+                    console.log('Parrot: Audio capture initialized from audio element');
+                    return true;
+                } catch (error) {
+                    console.error('Parrot: Error initializing audio capture:', error);
+                    return false;
+                }
+            }
             """
-            
-            await self.page.evaluate(setup_script)
-            await asyncio.sleep(3)  # Wait for initialization
-            
-            # Check if it worked
-            initialized = await self.page.evaluate("""
-                () => window.ampmAudioCapture && window.ampmAudioCapture.initialized
-            """)
-            
+
+            await asyncio.sleep(3)  # Let the meeting's audio elements appear
+            initialized = await self.page.evaluate(setup_script, SAMPLE_RATE)
+
             if initialized:
                 self.audio_context_initialized = True
                 print("✅ Audio capture from Google Meet initialized")
             else:
                 print("⚠️  Meeting audio capture not available, using system microphone")
                 self.audio_context_initialized = False
-            
+
         except Exception as e:
             print(f"⚠️  Could not set up meeting audio capture: {e}")
             print("   Using system microphone instead...")
             self.audio_context_initialized = False
 
+    def _on_meeting_audio(self, source, pcm_base64: str) -> None:
+        """Binding called by the page with a block of base64 int16 PCM."""
+        self.meeting_capture.feed(np.frombuffer(base64.b64decode(pcm_base64), dtype=np.int16))
+
     async def _capture_meeting_audio(self) -> Optional[np.ndarray]:
-        """Capture audio from Google Meet tab."""
+        """Next utterance heard in the Google Meet tab (None if none is ready)."""
         if not self.audio_context_initialized:
             return None
-            
-        try:
-            # Get audio data from JavaScript
-            audio_data = await self.page.evaluate("""
-                () => {
-                    if (window.ampmAudioCapture && window.ampmAudioCapture.initialized) {
-                        return window.ampmAudioCapture.getAudioData();
-                    }
-                    return null;
-                }
-            """)
-            
-            if audio_data is None or len(audio_data) == 0:
-                return None
-            
-            # Convert to numpy array and process
-            audio_array = np.array(audio_data, dtype=np.float32)
-            # Normalize from 0-255 to -1 to 1, then to int16
-            audio_array = ((audio_array - 128) / 128.0 * 32767).astype(np.int16)
-            
-            # Resample if needed (analyser gives us frequency data, we need time domain)
-            # For now, just return what we have
-            return audio_array
-            
-        except Exception as e:
-            # Silently fail and fall back to system mic
-            return None
+        return self.meeting_capture.next_utterance(timeout=0)
 
     async def _listen_loop(self):
         """Continuously listen for questions from Google Meet."""
@@ -747,45 +971,18 @@ class MeetBot:
                 audio = await self._capture_meeting_audio()
                 using_meeting_audio = audio is not None
 
-                if audio is None:
-                    # Fallback to system mic
-                    audio = await asyncio.get_event_loop().run_in_executor(
-                        None, self._record_audio
+                if audio is None and self.online_asr is not None:
+                    # Streaming STT: the utterance is transcribed while it is spoken
+                    transcript = await asyncio.get_event_loop().run_in_executor(
+                        self._stt_pool, self._next_streamed_transcript
                     )
-                    using_meeting_audio = False
-
-                # Quick check: if all zeros, skip transcription
-                if audio is None or len(audio) == 0 or np.all(audio == 0):
-                    print("(no audio detected)")
-                    await asyncio.sleep(0.5)
-                    continue
-
-                # Check audio level
-                audio_level = np.abs(audio).mean()
-                max_level = np.abs(audio).max()
-                source = "meeting" if using_meeting_audio else "mic"
-                print(f"[{source} Level: {audio_level:.0f}, Max: {max_level:.0f}]", end=" ", flush=True)
-
-                # Skip audio if too soon after bot spoke (echo prevention)
-                time_since_speak = time.time() - self.last_speak_time
-                if time_since_speak < 4.0:  # Wait 4 seconds after bot speaks
-                    print("(skipping - too soon after bot spoke, preventing echo)")
-                    continue
-
-                # Check audio level - be more lenient for system mic
-                threshold = 5 if using_meeting_audio else 20  # Higher threshold for mic (more noise)
-                if audio_level < threshold:
-                    print("(silence - audio too quiet)")
-                    continue
-
-                # Additional echo check: if audio is very loud right after speaking, skip it
-                if time_since_speak < 6.0 and audio_level > 5000:
-                    print("(skipping - likely echo, too loud too soon)")
-                    continue
-
-                transcript = await asyncio.get_event_loop().run_in_executor(
-                    None, lambda: self._transcribe(audio)
-                )
+                    if transcript is None:
+                        print("(no audio detected)")
+                        continue
+                else:
+                    transcript = await self._transcribe_captured(audio, using_meeting_audio)
+                    if transcript is None:
+                        continue
 
                 if transcript.strip():
                     print(f"Heard: \"{transcript}\"")
@@ -823,28 +1020,178 @@ class MeetBot:
                 traceback.print_exc()
                 await asyncio.sleep(1)
 
+    async def _transcribe_captured(self, audio: Optional[np.ndarray],
+                                   using_meeting_audio: bool) -> Optional[str]:
+        """
+        Transcribe captured audio (a recorded clip or utterance).
+
+        Returns None if the audio is skipped as silence or echo.
+        """
+        if audio is None:
+            # Fallback to system mic
+            audio = await asyncio.get_event_loop().run_in_executor(
+                self._audio_pool, self._next_mic_utterance
+            )
+            using_meeting_audio = False
+
+        if audio is not None and len(audio):
+            # One |x| pass for both level and peak (int32 so -32768 doesn't wrap)
+            levels = np.abs(audio, dtype=np.int32)
+            audio_level = levels.mean()
+            max_level = levels.max()
+
+        # Quick check: if all zeros, skip transcription
+        if audio is None or len(audio) == 0 or max_level == 0:
+            print("(no audio detected)")
+            await asyncio.sleep(0.5)
+            return None
+
+        # Check audio level
+        source = "meeting" if using_meeting_audio else "mic"
+        print(f"[{source} Level: {audio_level:.0f}, Max: {max_level:.0f}]", end=" ", flush=True)
+
+        # Skip the bot's own answer picked up again (echo prevention)
+        if self._is_echo(audio):
+            print("(skipping - echo of bot's own speech)")
+            return None
+
+        # Check audio level - be more lenient for system mic
+        threshold = 5 if using_meeting_audio else 20  # Higher threshold for mic (more noise)
+        if audio_level < threshold:
+            print("(silence - audio too quiet)")
+            return None
+
+        if not self._is_plausible_speech(audio):
+            print("(no speech - noise only)")
+            return None
+
+        return await asyncio.get_event_loop().run_in_executor(
+            self._stt_pool, self._transcribe, audio
+        )
+
+    def _queue_sentences(self, tokens: Iterable[str], sentences: queue.Queue) -> str:
+        """
+        LLM stage: queue each complete sentence of the streamed answer.
+
+        Stops reading tokens once should_stop_speaking is set; always
+        finishes with a None sentence.
+
+        Returns:
+            The answer text that was queued
+        """
+        spoken = []
+        try:
+            for sentence in _split_sentences(tokens):
+                if self.should_stop_speaking:
+                    break
+                spoken.append(sentence)
+                sentences.put(sentence)
+        finally:
+            sentences.put(None)
+        return " ".join(spoken)
+
+    def _synthesize_stream(self, sentences: queue.Queue, audio: queue.Queue) -> None:
+        """
+        TTS stage: stream each queued sentence's PCM into the audio queue.
+
+        Runs until a None sentence arrives, then passes None on. The whole
+        answer becomes the echo reference.
+        """
+        clip = []
+        try:
+            while True:
+                sentence = sentences.get()
+                if sentence is None:
+                    break
+                if self.should_stop_speaking:
+                    continue
+                for chunk in _stream_tts(self.elevenlabs, sentence, self.voice_id):
+                    if chunk:
+                        clip.append(chunk)
+                        audio.put(chunk)
+        finally:
+            audio.put(None)
+            audio_bytes = b''.join(clip)
+            audio_bytes = audio_bytes[:len(audio_bytes) - len(audio_bytes) % 2]
+            self.last_spoken_audio = audio_bytes
+            self._echo_reference = _echo_samples(np.frombuffer(audio_bytes, dtype=np.int16), TTS_SAMPLE_RATE)
+
+    def _open_speaker(self) -> sd.RawOutputStream:
+        """Open (once) the output stream streamed answers are written to."""
+        if self._speaker is None:
+            speaker = sd.RawOutputStream(samplerate=TTS_SAMPLE_RATE, channels=1, dtype='int16')
+            speaker.start()
+            self._speaker = speaker
+        return self._speaker
+
+    def _play_pcm(self, audio: queue.Queue) -> Optional[float]:
+        """
+        Playback stage: write queued PCM to the meeting output until None.
+
+        Once should_stop_speaking is set, the rest of the queue is drained
+        without being played.
+
+        Returns:
+            Time (time.time()) the first chunk was played, None if no audio
+        """
+        speaker = self._open_speaker()
+        first_audio_at = None
+        carry = b""
+
+        while True:
+            chunk = audio.get()
+            if chunk is None:
+                break
+            if self.should_stop_speaking:
+                continue
+            if first_audio_at is None:
+                first_audio_at = time.time()
+
+            # Chunks can split an int16 sample; hold the odd byte back
+            chunk = carry + chunk
+            cut = len(chunk) - len(chunk) % 2
+            carry = chunk[cut:]
+            speaker.write(chunk[:cut])
+
+        if first_audio_at is not None and not self.should_stop_speaking:
+            # The last write is still in the device buffer
+            time.sleep(speaker.latency)
+        return first_audio_at
+
+    def _is_echo(self, audio: np.ndarray) -> bool:
+        """
+        Whether captured audio is the bot's own last answer heard again.
+
+        Correlates against the last answer while it can still be audible.
+        """
+        reference = self._echo_reference
+        if reference is None:
+            return False
+        since_speak = time.time() - self.last_speak_time
+        if since_speak > len(reference) / ECHO_RATE + ECHO_TAIL_SECONDS:
+            return False
+        return _peak_correlation(audio, reference) > ECHO_CORRELATION
+
     async def _speak_simple(self, text: str):
         """Speak a simple response (e.g., acknowledgment) without interrupt handling."""
         self.is_speaking = True
+        self.should_stop_speaking = False  # May still be set by the interrupted answer
         print(f"\nParrot: {text}\n")
 
         try:
-            # Generate TTS audio
-            audio_generator = self.elevenlabs.text_to_speech.convert(
-                text=text,
-                voice_id=self.voice_id,
-                model_id="eleven_turbo_v2_5",
-                output_format="mp3_44100_128"
+            # Stream TTS audio (queued while the mic unmutes)
+            sentences: queue.Queue = queue.Queue()
+            audio: queue.Queue = queue.Queue()
+            sentences.put(text)
+            sentences.put(None)
+            synthesizing = asyncio.get_event_loop().run_in_executor(
+                self._tts_pool, self._synthesize_stream, sentences, audio
             )
-            audio_bytes = b''.join(audio_generator)
-
-            # Unmute and play
             await self._set_mic_muted(False)
-            await asyncio.sleep(0.3)
-            await self._inject_audio_to_meeting(audio_bytes)
-            await asyncio.sleep(1.0)
+            first_audio_at = await self._inject_audio_to_meeting(audio)
+            await synthesizing
             await self._set_mic_muted(True)
-            self.last_speak_time = time.time()
+            self.last_speak_time = first_audio_at or time.time()
 
         except Exception as e:
             print(f"TTS Error: {e}")
@@ -854,13 +1201,14 @@ class MeetBot:
     async def _set_mic_muted(self, muted: bool):
         """
         Mute or unmute the microphone in Google Meet.
+
+        Finding the button, clicking it and waiting for Meet to show the
+        new state happen in the page, in a single evaluate() round trip.
         
         Args:
             muted: True to mute, False to unmute
         """
         try:
-            await asyncio.sleep(0.2)
-            
             # Try multiple selectors for the mic button
             selectors = [
                 f'button[aria-label*="{"Turn off" if not muted else "Turn on"} microphone" i]',
@@ -868,45 +1216,42 @@ class MeetBot:
                 f'button[data-is-muted="{"false" if muted else "true"}"]',
                 '[data-mute-state="false"]' if muted else '[data-mute-state="true"]',
             ]
-            
-            for selector in selectors:
-                try:
-                    mic_btn = await self.page.query_selector(selector)
-                    if mic_btn:
-                        aria_label = await mic_btn.get_attribute('aria-label') or ''
-                        is_muted = 'Turn on' in aria_label or 'unmute' in aria_label.lower()
-                        
-                        if (muted and not is_muted) or (not muted and is_muted):
-                            await mic_btn.click()
-                            await asyncio.sleep(0.3)
-                            return True
-                        return True  # Already in desired state
-                except:
-                    continue
-            
-            # Fallback: try JavaScript
-            result = await self.page.evaluate(f"""
-                (() => {{
-                    const buttons = Array.from(document.querySelectorAll('button'));
-                    const micBtn = buttons.find(btn => {{
+
+            result = await self.page.evaluate("""
+                async ({selectors, muted}) => {
+                    const findButton = () => {
+                        for (const selector of selectors) {
+                            const btn = document.querySelector(selector);
+                            if (btn) return btn;
+                        }
+                        // Fallback: any button labelled as the mic
+                        return Array.from(document.querySelectorAll('button')).find(btn => {
+                            const label = (btn.getAttribute('aria-label') || '').toLowerCase();
+                            return label.includes('microphone') || label.includes('mic');
+                        });
+                    };
+                    const isMuted = (btn) => {
                         const label = btn.getAttribute('aria-label') || '';
-                        return label.toLowerCase().includes('microphone') || 
-                               label.toLowerCase().includes('mic');
-                    }});
-                    if (micBtn) {{
-                        const label = micBtn.getAttribute('aria-label') || '';
-                        const isMuted = micBtn.getAttribute('data-is-muted') === 'true' ||
-                                       label.includes('Turn on');
-                        const shouldMute = {str(muted).lower()};
-                        if (isMuted !== shouldMute) {{
-                            micBtn.click();
-                            return true;
-                        }}
-                        return true; // Already in desired state
-                    }}
-                    return false;
-                }})();
-            """)
+                        return btn.getAttribute('data-is-muted') === 'true' ||
+                               label.includes('Turn on') ||
+                               label.toLowerCase().includes('unmute');
+                    };
+
+                    let micBtn = findButton();
+                    if (!micBtn) return false;
+                    if (isMuted(micBtn) === muted) return true;  // Already in desired state
+
+                    micBtn.click();
+                    // Wait (up to 1 s) for Meet to show the new state
+                    const deadline = Date.now() + 1000;
+                    while (Date.now() < deadline) {
+                        micBtn = findButton();
+                        if (micBtn && isMuted(micBtn) === muted) break;
+                        await new Promise(resolve => setTimeout(resolve, 50));
+                    }
+                    return true;
+                }
+            """, {"selectors": selectors, "muted": muted})
             
             return result if result else False
             
@@ -938,7 +1283,119 @@ class MeetBot:
         except:
             return True  # Default to muted on error
 
-    def _record_audio(self) -> np.ndarray:
+    def _next_mic_utterance(self, timeout: float = RECORD_SECONDS,
+                            fallback_seconds: float = RECORD_SECONDS) -> Optional[np.ndarray]:
+        """
+        Wait for the next utterance from the microphone stream.
+
+        Falls back to a fixed-length recording if the stream can't be opened.
+
+        Args:
+            timeout: Seconds to wait for speech
+            fallback_seconds: Recording length for the fixed-window fallback
+
+        Returns:
+            int16 samples, or None if nothing was said within the timeout
+        """
+        if not self.capture.running:
+            try:
+                self.capture.start()
+            except Exception as e:
+                if not hasattr(self, '_capture_warned'):
+                    print(f"⚠️  Streaming capture unavailable ({e}), recording fixed windows")
+                    self._capture_warned = True
+                return self._record_audio(fallback_seconds)
+
+        return self.capture.next_utterance(timeout=timeout)
+
+    def _next_streamed_transcript(self, timeout: float = RECORD_SECONDS,
+                                  stop_early: bool = False) -> Optional[str]:
+        """
+        Transcribe the next utterance while it is being spoken.
+
+        Speech is fed to the local Whisper model every STREAM_CHUNK_SECONDS,
+        so at the end of the utterance only its last words are left to
+        settle. With stop_early (interrupt listening), returns as soon as
+        a stop or thank-you phrase is committed, without waiting for the
+        speaker to pause; the rest of that utterance is skipped.
+
+        Args:
+            timeout: Seconds to wait for speech to start
+            stop_early: Return on a stop/thank-you phrase mid-utterance
+
+        Returns:
+            The transcript, or None if nobody spoke within the timeout
+        """
+        with self._stt_lock:
+            if not self.capture.running:
+                try:
+                    self.capture.start()
+                except Exception as e:
+                    print(f"⚠️  Streaming capture unavailable ({e}), recording fixed windows")
+                    self.online_asr = None
+                    return None
+
+            asr = self.online_asr
+            pending: list[np.ndarray] = []
+            pending_samples = 0
+            started = False
+            checked_echo = stop_early  # Interrupts are heard while the bot speaks
+
+            while True:
+                chunk = self.capture.next_chunk(timeout=0.5 if started else timeout)
+                if chunk is None:
+                    if not started:
+                        return None
+                    if stop_early and self.stop_listening:
+                        # Bot finished speaking mid-utterance
+                        asr.reset()
+                        self._skip_utterance = True
+                        return None
+                    continue
+
+                if self._skip_utterance:
+                    # Remainder of an utterance already answered early
+                    if not len(chunk):
+                        self._skip_utterance = False
+                    continue
+
+                if not len(chunk):
+                    # End of utterance: settle the tail
+                    if pending:
+                        audio = np.concatenate(pending)
+                        if not checked_echo and self._is_echo(audio):
+                            asr.reset()
+                            print("(skipping - echo of bot's own speech)")
+                            return ""
+                        asr.insert_audio_chunk(audio)
+                        asr.process_iter()
+                    return asr.finish()
+
+                started = True
+                pending.append(chunk)
+                pending_samples += len(chunk)
+                if pending_samples < STREAM_CHUNK_SECONDS * SAMPLE_RATE:
+                    continue
+
+                audio = np.concatenate(pending)
+                pending, pending_samples = [], 0
+                if not checked_echo:
+                    # Decide on the first second, before paying for Whisper
+                    checked_echo = True
+                    if self._is_echo(audio):
+                        asr.reset()
+                        self._skip_utterance = True
+                        print("(skipping - echo of bot's own speech)")
+                        return ""
+                asr.insert_audio_chunk(audio)
+                if asr.process_iter() and stop_early:
+                    text = asr.text
+                    if self._detect_interrupt(text):
+                        asr.reset()
+                        self._skip_utterance = True
+                        return text
+
+    def _record_audio(self, duration: float = RECORD_SECONDS) -> np.ndarray:
         """
         Record from microphone.
         
@@ -974,7 +1431,7 @@ class MeetBot:
         
         try:
             audio = sd.rec(
-                int(RECORD_SECONDS * SAMPLE_RATE),
+                int(duration * SAMPLE_RATE),
                 samplerate=SAMPLE_RATE,
                 channels=CHANNELS,
                 dtype='int16',
@@ -982,8 +1439,9 @@ class MeetBot:
             )
             sd.wait()
             
-            # Check if we actually got audio (not just zeros)
-            if np.all(audio == 0):
+            # Check if we actually got audio (not just zeros); any() reads
+            # the buffer once without building a boolean copy of it
+            if not audio.any():
                 if not hasattr(self, '_zero_audio_warned'):
                     print("⚠️  WARNING: Recording returned all zeros - mic might not be working!")
                     print("   Check: System Preferences → Security → Microphone → Terminal permission")
@@ -993,32 +1451,48 @@ class MeetBot:
         except Exception as e:
             print(f"❌ Error recording audio: {e}")
             # Return silent audio to prevent crash
-            return np.zeros((int(RECORD_SECONDS * SAMPLE_RATE), CHANNELS), dtype='int16')
+            return np.zeros((int(duration * SAMPLE_RATE), CHANNELS), dtype='int16')
 
     def _transcribe(self, audio: np.ndarray) -> str:
-        """Transcribe with Whisper."""
+        """Transcribe with Whisper (in-process when faster-whisper is installed)."""
+        if FASTER_WHISPER_AVAILABLE:
+            return transcribe_local(audio)
+
         buffer = io.BytesIO()
         with wave.open(buffer, 'wb') as wf:
             wf.setnchannels(CHANNELS)
             wf.setsampwidth(2)
             wf.setframerate(SAMPLE_RATE)
             wf.writeframes(audio.tobytes())
-        buffer.seek(0)
 
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-            f.write(buffer.read())
-            temp_path = f.name
+        # Uploaded from memory; the name tells the API the format
+        result = self.openai.audio.transcriptions.create(
+            model="whisper-1",
+            file=("audio.wav", buffer.getvalue()),
+            language="en"
+        )
+        return result.text
 
-        try:
-            with open(temp_path, "rb") as audio_file:
-                result = self.openai.audio.transcriptions.create(
-                    model="whisper-1",
-                    file=audio_file,
-                    language="en"
-                )
-            return result.text
-        finally:
-            os.unlink(temp_path)
+    def _is_plausible_speech(self, audio: np.ndarray) -> bool:
+        """
+        Cheap check that audio contains speech before paying for Whisper.
+
+        Counts 30 ms frames whose RMS level and zero-crossing rate are both
+        in the range of voice; needs MIN_SPEECH_SECONDS of them.
+        """
+        frame = SAMPLE_RATE * 30 // 1000
+        samples = audio.reshape(-1)
+        usable = len(samples) - len(samples) % frame
+        if not usable:
+            return False
+
+        frames = samples[:usable].reshape(-1, frame).astype(np.float32)
+        rms = np.sqrt(np.mean(frames * frames, axis=1))
+        zcr = np.mean(np.signbit(frames[:, 1:]) != np.signbit(frames[:, :-1]), axis=1)
+
+        low, high = SPEECH_ZCR_RANGE
+        voiced = (rms > SPEECH_FRAME_RMS) & (zcr > low) & (zcr < high)
+        return int(voiced.sum()) * frame >= MIN_SPEECH_SECONDS * SAMPLE_RATE
 
     def _detect_wake_word(self, text: str) -> tuple:
         """Check for wake word with improved detection."""
@@ -1030,48 +1504,42 @@ class MeetBot:
         text_lower = text_lower.replace("parrot parrot", "parrot")
         text_lower = text_lower.replace("part", "parrot")
 
-        # Check for wake words (more flexible matching)
-        for wake in WAKE_WORDS:
-            # Try exact match first
-            if wake in text_lower:
-                idx = text_lower.find(wake)
-                question = text[idx + len(wake):].strip().lstrip(",.:;!? ")
+        # Try exact match first
+        match = WAKE_PATTERN.search(text_lower)
+        if match:
+            question = text[match.end():].strip().lstrip(",.:;!? ")
+            return True, question if question else text
+
+        # Try fuzzy match (wake word might be split)
+        for pattern in FUZZY_WAKE_PATTERNS:
+            match = pattern.search(text_lower)
+            if match:
+                question = text[match.end():].strip().lstrip(",.:;!? ")
                 return True, question if question else text
 
-            # Try fuzzy match (wake word might be split)
-            wake_parts = wake.split()
-            if len(wake_parts) > 1:
-                # Check if all parts appear in order
-                last_idx = -1
-                all_found = True
-                for part in wake_parts:
-                    idx = text_lower.find(part, last_idx + 1)
-                    if idx == -1:
-                        all_found = False
-                        break
-                    last_idx = idx
-
-                if all_found:
-                    question = text[last_idx + len(wake_parts[-1]):].strip().lstrip(",.:;!? ")
-                    return True, question if question else text
-
         return False, ""
 
     def _detect_stop_phrase(self, text: str) -> bool:
         """Check if text contains a stop phrase."""
-        text_lower = text.lower().strip()
-        for phrase in STOP_PHRASES:
-            if phrase in text_lower:
-                return True
-        return False
+        return STOP_PATTERN.search(text.lower()) is not None
 
     def _detect_thank_you(self, text: str) -> bool:
         """Check if text contains a thank you phrase."""
-        text_lower = text.lower().strip()
-        for phrase in THANK_YOU_PHRASES:
-            if phrase in text_lower:
-                return True
-        return False
+        return THANK_YOU_PATTERN.search(text.lower()) is not None
+
+    def _detect_interrupt(self, text: str) -> Optional[str]:
+        """
+        Check for a stop or thank you phrase in one pass.
+
+        Returns:
+            "stop", "thank_you" (stop wins if both are said) or None
+        """
+        found = None
+        for match in INTERRUPT_PATTERN.finditer(text.lower()):
+            if match.lastgroup == "stop":
+                return "stop"
+            found = match.lastgroup
+        return found
 
     def _get_acknowledgment_response(self) -> str:
         """Get a random friendly acknowledgment response."""
@@ -1081,36 +1549,39 @@ class MeetBot:
         """Background listening (sync) that runs while bot is speaking."""
         while not self.stop_listening and self.is_speaking:
             try:
-                # Record shorter clips for faster interrupt detection
-                audio = sd.rec(
-                    int(INTERRUPT_RECORD_SECONDS * SAMPLE_RATE),
-                    samplerate=SAMPLE_RATE,
-                    channels=CHANNELS,
-                    dtype='int16'
-                )
-                sd.wait()
+                if self.online_asr is not None:
+                    # Short timeout so the loop notices when speaking ends
+                    transcript = self._next_streamed_transcript(timeout=0.5, stop_early=True)
+                    if not transcript:
+                        continue
+                else:
+                    audio = self._next_mic_utterance(
+                        timeout=0.5, fallback_seconds=INTERRUPT_RECORD_SECONDS
+                    )
+                    if audio is None:
+                        continue
 
-                # Check audio level
-                audio_level = np.abs(audio).mean()
-                if audio_level < 50:
-                    continue  # Skip silence
+                    # Check audio level
+                    audio_level = np.abs(audio).mean()
+                    if audio_level < 50 or not self._is_plausible_speech(audio):
+                        continue  # Skip silence and noise
 
-                # Transcribe
-                transcript = self._transcribe(audio)
-                if not transcript.strip():
-                    continue
+                    # Transcribe
+                    transcript = self._transcribe(audio)
+                    if not transcript.strip():
+                        continue
 
                 print(f"\n[Background heard: \"{transcript}\"]")
 
-                # Check for stop phrases
-                if self._detect_stop_phrase(transcript):
+                # Check for stop and thank you phrases
+                command = self._detect_interrupt(transcript)
+                if command == "stop":
                     print("[Stop detected!]")
                     self.should_stop_speaking = True
                     self.interrupt_queue.put(("stop", None))
                     break
 
-                # Check for thank you
-                if self._detect_thank_you(transcript):
+                if command == "thank_you":
                     print("[Thank you detected!]")
                     self.should_stop_speaking = True
                     self.interrupt_queue.put(("thank_you", None))
@@ -1147,49 +1618,31 @@ class MeetBot:
             # Add to conversation history for context
             self.conversation_history.append({"role": "user", "content": question})
 
-            # Check if this is a ripple/impact question
-            ripple_keywords = ["what if", "if we change", "impact of", "affects", "ripple", "downstream"]
-            is_ripple_query = any(kw in question.lower() for kw in ripple_keywords)
-
-            # Check if this is a follow-up question
-            follow_up_keywords = ["what about", "and what", "also", "related to that", "more about"]
-            is_follow_up = any(kw in question.lower() for kw in follow_up_keywords)
+            # Check if this is a ripple/impact or follow-up question
+            question_lower = question.lower()
+            is_ripple_query = RIPPLE_PATTERN.search(question_lower) is not None
+            is_follow_up = FOLLOW_UP_PATTERN.search(question_lower) is not None
 
             # Handle ripple detection queries
+            result = None
             if is_ripple_query and self.graph._decisions:
-                answer = self._handle_ripple_query(question)
+                tokens = iter([self._handle_ripple_query(question)])
             else:
-                # Regular query with context
+                # Regular query with context, streamed so speech starts early
                 if is_follow_up and self.last_query_result:
                     # Add context from last query
-                    context_question = f"Context: {self.last_query_result.answer[:200]}... Question: {question}"
-                    if self.fast_mode:
-                        result = self.query_engine.query_fast(context_question)
-                    else:
-                        result = self.query_engine.query(context_question)
+                    query_question = f"Context: {self.last_query_result.answer[:200]}... Question: {question}"
                 else:
-                    if self.fast_mode:
-                        result = self.query_engine.query_fast(question)
-                    else:
-                        result = self.query_engine.query(question)
-
-                answer = result.answer
-                self.last_query_result = result
-
-                # Extract decision context for potential ripple follow-ups
-                if result.sources:
-                    for source in result.sources:
-                        if source.get('source') == 'decision' or source.get('decision_content'):
-                            self.last_decision_context = source
-                            break
+                    query_question = question
 
-            # Add to history
-            self.conversation_history.append({"role": "assistant", "content": answer})
+                if self.fast_mode:
+                    result = self.query_engine.query_fast(query_question, stream=True)
+                else:
+                    result = self.query_engine.query(query_question, stream=True)
+                tokens = result.answer
 
             llm_time = time.time() - start_time
-            print(f"({llm_time:.2f}s)")
-
-            print(f"\nParrot: {answer}\n")
+            print(f"({llm_time:.2f}s to first token)")
 
             # Start background listening for interrupts
             if allow_interrupts:
@@ -1200,50 +1653,60 @@ class MeetBot:
             print("Speaking into meeting...", end=" ", flush=True)
             tts_start = time.time()
 
-            # Generate TTS audio (returns generator, need to convert to bytes)
-            audio_generator = self.elevenlabs.text_to_speech.convert(
-                text=answer,
-                voice_id=self.voice_id,
-                model_id="eleven_turbo_v2_5",
-                output_format="mp3_44100_128"
-            )
+            # CRITICAL: Unmute mic in Google Meet BEFORE playing audio.
+            # The unmute doesn't depend on the audio, so TTS runs meanwhile.
+            async def unmute() -> bool:
+                print("\nUnmuting bot's mic in Google Meet...")
+                await self._set_mic_muted(False)  # Returns once Meet shows it
+                return await self._check_mic_muted()
 
-            # Convert generator to bytes
-            audio_bytes = b''.join(audio_generator)
+            # Pipeline: LLM tokens -> sentences -> TTS stream -> meeting
+            # output, so the first sentence plays while the rest is still
+            # generated; audio queues up while the mic unmutes
+            loop = asyncio.get_event_loop()
+            sentences: queue.Queue = queue.Queue()
+            audio: queue.Queue = queue.Queue()
+            generating = loop.run_in_executor(None, self._queue_sentences, tokens, sentences)
+            synthesizing = loop.run_in_executor(self._tts_pool, self._synthesize_stream, sentences, audio)
 
-            # Store audio and time for echo detection
-            self.last_spoken_audio = audio_bytes
-            self.last_speak_time = time.time()
-
-            # CRITICAL: Unmute mic in Google Meet BEFORE playing audio
-            print("\nUnmuting bot's mic in Google Meet...")
-            await self._set_mic_muted(False)
-            await asyncio.sleep(0.5)  # Wait for unmute to take effect
+            is_muted = await unmute()
 
             # Verify unmute worked
-            is_muted = await self._check_mic_muted()
             if is_muted:
                 print("WARNING: Bot's mic is still muted! Audio won't be heard in meeting.")
                 print("   -> Manually unmute the bot in Google Meet, then try again")
             else:
                 print("Bot's mic is unmuted")
 
-            # Inject audio into Google Meet (check for interrupts)
-            if not self.should_stop_speaking:
-                audio_duration = await self._inject_audio_to_meeting(audio_bytes)
+            # Play into Google Meet as audio arrives (stops on interrupt)
+            first_audio_at = await self._inject_audio_to_meeting(audio)
+            answer = await generating
+            await synthesizing
 
-                # Wait for audio to finish playing (with buffer)
-                await asyncio.sleep(audio_duration + 0.5)
-            else:
+            # Time for echo detection
+            self.last_speak_time = first_audio_at or time.time()
+
+            print(f"\nParrot: {answer}\n")
+            if self.should_stop_speaking:
                 print("[Speech interrupted]")
 
+            if result is not None:
+                self.last_query_result = replace(result, answer=answer)
+
+                # Extract decision context for potential ripple follow-ups
+                if result.sources:
+                    for source in result.sources:
+                        if source.get('source') == 'decision' or source.get('decision_content'):
+                            self.last_decision_context = source
+                            break
+
+            # Add to history
+            self.conversation_history.append({"role": "assistant", "content": answer})
+
             # Mute mic again after speaking
+            # (the answer's tail is caught by _is_echo, no pause needed)
             print("Muting bot's mic...")
             await self._set_mic_muted(True)
-            await asyncio.sleep(0.3)
-
-            # Wait a bit more before resuming listening (echo prevention)
-            await asyncio.sleep(1.0)
 
             tts_time = time.time() - tts_start
             total_time = time.time() - start_time
@@ -1277,13 +1740,7 @@ class MeetBot:
         question_lower = question.lower()
 
         # Try to find a decision mentioned in the question
-        target_decision = None
-        for dec_id, dec in self.graph._decisions.items():
-            # Check if decision content keywords appear in question
-            dec_keywords = dec.content.lower().split()[:5]
-            if any(kw in question_lower for kw in dec_keywords if len(kw) > 3):
-                target_decision = dec
-                break
+        target_decision = self.graph.find_mentioned_decision(question_lower)
 
         # Fall back to last decision context
         if not target_decision and self.last_decision_context:
@@ -1335,7 +1792,7 @@ class MeetBot:
 
         return " ".join(response_parts)
 
-    async def _inject_audio_to_meeting(self, audio_bytes: bytes) -> float:
+    async def _inject_audio_to_meeting(self, audio: queue.Queue) -> Optional[float]:
         """
         Inject audio into Google Meet meeting via BlackHole.
         
@@ -1344,11 +1801,14 @@ class MeetBot:
         - Built-in Output (you hear it)
         - BlackHole 2ch (Google Meet captures it)
         
+        PCM chunks are written to the persistent output stream as the TTS
+        stage queues them (see _synthesize_stream), ending at None.
+        Returns once playback finishes, or early if should_stop_speaking
+        is set while it plays.
+
         Returns:
-            float: Estimated duration of the audio in seconds
+            Time (time.time()) the first chunk was played, None if no audio
         """
-        estimated_duration = (len(audio_bytes) * 8) / 128000
-        
         print("\n🔊 Playing audio...")
         print("   → Make sure System Output = Multi-Output Device (with BlackHole)")
         print("   → Make sure Bot's Google Meet → Microphone = BlackHole 2ch")
@@ -1358,13 +1818,16 @@ class MeetBot:
             # If Multi-Output Device is set as system output, it will go to:
             # 1. Built-in Output (you hear it)
             # 2. BlackHole 2ch (Google Meet captures it)
-            play(audio_bytes)
+            first_audio_at = await asyncio.get_event_loop().run_in_executor(
+                None, self._play_pcm, audio
+            )
+            duration = len(self.last_spoken_audio or b"") / 2 / TTS_SAMPLE_RATE
             
             print(f"✓ Audio played to system output")
-            print(f"   Duration: ~{estimated_duration:.1f}s")
+            print(f"   Duration: ~{duration:.1f}s")
             print(f"   → Check if others in meeting can hear it")
             
-            return estimated_duration
+            return first_audio_at
             
         except Exception as e:
             print(f"❌ Error playing audio: {e}")
@@ -1381,7 +1844,7 @@ class MeetBot:
             print("     ✅ BlackHole 2ch")
             print("\nSee SETUP_BLACKHOLE.md for detailed instructions.")
             print("="*60 + "\n")
-            return estimated_duration
+            return None
 
     async def _inject_audio_via_cdp(self, audio_bytes: bytes):
         """
@@ -1392,8 +1855,14 @@ class MeetBot:
         in the README.
         """
         try:
-            # Encode audio as base64
-            audio_base64 = base64.b64encode(audio_bytes).decode('utf-8')
+            # Wrap the raw PCM in a WAV header and encode as base64
+            buffer = io.BytesIO()
+            with wave.open(buffer, 'wb') as wf:
+                wf.setnchannels(1)
+                wf.setsampwidth(2)
+                wf.setframerate(TTS_SAMPLE_RATE)
+                wf.writeframes(audio_bytes)
+            audio_base64 = base64.b64encode(buffer.getvalue()).decode('utf-8')
             
             # Try to play audio in the browser context
             # This won't route to the mic automatically, but might work if
@@ -1401,7 +1870,7 @@ class MeetBot:
             result = await self.page.evaluate(f"""
                 (async function() {{
                     try {{
-                        const audio = new Audio('data:audio/mp3;base64,{audio_base64}');
+                        const audio = new Audio('data:audio/wav;base64,{audio_base64}');
                         audio.volume = 1.0;
                         await audio.play();
                         await new Promise(resolve => {{
@@ -1431,5 +1900,11 @@ class MeetBot:
     async def cleanup(self):
         """Clean up."""
         self.is_listening = False
+        self.capture.stop()
         if self.browser:
             await self.browser.close()
+        for pool in (self._audio_pool, self._stt_pool, self._tts_pool):
+            pool.shutdown(wait=False, cancel_futures=True)
+        if self._speaker is not None:
+            self._speaker.close()
+        self._tts_client.close()
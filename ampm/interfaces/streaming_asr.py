@@ -0,0 +1,200 @@
+"""
+Streaming Speech Recognition
+============================
+Incremental transcription with a local Whisper model (faster-whisper).
+
+Audio is fed in ~1 s chunks while the speaker is still talking. Each
+process_iter() re-transcribes the rolling buffer and commits the words
+that two consecutive passes agree on (LocalAgreement-2), so wake words
+and commands are recognized mid-utterance, and when the utterance ends
+only its unconfirmed tail is left to settle.
+
+transcribe() runs the same in-process model over a whole utterance, in
+place of a round trip to the Whisper API.
+"""
+
+import functools
+from typing import Optional
+
+import numpy as np
+
+# Local Whisper inference (optional)
+try:
+    import ctranslate2
+    from faster_whisper import WhisperModel
+    FASTER_WHISPER_AVAILABLE = True
+except ImportError:
+    FASTER_WHISPER_AVAILABLE = False
+
+# (begin seconds, end seconds, word text with its leading space)
+Word = tuple[float, float, str]
+
+
+@functools.lru_cache(maxsize=2)
+def load_whisper_model(model_size: str = "base.en") -> "WhisperModel":
+    """
+    Load a faster-whisper model once per process (int8 weights).
+
+    Runs on CUDA with float16 activations when a GPU is present, otherwise
+    on CPU; the model stays loaded for the life of the process.
+    """
+    if ctranslate2.get_cuda_device_count() > 0:
+        return WhisperModel(model_size, device="cuda", compute_type="int8_float16", num_workers=1)
+    return WhisperModel(model_size, device="cpu", compute_type="int8", num_workers=1)
+
+
+def transcribe(audio: np.ndarray, model_size: str = "base.en", language: str = "en") -> str:
+    """
+    Transcribe a complete utterance with the local model.
+
+    Args:
+        audio: int16 samples (or float32 in [-1, 1]) at 16 kHz
+        model_size: faster-whisper model name
+        language: Transcription language
+
+    Returns:
+        The transcript text
+    """
+    samples = audio.reshape(-1)
+    if samples.dtype == np.int16:
+        samples = np.multiply(samples, np.float32(1 / 32768), dtype=np.float32)
+    segments, _ = load_whisper_model(model_size).transcribe(
+        samples,
+        language=language,
+        beam_size=1,
+        vad_filter=False,
+        condition_on_previous_text=False
+    )
+    return "".join(segment.text for segment in segments).strip()
+
+
+def _normalize(word: str) -> str:
+    """Word text for agreement checks (case and punctuation ignored)."""
+    return word.strip().lower().strip(".,!?;:")
+
+
+class OnlineASRProcessor:
+    """
+    Rolling-buffer transcriber using the LocalAgreement-2 commit policy.
+
+    insert_audio_chunk() appends audio, process_iter() returns newly
+    committed words, and finish() flushes the rest at the end of an
+    utterance. Committed audio is trimmed from the buffer once it grows
+    past trim_seconds, keeping each pass well under Whisper's 30 s window.
+    """
+
+    def __init__(
+        self,
+        sample_rate: int = 16000,
+        model_size: str = "base.en",
+        language: str = "en",
+        trim_seconds: float = 15.0
+    ):
+        """
+        Initialize the processor (the model loads on first use).
+
+        Args:
+            sample_rate: Sample rate of inserted audio (Whisper needs 16 kHz)
+            model_size: faster-whisper model name
+            language: Transcription language
+            trim_seconds: Buffer length that triggers trimming
+        """
+        self.sample_rate = sample_rate
+        self.model_size = model_size
+        self.language = language
+        self.trim_seconds = trim_seconds
+        self.reset()
+
+    def reset(self) -> None:
+        """Start a new utterance."""
+        self._audio = np.zeros(0, dtype=np.float32)
+        self._offset = 0.0  # Seconds trimmed from the front of the buffer
+        self._committed: list[Word] = []
+        self._hypothesis: list[Word] = []  # Previous pass, not yet confirmed
+
+    @property
+    def text(self) -> str:
+        """Committed transcript so far."""
+        return "".join(word for _, _, word in self._committed).strip()
+
+    def insert_audio_chunk(self, samples: np.ndarray) -> None:
+        """Append audio (int16 or float32 in [-1, 1])."""
+        samples = samples.reshape(-1)
+        if samples.dtype == np.int16:
+            # Convert and scale in one pass (no intermediate float array)
+            samples = np.multiply(samples, np.float32(1 / 32768), dtype=np.float32)
+        self._audio = np.concatenate([self._audio, samples])
+
+    def process_iter(self) -> list[Word]:
+        """
+        Transcribe the buffer and commit words two passes agree on.
+
+        Returns:
+            Newly committed words
+        """
+        if not len(self._audio):
+            return []
+
+        last_end = self._committed[-1][1] if self._committed else self._offset
+        new = [word for word in self._transcribe() if word[0] > last_end - 0.1]
+
+        # Drop words that only re-transcribe the end of the committed text
+        for n in range(min(5, len(new), len(self._committed)), 0, -1):
+            tail = [_normalize(word[2]) for word in self._committed[-n:]]
+            if tail == [_normalize(word[2]) for word in new[:n]]:
+                new = new[n:]
+                break
+
+        commit = []
+        for previous, current in zip(self._hypothesis, new):
+            if _normalize(previous[2]) != _normalize(current[2]):
+                break
+            commit.append(current)
+
+        self._committed.extend(commit)
+        self._hypothesis = new[len(commit):]
+        self._trim()
+        return commit
+
+    def finish(self) -> str:
+        """
+        Commit everything left at the end of an utterance and reset.
+
+        Returns:
+            The full utterance transcript
+        """
+        self._committed.extend(self._hypothesis)
+        text = self.text
+        self.reset()
+        return text
+
+    def _transcribe(self) -> list[Word]:
+        """Run Whisper over the buffer; word times are absolute."""
+        segments, _ = load_whisper_model(self.model_size).transcribe(
+            self._audio,
+            language=self.language,
+            initial_prompt=self._prompt(),
+            word_timestamps=True,
+            condition_on_previous_text=False,
+            beam_size=1
+        )
+        return [
+            (self._offset + word.start, self._offset + word.end, word.word)
+            for segment in segments
+            for word in (segment.words or [])
+        ]
+
+    def _prompt(self) -> Optional[str]:
+        """Committed text from audio already trimmed off, as Whisper context."""
+        words = [word for _, end, word in self._committed if end <= self._offset]
+        return "".join(words)[-200:].strip() or None
+
+    def _trim(self) -> None:
+        """Drop committed audio once the buffer is longer than trim_seconds."""
+        if len(self._audio) / self.sample_rate <= self.trim_seconds or not self._committed:
+            return
+
+        cut = self._committed[-1][1] - self._offset
+        if cut > 0:
+            self._audio = self._audio[int(cut * self.sample_rate):]
+            self._offset += cut
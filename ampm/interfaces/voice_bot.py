@@ -3,7 +3,10 @@ Voice Bot Interface
 ===================
 Local voice bot using microphone and speakers.
 
-Flow: Microphone → OpenAI Whisper → Memory Query → ElevenLabs TTS → Speaker
+Flow: Microphone (VAD endpointing) → Whisper → Memory Query → ElevenLabs TTS → Speaker
+
+With faster-whisper installed, speech is transcribed locally while it is
+spoken; otherwise each utterance goes to the OpenAI Whisper API.
 
 Features:
 - Continuous listening without requiring Enter
@@ -13,8 +16,8 @@ Features:
 
 import os
 import io
+import re
 import time
-import tempfile
 import wave
 import threading
 import queue
@@ -25,18 +28,23 @@ import sounddevice as sd
 import numpy as np
 from openai import OpenAI
 from elevenlabs import ElevenLabs
-from elevenlabs.play import play
 
 from ..core.graph import MeetingGraph
 from ..core.query import QueryEngine
 from ..core.embeddings import EmbeddingStore
+from ..core.http import speech_http_client
 from ..ingest.loader import MeetingLoader
+from .audio_capture import UtteranceCapture
+from .streaming_asr import OnlineASRProcessor, FASTER_WHISPER_AVAILABLE, transcribe as transcribe_local
 
 # Configuration
 SAMPLE_RATE = 16000
 CHANNELS = 1
 RECORD_SECONDS = 5
 INTERRUPT_RECORD_SECONDS = 2  # Shorter recordings during speech for faster interrupt detection
+STREAM_CHUNK_SECONDS = 1.0  # Audio fed to the local streaming model per step
+TTS_MODEL = "eleven_flash_v2_5"  # Lowest-latency ElevenLabs model
+TTS_SAMPLE_RATE = 16000  # Spoken answers arrive as raw PCM and play without decoding
 
 # Wake words that activate the bot (all start with "hey par...")
 WAKE_WORDS = ["hey parrot", "hey par rot", "hey par", "hey parrot,", "hey parrot "]
@@ -47,6 +55,25 @@ STOP_PHRASES = ["hey parrot stop", "hey parrot, stop", "hey par stop", "hey parr
 # Thank you phrases (all start with "hey par...")
 THANK_YOU_PHRASES = ["hey parrot thank you", "hey parrot thanks", "hey parrot, thank you", "hey parrot, thanks", "hey par thank you", "hey par thanks"]
 
+
+def _phrase_pattern(phrases: list[str]) -> re.Pattern:
+    """Compile phrases into one alternation (longest first wins at a position)."""
+    return re.compile("|".join(
+        re.escape(phrase) for phrase in sorted(set(phrases), key=len, reverse=True)
+    ))
+
+
+# Each transcript (and streamed partial) is scanned once per phrase kind
+WAKE_PATTERN = _phrase_pattern(WAKE_WORDS)
+STOP_PATTERN = _phrase_pattern(STOP_PHRASES)
+THANK_YOU_PATTERN = _phrase_pattern(THANK_YOU_PHRASES)
+
+# Stop and thank-you together, one named group each, so the interrupt
+# listener classifies a transcript in a single scan
+INTERRUPT_PATTERN = re.compile(
+    f"(?P<stop>{STOP_PATTERN.pattern})|(?P<thank_you>{THANK_YOU_PATTERN.pattern})"
+)
+
 # Friendly acknowledgment responses
 ACKNOWLEDGMENT_RESPONSES = [
     "You're welcome!",
@@ -80,13 +107,17 @@ class VoiceBot:
         """
         self._validate_keys()
 
-        # Initialize API clients
-        self.openai = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        # Initialize API clients (one keep-alive connection pool for both)
+        self._http_client = speech_http_client()
+        self.openai = OpenAI(api_key=os.getenv("OPENAI_API_KEY"), http_client=self._http_client)
 
         # ElevenLabs is optional
         self.elevenlabs = None
         if os.getenv("ELEVENLABS_API_KEY"):
-            self.elevenlabs = ElevenLabs(api_key=os.getenv("ELEVENLABS_API_KEY"))
+            self.elevenlabs = ElevenLabs(
+                api_key=os.getenv("ELEVENLABS_API_KEY"),
+                httpx_client=self._http_client
+            )
 
         # Initialize memory system
         self.graph = MeetingGraph()
@@ -110,6 +141,13 @@ class VoiceBot:
         self.listening_thread = None
         self.stop_listening = False
 
+        # Utterances end at the first pause (VAD); with a local Whisper
+        # model they are also transcribed while being spoken
+        self.online_asr = OnlineASRProcessor(SAMPLE_RATE) if FASTER_WHISPER_AVAILABLE else None
+        self.capture = UtteranceCapture(SAMPLE_RATE, stream_chunks=self.online_asr is not None)
+        self._capture_failed = False
+        self._stt_lock = threading.Lock()  # Main loop and interrupt listener share the stream
+
         # Voice settings
         self.voice_id = os.getenv("ELEVENLABS_VOICE_ID", "21m00Tcm4TlvDq8ikWAM")
 
@@ -143,6 +181,74 @@ class VoiceBot:
         print("Recording complete")
         return audio
 
+    def _listen(self, timeout: float = RECORD_SECONDS) -> Optional[str]:
+        """
+        Transcribe the next utterance from the microphone.
+
+        Waits up to timeout for speech to start; the utterance ends at the
+        speaker's first pause. Falls back to a fixed-length recording if
+        the input stream can't be opened.
+
+        Args:
+            timeout: Seconds to wait for speech to start
+
+        Returns:
+            The transcript, or None if nobody spoke
+        """
+        with self._stt_lock:
+            if not self.capture.running and not self._capture_failed:
+                try:
+                    self.capture.start()
+                except Exception as e:
+                    print(f"Warning: streaming capture unavailable ({e}), recording fixed windows")
+                    self._capture_failed = True
+
+            if self._capture_failed:
+                audio = self._record_audio(timeout)
+                if np.abs(audio).mean() < 50:
+                    return None
+                return self._transcribe(audio)
+
+            if self.online_asr is None:
+                audio = self.capture.next_utterance(timeout=timeout)
+                return self._transcribe(audio) if audio is not None else None
+
+            return self._stream_transcript(timeout)
+
+    def _stream_transcript(self, timeout: float) -> Optional[str]:
+        """
+        Transcribe an utterance with the local model while it is spoken.
+
+        Speech is fed to Whisper every STREAM_CHUNK_SECONDS, so when the
+        speaker stops only the last words are left to settle.
+        """
+        asr = self.online_asr
+        pending: list[np.ndarray] = []
+        pending_samples = 0
+        started = False
+
+        while True:
+            chunk = self.capture.next_chunk(timeout=0.5 if started else timeout)
+            if chunk is None:
+                if not started:
+                    return None
+                continue
+
+            if not len(chunk):
+                # End of utterance: settle the tail
+                if pending:
+                    asr.insert_audio_chunk(np.concatenate(pending))
+                    asr.process_iter()
+                return asr.finish()
+
+            started = True
+            pending.append(chunk)
+            pending_samples += len(chunk)
+            if pending_samples >= STREAM_CHUNK_SECONDS * SAMPLE_RATE:
+                asr.insert_audio_chunk(np.concatenate(pending))
+                pending, pending_samples = [], 0
+                asr.process_iter()
+
     def _audio_to_wav_bytes(self, audio: np.ndarray) -> bytes:
         """Convert numpy audio array to WAV bytes."""
         buffer = io.BytesIO()
@@ -151,60 +257,58 @@ class VoiceBot:
             wf.setsampwidth(2)
             wf.setframerate(SAMPLE_RATE)
             wf.writeframes(audio.tobytes())
-        buffer.seek(0)
-        return buffer.read()
+        return buffer.getvalue()
 
     def _transcribe(self, audio: np.ndarray) -> str:
-        """Transcribe audio using OpenAI Whisper."""
+        """Transcribe audio with Whisper (in-process when faster-whisper is installed)."""
         print("Transcribing...")
 
-        wav_bytes = self._audio_to_wav_bytes(audio)
-
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-            f.write(wav_bytes)
-            temp_path = f.name
+        if FASTER_WHISPER_AVAILABLE:
+            return transcribe_local(audio)
 
-        try:
-            with open(temp_path, "rb") as audio_file:
-                transcript = self.openai.audio.transcriptions.create(
-                    model="whisper-1",
-                    file=audio_file,
-                    language="en"
-                )
-            return transcript.text
-        finally:
-            os.unlink(temp_path)
+        # Uploaded from memory; the name tells the API the format
+        transcript = self.openai.audio.transcriptions.create(
+            model="whisper-1",
+            file=("audio.wav", self._audio_to_wav_bytes(audio)),
+            language="en"
+        )
+        return transcript.text
 
     def _detect_wake_word(self, text: str) -> Tuple[bool, str]:
         """Check if text contains wake word and extract the question."""
         text_lower = text.lower().strip()
 
-        for wake in WAKE_WORDS:
-            if wake in text_lower:
-                idx = text_lower.find(wake)
-                question = text[idx + len(wake):].strip()
-                question = question.lstrip(",.:;!? ")
-                if question:
-                    return True, question
-                return True, text
+        match = WAKE_PATTERN.search(text_lower)
+        if match:
+            question = text[match.end():].strip()
+            question = question.lstrip(",.:;!? ")
+            if question:
+                return True, question
+            return True, text
 
         return False, ""
 
     def _detect_stop_phrase(self, text: str) -> bool:
         """Check if text contains a stop phrase."""
-        text_lower = text.lower().strip()
-        for phrase in STOP_PHRASES:
-            if phrase in text_lower:
-                return True
-        return False
+        return STOP_PATTERN.search(text.lower()) is not None
 
     def _detect_thank_you(self, text: str) -> bool:
         """Check if text contains a thank you phrase."""
-        text_lower = text.lower().strip()
-        for phrase in THANK_YOU_PHRASES:
-            if phrase in text_lower:
-                return True
-        return False
+        return THANK_YOU_PATTERN.search(text.lower()) is not None
+
+    def _detect_interrupt(self, text: str) -> Optional[str]:
+        """
+        Check for a stop or thank you phrase in one pass.
+
+        Returns:
+            "stop", "thank_you" (stop wins if both are said) or None
+        """
+        found = None
+        for match in INTERRUPT_PATTERN.finditer(text.lower()):
+            if match.lastgroup == "stop":
+                return "stop"
+            found = match.lastgroup
+        return found
 
     def _get_acknowledgment_response(self) -> str:
         """Get a random friendly acknowledgment response."""
@@ -214,37 +318,23 @@ class VoiceBot:
         """Background listening thread that runs while bot is speaking."""
         while not self.stop_listening and self.is_speaking:
             try:
-                # Record shorter clips for faster interrupt detection
-                audio = sd.rec(
-                    int(INTERRUPT_RECORD_SECONDS * SAMPLE_RATE),
-                    samplerate=SAMPLE_RATE,
-                    channels=CHANNELS,
-                    dtype='int16'
-                )
-                sd.wait()
-
-                # Check audio level
-                audio_level = np.abs(audio).mean()
-                if audio_level < 50:
-                    continue  # Skip silence
-
-                # Transcribe
-                transcript = self._transcribe(audio)
-                if not transcript.strip():
+                # Short waits so the loop notices when speech ends
+                transcript = self._listen(timeout=INTERRUPT_RECORD_SECONDS)
+                if not transcript or not transcript.strip():
                     continue
 
                 transcript_lower = transcript.lower().strip()
                 print(f"\n[Background heard: \"{transcript}\"]")
 
-                # Check for stop phrases
-                if self._detect_stop_phrase(transcript):
+                # Check for stop and thank you phrases
+                command = self._detect_interrupt(transcript)
+                if command == "stop":
                     print("[Stop detected!]")
                     self.should_stop_speaking = True
                     self.interrupt_queue.put(("stop", None))
                     break
 
-                # Check for thank you
-                if self._detect_thank_you(transcript):
+                if command == "thank_you":
                     print("[Thank you detected!]")
                     self.should_stop_speaking = True
                     self.interrupt_queue.put(("thank_you", None))
@@ -283,7 +373,7 @@ class VoiceBot:
             allow_interrupts: If True, listen for interrupts while speaking
 
         Returns:
-            Audio bytes if available
+            The spoken audio (int16 PCM at TTS_SAMPLE_RATE) if available
         """
         print(f"\nParrot: {text}\n")
         self.is_speaking = True
@@ -307,20 +397,27 @@ class VoiceBot:
                 self.listening_thread = threading.Thread(target=self._background_listen, daemon=True)
                 self.listening_thread.start()
 
-            # Generate and play audio
-            audio = self.elevenlabs.text_to_speech.convert(
-                text=text,
-                voice_id=self.voice_id,
-                model_id="eleven_turbo_v2_5",
-                output_format="mp3_44100_128"
-            )
-
-            # Play audio (note: elevenlabs.play is blocking, so we can't easily interrupt mid-playback)
-            # For true mid-speech interruption, we'd need to use streaming playback
-            if not self.should_stop_speaking:
-                play(audio)
-
-            return audio
+            # Raw PCM is played while it downloads; an interrupt is checked
+            # between chunks and cuts the answer off
+            audio = bytearray()
+            played = 0
+            with sd.RawOutputStream(samplerate=TTS_SAMPLE_RATE, channels=CHANNELS, dtype='int16') as speaker:
+                for chunk in self.elevenlabs.text_to_speech.convert(
+                    text=text,
+                    voice_id=self.voice_id,
+                    model_id=TTS_MODEL,
+                    output_format=f"pcm_{TTS_SAMPLE_RATE}"
+                ):
+                    if self.should_stop_speaking:
+                        speaker.abort()
+                        break
+                    audio += chunk
+                    # Chunks can split an int16 sample; hold the odd byte back
+                    playable = len(audio) - len(audio) % 2
+                    speaker.write(bytes(audio[played:playable]))
+                    played = playable
+
+            return bytes(audio[:played])
 
         except Exception as e:
             print(f"TTS Error: {e}")
@@ -330,6 +427,8 @@ class VoiceBot:
             self.stop_listening = True
             if self.listening_thread:
                 self.listening_thread.join(timeout=1.0)
+            # Drop what the mic picked up of the bot's own voice
+            self.capture.clear()
     
     def text_to_speech(self, text: str) -> Optional[bytes]:
         """Convert text to speech and return audio bytes (no playback)."""
@@ -340,7 +439,7 @@ class VoiceBot:
             audio_generator = self.elevenlabs.text_to_speech.convert(
                 text=text,
                 voice_id=self.voice_id,
-                model_id="eleven_turbo_v2_5",
+                model_id=TTS_MODEL,
                 output_format="mp3_44100_128"
             )
             # Convert generator to bytes
@@ -420,16 +519,13 @@ class VoiceBot:
 
                 print("Listening...", end=" ", flush=True)
 
-                audio = self._record_audio()
+                transcript = self._listen()
 
-                # Skip if audio is too quiet (silence)
-                audio_level = np.abs(audio).mean()
-                if audio_level < 50:
+                # Nobody spoke
+                if transcript is None:
                     print("(silence)")
                     continue
 
-                transcript = self._transcribe(audio)
-
                 if not transcript.strip():
                     print("(no speech)")
                     continue
@@ -468,3 +564,5 @@ class VoiceBot:
 
         except KeyboardInterrupt:
             print("\n\nGoodbye!")
+        finally:
+            self.capture.stop()
@@ -21,6 +21,7 @@ Relationships:
 - Topic --[DISCUSSED_IN]--> Meeting
 """
 
+import functools
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional
@@ -69,6 +70,12 @@ class Person:
         return hash(self.id)
 
 
+@functools.lru_cache(maxsize=4096)
+def person_id_for(name: str) -> str:
+    """Person ID for a display name ("Sarah Chen" -> "sarah_chen"), memoized."""
+    return name.lower().replace(" ", "_")
+
+
 @dataclass
 class Topic:
     """A discussion topic that can span multiple meetings."""
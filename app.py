@@ -283,7 +283,9 @@ def load_or_build_knowledge_graph(data_dir: str = "data/samples", cache_dir: str
 
             if graph.load(str(graph_cache)) and embeddings.load(str(embeddings_cache)):
                 # Create a simple loader wrapper
-                loader = MeetingLoader(graph, embeddings)
+                loader = MeetingLoader(graph, embeddings, cache_dir=cache_dir)
+                # Re-apply live updates logged since the snapshot
+                loader.recover()
                 return loader, True, None
             else:
                 print("Cache load failed, rebuilding...")
@@ -303,7 +305,7 @@ def load_or_build_knowledge_graph(data_dir: str = "data/samples", cache_dir: str
         persist=True
     )
     # Use fast_load=True to skip slow LLM entity extraction
-    loader = MeetingLoader(graph, embeddings, fast_load=True)
+    loader = MeetingLoader(graph, embeddings, fast_load=True, cache_dir=cache_dir)
 
     meetings = loader.load_directory(data_dir)
     if not meetings:
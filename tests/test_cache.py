@@ -0,0 +1,70 @@
+"""Tests for the LRU + TTL query cache."""
+
+from ampm.core import cache as cache_module
+from ampm.core.cache import QueryCache
+
+
+def test_make_key_normalizes_question():
+    assert QueryCache.make_key("  Why Stripe? ", 5) == QueryCache.make_key("why stripe?", 5)
+
+
+def test_make_key_separates_question_and_top_k():
+    assert QueryCache.make_key("q1", 5) != QueryCache.make_key("q", 15)
+    assert QueryCache.make_key("q", 5) != QueryCache.make_key("q", "fast")
+
+
+def test_get_put_and_stats():
+    cache = QueryCache(max_size=4)
+    assert cache.get("a") is None
+
+    cache.put("a", 1)
+    assert cache.get("a") == 1
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_rate"] == 0.5
+    assert stats["size"] == 1
+
+
+def test_evicts_least_recently_used():
+    cache = QueryCache(max_size=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")  # "b" is now the least recently used
+    cache.put("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert len(cache) == 2
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "time", lambda: now[0])
+
+    cache = QueryCache(ttl_seconds=10)
+    cache.put("a", 1)
+
+    now[0] += 10
+    assert cache.get("a") == 1
+
+    now[0] += 1
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_clear_and_invalidate_keep_counters():
+    cache = QueryCache()
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+
+    cache.invalidate("a")
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.stats()["hits"] == 2
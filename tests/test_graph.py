@@ -0,0 +1,93 @@
+"""Tests for saving and loading the meeting graph."""
+
+import json
+from datetime import datetime
+
+from ampm.core.graph import MeetingGraph, _REL_SUPERSEDES, _relation_name
+from ampm.models import ActionItem, ActionStatus, Decision, DecisionStatus, Meeting, Person
+
+
+def _build_graph() -> MeetingGraph:
+    graph = MeetingGraph()
+    graph.add_person(Person(id="sarah_chen", name="Sarah Chen", role="PM"))
+    graph.add_meeting(Meeting(id="mtg_1", title="Payments sync", date=datetime(2024, 3, 1, 10)))
+    graph.add_decision(Decision(
+        id="dec_1", content="Use Stripe for payments", topic="payments",
+        made_by="sarah_chen", meeting_id="mtg_1", timestamp=datetime(2024, 3, 1, 10, 5)
+    ))
+    graph.add_decision(Decision(
+        id="dec_2", content="Use Adyen for payments", topic="payments",
+        meeting_id="mtg_1", status=DecisionStatus.PROPOSED
+    ))
+    graph.add_action_item(ActionItem(
+        id="act_1", task="Integrate Stripe checkout", assigned_to="sarah_chen",
+        meeting_id="mtg_1", decision_id="dec_1", status=ActionStatus.IN_PROGRESS
+    ))
+    graph.add_supersedes("dec_2", "dec_1")
+    return graph
+
+
+def _edges(graph: MeetingGraph) -> set:
+    return {
+        (source, target, _relation_name(data["relation"]))
+        for source, target, data in graph.graph.edges(data=True)
+    }
+
+
+def test_save_load_round_trip(tmp_path):
+    graph = _build_graph()
+    path = str(tmp_path / "graph.json")
+    graph.save(path)
+
+    loaded = MeetingGraph()
+    assert loaded.load(path)
+
+    assert loaded.stats == graph.stats
+    assert _edges(loaded) == _edges(graph)
+
+    decision = loaded.get_decision("dec_1")
+    assert decision.content == "Use Stripe for payments"
+    assert decision.made_by == "sarah_chen"
+    assert decision.timestamp == datetime(2024, 3, 1, 10, 5)
+    assert loaded.get_decision("dec_2").status == DecisionStatus.PROPOSED
+    assert loaded.get_meeting("mtg_1").title == "Payments sync"
+    assert loaded.get_person("sarah_chen").role == "PM"
+
+    action = loaded.get_action_items_by_decision("dec_1")[0]
+    assert action.task == "Integrate Stripe checkout"
+    assert action.status == ActionStatus.IN_PROGRESS
+
+    assert loaded.graph.nodes["dec_1"]["type"] == "decision"
+    assert loaded.graph.edges["dec_2", "dec_1"]["relation"] == _REL_SUPERSEDES
+
+
+def test_load_version_1_0_file(tmp_path):
+    # 1.0 files store node types and edge relations inline as strings
+    path = tmp_path / "graph.json"
+    path.write_text(json.dumps({
+        "version": "1.0",
+        "meetings": {"mtg_1": {"id": "mtg_1", "title": "Kickoff", "date": "2024-03-01T10:00:00"}},
+        "decisions": {"dec_1": {"id": "dec_1", "content": "Ship in May", "meeting_id": "mtg_1"}},
+        "action_items": {},
+        "people": {},
+        "topics": {},
+        "blockers": {},
+        "graph_nodes": [
+            ["mtg_1", {"type": "meeting", "title": "Kickoff"}],
+            ["dec_1", {"type": "decision", "content": "Ship in May"}],
+        ],
+        "graph_edges": [["mtg_1", "dec_1", {"relation": "contains_decision"}]],
+    }))
+
+    graph = MeetingGraph()
+    assert graph.load(str(path))
+
+    assert graph.graph.nodes["dec_1"]["type"] == "decision"
+    assert _edges(graph) == {("mtg_1", "dec_1", "contains_decision")}
+    assert [d.id for d in graph.get_decisions_by_meeting("mtg_1")] == ["dec_1"]
+    assert graph.stats["total_nodes"] == 2
+    assert graph.stats["total_edges"] == 1
+
+
+def test_load_missing_file(tmp_path):
+    assert not MeetingGraph().load(str(tmp_path / "missing.json"))
@@ -0,0 +1,92 @@
+"""Tests for parsing the ripple detector's JSON verdicts."""
+
+import json
+
+from ampm.core.graph import MeetingGraph
+from ampm.core.ripple import RippleDetector
+from ampm.models import ActionItem
+
+
+class _FakeCompletions:
+    def __init__(self, reply):
+        self.reply = reply
+
+    def create(self, **kwargs):
+        if isinstance(self.reply, Exception):
+            raise self.reply
+        message = type("Message", (), {"content": self.reply})()
+        choice = type("Choice", (), {"message": message})()
+        return type("Response", (), {"choices": [choice]})()
+
+
+class _FakeCerebras:
+    def __init__(self, reply):
+        self.chat = type("Chat", (), {"completions": _FakeCompletions(reply)})()
+
+
+ACTIONS = [
+    ActionItem(id="act_1", task="Integrate Stripe checkout"),
+    ActionItem(id="act_2", task="Write onboarding docs"),
+]
+
+
+def _verdicts(reply, **kwargs):
+    detector = RippleDetector(MeetingGraph())
+    detector.cerebras = _FakeCerebras(reply if isinstance(reply, (str, Exception)) else json.dumps(reply))
+    return detector._request_verdicts("prompt", ACTIONS, max_tokens=100, **kwargs)
+
+
+def test_affected_and_unaffected_items():
+    returned = _verdicts({"items": [
+        {"idx": 1, "affected": True, "severity": "HIGH", "reason": "Uses Stripe"},
+        {"idx": 2, "affected": False},
+    ]})
+
+    assert set(returned) == {"act_1", "act_2"}
+    assert returned["act_2"] is None
+    impact = returned["act_1"]
+    assert impact.id == "act_1"
+    assert impact.severity == "high"
+    assert impact.reason == "Uses Stripe"
+
+
+def test_unknown_severity_falls_back_to_medium():
+    returned = _verdicts({"items": [{"idx": 1, "affected": True, "severity": "huge"}]})
+    assert returned["act_1"].severity == "medium"
+
+
+def test_bad_entries_are_skipped():
+    returned = _verdicts({"items": [
+        1,
+        "act_1",
+        {"idx": "x", "affected": True},
+        {"idx": 3, "affected": True},
+        {"affected": True},
+        {"idx": "2", "affected": True},
+    ]})
+
+    assert list(returned) == ["act_2"]
+
+
+def test_items_not_a_list_is_unanswered():
+    assert _verdicts({"items": "none"}) is None
+    assert _verdicts({"items": {"idx": 1}}) is None
+
+
+def test_missing_items_is_empty():
+    assert _verdicts({}) == {}
+
+
+def test_failed_call_or_bad_json_is_unanswered():
+    assert _verdicts(RuntimeError("boom")) is None
+    assert _verdicts("not json") is None
+    assert _verdicts("[1, 2]") is None
+
+
+def test_low_confidence_not_affected_is_left_out():
+    returned = _verdicts({"items": [
+        {"idx": 1, "affected": False, "confidence": 0.5},
+        {"idx": 2, "affected": False, "confidence": 0.9},
+    ]}, min_confidence=0.8)
+
+    assert returned == {"act_2": None}
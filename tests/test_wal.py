@@ -0,0 +1,72 @@
+"""Tests for the write-ahead log and loader recovery."""
+
+import atexit
+
+from ampm.core.embeddings import EmbeddingStore
+from ampm.core.graph import MeetingGraph
+from ampm.ingest.loader import MeetingLoader
+from ampm.ingest.wal import WAL
+
+
+def test_replay_yields_records_in_order(tmp_path):
+    wal = WAL(tmp_path / "logs" / "wal.jsonl")
+    wal.append("decision", {"id": "dec_1", "content": "Use Stripe"})
+    wal.append("note", {"content": "Follow up"})
+
+    assert list(wal.replay()) == [
+        ("decision", {"id": "dec_1", "content": "Use Stripe"}),
+        ("note", {"content": "Follow up"}),
+    ]
+
+
+def test_replay_without_log_is_empty(tmp_path):
+    assert list(WAL(tmp_path / "wal.jsonl").replay()) == []
+
+
+def test_replay_skips_torn_final_line(tmp_path):
+    wal = WAL(tmp_path / "wal.jsonl")
+    wal.append("note", {"content": "kept"})
+    with open(wal.path, "ab") as f:
+        f.write(b'{"op": "note", "data": {"cont')
+
+    assert list(wal.replay()) == [("note", {"content": "kept"})]
+
+
+def test_truncate_drops_all_records(tmp_path):
+    wal = WAL(tmp_path / "wal.jsonl")
+    wal.append("note", {"content": "gone"})
+
+    wal.truncate()
+    assert not wal.path.exists()
+    assert list(wal.replay()) == []
+
+    wal.truncate()  # No log is fine too
+
+
+def _loader(cache_dir) -> MeetingLoader:
+    embeddings = EmbeddingStore(use_backboard=False, config_dir=str(cache_dir), persist=False)
+    loader = MeetingLoader(MeetingGraph(), embeddings, cache_dir=str(cache_dir))
+    loader.save_delay_s = 3600  # Tests flush explicitly
+    return loader
+
+
+def test_recover_replays_logged_updates(tmp_path):
+    cache_dir = tmp_path / "cache"
+
+    # A session that logs updates, then "crashes" before any snapshot
+    crashed = _loader(cache_dir)
+    decision = crashed.add_decision_realtime("Use Stripe for payments", topic="payments")
+    crashed._save_timer.cancel()
+    atexit.unregister(crashed.flush)
+
+    recovered = _loader(cache_dir)
+    assert recovered.recover() == 2  # The live meeting, then the decision
+
+    restored = recovered.graph.get_decision(decision.id)
+    assert restored is not None
+    assert restored.content == "Use Stripe for payments"
+    assert recovered.graph.get_meeting("live_meeting") is not None
+
+    # Replayed state is snapshotted and the log emptied
+    assert (cache_dir / "graph.json").exists()
+    assert list(WAL(cache_dir / "wal.jsonl").replay()) == []